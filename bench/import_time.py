@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+시작 속도(import 시간) 회귀 검사
+python -X importtime으로 post_writer import 비용을 재고,
+미리보기(--dry-run) 경로에서 무거운 의존성이 로드되지 않는지 확인
+
+사용법 (저장소 루트에서):
+    python -m bench.import_time
+    python -m bench.import_time --budget-ms 80 --runs 7
+
+한도를 넘거나 금지된 모듈이 로드되면 종료 코드 1
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# post_writer import만으로는 로드되면 안 되는 모듈
+IMPORT_FORBIDDEN = ('playwright', 'requests', 'faker', 'sqlite3', 'asyncio')
+
+# --dry-run(생성 후 미리보기) 경로에서 로드되면 안 되는 모듈
+DRY_RUN_FORBIDDEN = ('playwright', 'requests', 'asyncio')
+
+DRY_RUN_SNIPPET = """
+import io, sys, contextlib
+import post_writer
+with contextlib.redirect_stdout(io.StringIO()):
+    post_writer.main(['--dry-run'])
+print(','.join(sorted(m for m in sys.modules if '.' not in m)))
+"""
+
+
+def measure_import(module='post_writer'):
+    """-X importtime 출력에서 모듈 누적 import 시간(ms)과 로드된 최상위 모듈 목록 반환"""
+    env = dict(os.environ, OPENAI_API_KEY='')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+    cumulative_us = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|', 2)
+        name = name.strip()
+        loaded.add(name.split('.')[0])
+        if name == module:
+            cumulative_us = int(cumulative.strip())
+
+    if cumulative_us is None:
+        raise RuntimeError(f"{module} import 시간을 찾을 수 없습니다.")
+    return cumulative_us / 1000, loaded
+
+
+def dry_run_modules():
+    """--dry-run 실행 후 로드된 최상위 모듈 목록"""
+    env = dict(os.environ, OPENAI_API_KEY='')
+    result = subprocess.run(
+        [sys.executable, '-c', DRY_RUN_SNIPPET],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.strip().splitlines()[-1].split(','))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='post_writer 시작 속도 회귀 검사')
+    parser.add_argument('--budget-ms', type=float,
+                        default=float(os.getenv('VELOG_IMPORT_BUDGET_MS', 60)),
+                        help='post_writer import 누적 시간 한도 (중앙값, ms)')
+    parser.add_argument('--runs', type=int, default=5, help='측정 반복 횟수')
+    args = parser.parse_args()
+
+    failures = []
+
+    timings = []
+    loaded = set()
+    for _ in range(args.runs):
+        elapsed, loaded = measure_import()
+        timings.append(elapsed)
+    median = statistics.median(timings)
+
+    print(f"⏱️  import post_writer: 중앙값 {median:.1f}ms "
+          f"(최소 {min(timings):.1f}ms, 최대 {max(timings):.1f}ms, 한도 {args.budget_ms:.0f}ms)")
+    if median > args.budget_ms:
+        failures.append(f"import 시간이 한도를 넘었습니다: {median:.1f}ms > {args.budget_ms:.0f}ms")
+
+    heavy = sorted(set(IMPORT_FORBIDDEN) & loaded)
+    if heavy:
+        failures.append(f"import 시점에 무거운 모듈이 로드됨: {', '.join(heavy)}")
+
+    heavy = sorted(set(DRY_RUN_FORBIDDEN) & dry_run_modules())
+    if heavy:
+        failures.append(f"--dry-run 경로에서 로드됨: {', '.join(heavy)}")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+
+    print("✅ 시작 속도 검사 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
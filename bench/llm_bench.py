@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+AI 본문 생성 백엔드별 처리량 벤치마크
+같은 프롬프트 집합을 백엔드 하나로 N번 생성하고 요청/초, 출력 글자/초, 요청별 지연 분포를 출력
+캐시는 사용하지 않음
+
+사용법 (저장소 루트에서):
+    python -m bench.llm_bench -n 50 --model fake --latency 0.2            # 네트워크 없이
+    python -m bench.llm_bench -n 50 --model mock --concurrency 4          # 로컬 대역 서버 (OpenAI 호환)
+    python -m bench.llm_bench -n 20 --model local:qwen2.5-7b-instruct     # llama.cpp / vLLM 서버
+    python -m bench.llm_bench -n 50 --model mock --fresh-connections      # 연결 재사용 효과 비교
+"""
+
+import os
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.content_generator import ContentGenerator
+from utils.llm_backends import FakeBackend, OpenAICompatibleBackend, create_backend
+from utils.tracing import percentile
+
+
+def build_backend(model, base_url, timeout, pool_size, latency, chars_per_second):
+    """(백엔드, 정리 함수) 반환, 'mock'은 대역 서버를 띄우고 OpenAI 호환 백엔드로 연결"""
+    if model == 'mock':
+        from utils.mock_velog import start_in_thread
+
+        server, mock_url = start_in_thread()
+
+        def stop():
+            server.shutdown()
+            server.server_close()
+
+        backend = OpenAICompatibleBackend(model='mock', base_url=f"{mock_url}/v1", api_key='mock',
+                                          pool_size=pool_size or 4)
+        return backend, stop
+    if model.split(':', 1)[0] == 'fake':
+        backend = FakeBackend(model=model.partition(':')[2] or 'fake', latency=latency,
+                              chars_per_second=chars_per_second)
+        return backend, None
+    backend = create_backend(model, base_url=base_url, api_key=os.getenv('OPENAI_API_KEY'),
+                             timeout=timeout, pool_size=pool_size)
+    return backend, None
+
+
+def run_benchmark(backend, count, concurrency, fresh_connections=False):
+    generator = ContentGenerator(backend=backend, use_cache=False, seed=0)
+    prompts = [generator.build_ai_prompt(f"벤치마크 주제 {i}") for i in range(count)]
+
+    def generate_one(prompt):
+        started = time.perf_counter()
+        try:
+            content = generator.request_ai_content(prompt, bypass_cache=True)
+            error = None
+        except Exception as e:
+            content, error = '', str(e)
+        if fresh_connections:
+            # 비교용: 요청마다 연결을 새로 맺음
+            backend.close()
+        return time.perf_counter() - started, len(content), error
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        results = list(executor.map(generate_one, prompts))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _, error in results if error is None)
+    chars = sum(size for _, size, _ in results)
+    errors = [error for _, _, error in results if error is not None]
+    return {
+        'backend': backend.describe(),
+        'count': count,
+        'concurrency': concurrency,
+        'fresh_connections': fresh_connections,
+        'succeeded': len(latencies),
+        'errors': errors[:5],
+        'elapsed': elapsed,
+        'requests_per_second': len(latencies) / elapsed if elapsed else 0.0,
+        'chars_per_second': chars / elapsed if elapsed else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'max': latencies[-1] if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='AI 생성 백엔드 처리량 벤치마크')
+    parser.add_argument('-n', '--count', type=int, default=20, help='생성 횟수')
+    parser.add_argument('--model', default='fake',
+                        help='mock(로컬 대역 서버), fake[:이름], local:<모델>, <openai 모델> (기본값: fake)')
+    parser.add_argument('--base-url', help='OpenAI 호환 서버 주소 (local/openai)')
+    parser.add_argument('--concurrency', type=int, default=1, help='동시 생성 수')
+    parser.add_argument('--timeout', type=float, help='응답 읽기 제한 시간(초)')
+    parser.add_argument('--pool-size', type=int, help='keep-alive 연결 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='fake: 요청당 지연(초)')
+    parser.add_argument('--chars-per-second', type=float, help='fake: 생성 속도(글자/초)')
+    parser.add_argument('--fresh-connections', action='store_true', help='요청마다 연결을 새로 맺음 (비교용)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+    if args.fresh_connections and args.concurrency > 1:
+        parser.error('--fresh-connections는 --concurrency 1에서만 사용할 수 있습니다.')
+
+    backend, stop = build_backend(args.model, args.base_url, args.timeout, args.pool_size,
+                                  args.latency, args.chars_per_second)
+    try:
+        report = run_benchmark(backend, args.count, args.concurrency, args.fresh_connections)
+    finally:
+        backend.close()
+        if stop is not None:
+            stop()
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print("=" * 60)
+    print(f"📊 생성 벤치마크 ({report['backend']})")
+    print("=" * 60)
+    print(f"성공: {report['succeeded']}/{report['count']} (동시 {report['concurrency']}개"
+          f"{', 요청마다 새 연결' if report['fresh_connections'] else ''})")
+    print(f"전체 시간: {report['elapsed']:.2f}s")
+    print(f"처리량: {report['requests_per_second']:.2f} req/s, {report['chars_per_second']:,.0f} chars/s")
+    print(f"지연: p50 {report['p50'] * 1000:.1f}ms, p95 {report['p95'] * 1000:.1f}ms, "
+          f"max {report['max'] * 1000:.1f}ms")
+    for error in report['errors']:
+        print(f"   ❌ {error}")
+
+
+if __name__ == "__main__":
+    main()
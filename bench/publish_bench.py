@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+로컬 Velog 대역 서버를 대상으로 한 엔드투엔드 게시 벤치마크
+네트워크나 실제 계정 없이 N개의 포스트를 게시하고 처리량과 단계별 지연을 출력
+
+사용법 (저장소 루트에서):
+    python -m bench.publish_bench -n 20 --mode queue
+    python -m bench.publish_bench -n 20 --mode async --concurrency 4
+"""
+
+import os
+import json
+import time
+import argparse
+import tempfile
+
+from post_writer import VelogPoster
+from utils.content_generator import ContentGenerator
+from utils.mock_velog import start_in_thread, mock_session_data
+from utils.tracing import tracer, summarize
+
+
+def build_posts(count):
+    generator = ContentGenerator(use_ai=False)
+    return [generator.generate_post() for _ in range(count)]
+
+
+def network_summary(trace_file):
+    """publish 기록의 포스트당 평균 전송량/요청 수/차단 수"""
+    rows = []
+    with open(trace_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            network = record.get('attrs', {}).get('network')
+            if record.get('kind') == 'publish' and network:
+                rows.append(network)
+    if not rows:
+        return None
+    return {
+        key: sum(row[key] for row in rows) / len(rows)
+        for key in ('bytes', 'requests', 'blocked')
+    }
+
+
+def run_benchmark(count, mode, concurrency, delay_ms, headless, block=True):
+    server, base_url = start_in_thread(delay_ms=delay_ms)
+    workdir = tempfile.mkdtemp(prefix='velog-bench-')
+    session_file = os.path.join(workdir, 'session.json')
+    queue_file = os.path.join(workdir, 'queue.jsonl')
+    trace_file = os.path.join(workdir, 'trace.jsonl')
+
+    with open(session_file, 'w', encoding='utf-8') as f:
+        json.dump(mock_session_data(base_url), f)
+
+    posts = build_posts(count)
+    with open(queue_file, 'w', encoding='utf-8') as f:
+        for post_data in posts:
+            f.write(json.dumps(post_data, ensure_ascii=False) + '\n')
+
+    poster = VelogPoster(base_url=base_url, session_file=session_file, headless=headless)
+    if not block:
+        poster.profile.block_resource_types = frozenset()
+        poster.profile.block_domains = ()
+    previous_trace = tracer.path
+    tracer.configure(trace_file)
+
+    started = time.perf_counter()
+    try:
+        if mode == 'single':
+            results = [poster.create_post(post_data) for post_data in posts]
+        elif mode == 'queue':
+            results = poster.publish_queue(queue_file)
+        else:
+            results = [r['success'] for r in poster.publish_many(posts, concurrency=concurrency)]
+    finally:
+        elapsed = time.perf_counter() - started
+        tracer.configure(previous_trace)
+        server.shutdown()
+        server.server_close()
+
+    return {
+        'mode': mode,
+        'count': count,
+        'succeeded': sum(1 for r in results if r),
+        'published_on_server': len(server.state.posts),
+        'elapsed': elapsed,
+        'throughput': count / elapsed if elapsed else 0.0,
+        'stages': summarize(trace_file) if os.path.exists(trace_file) else [],
+        'network': network_summary(trace_file) if os.path.exists(trace_file) else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Velog 게시 벤치마크 (로컬 대역 서버)')
+    parser.add_argument('-n', '--count', type=int, default=10, help='게시할 포스트 수')
+    parser.add_argument('--mode', choices=['single', 'queue', 'async'], default='queue')
+    parser.add_argument('--concurrency', type=int, default=4, help='async 모드 동시 게시 수')
+    parser.add_argument('--delay-ms', type=int, default=0, help='대역 서버 응답 지연 (ms)')
+    parser.add_argument('--headed', action='store_true', help='브라우저 창 표시')
+    parser.add_argument('--no-block', action='store_true', help='리소스 차단 없이 실행 (절감량 비교용)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    report = run_benchmark(args.count, args.mode, args.concurrency, args.delay_ms, not args.headed,
+                           block=not args.no_block)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print("=" * 60)
+    print(f"📊 게시 벤치마크 ({report['mode']})")
+    print("=" * 60)
+    print(f"성공: {report['succeeded']}/{report['count']} (서버 기록 {report['published_on_server']}개)")
+    print(f"전체 시간: {report['elapsed']:.2f}s")
+    print(f"처리량: {report['throughput']:.2f} posts/s")
+    if report['network']:
+        network = report['network']
+        print(f"포스트당 전송량: {network['bytes'] / 1024:.1f}KB "
+              f"(요청 {network['requests']:.1f}개, 차단 {network['blocked']:.1f}개)")
+    print()
+    print(f"{'stage':<22} {'n':>5} {'p50(ms)':>10} {'p95(ms)':>10}")
+    print("-" * 50)
+    for row in report['stages']:
+        print(f"{row['stage']:<22} {row['count']:>5} {row['p50'] * 1000:>10.1f} {row['p95'] * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+유사 중복 인덱스 벤치마크
+템플릿으로 만든 글 N개를 한 트랜잭션으로 기록한 뒤, 새 초안 확인(check) 지연 분포를 출력
+템플릿 글은 서로 비슷해 밴드 충돌이 많으므로 실제 글보다 후보 조회가 무거운 쪽
+
+사용법 (저장소 루트에서):
+    python -m bench.similarity_bench -n 20000
+    python -m bench.similarity_bench -n 20000 --probes 500 --json
+"""
+
+import os
+import json
+import time
+import argparse
+import tempfile
+
+from utils.similarity import SimilarityIndex
+from utils.templates import TemplateEngine
+from utils.tracing import percentile
+
+
+def run_benchmark(count, probes, path):
+    index = SimilarityIndex(path)
+    try:
+        posts = TemplateEngine(seed=0).batch(count)
+        started = time.perf_counter()
+        index.add_many(posts)
+        add_elapsed = time.perf_counter() - started
+
+        latencies = []
+        matched = 0
+        for post in TemplateEngine(seed=1).batch(probes):
+            started = time.perf_counter()
+            matched += index.check(post) is not None
+            latencies.append(time.perf_counter() - started)
+        latencies.sort()
+        return {
+            'count': index.count(),
+            'add_elapsed': add_elapsed,
+            'probes': probes,
+            'matched': matched,
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'max': latencies[-1] if latencies else 0.0,
+        }
+    finally:
+        index.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='유사 중복 인덱스 벤치마크')
+    parser.add_argument('-n', '--count', type=int, default=20000, help='인덱스에 넣을 글 수')
+    parser.add_argument('--probes', type=int, default=200, help='확인할 새 초안 수')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        report = run_benchmark(args.count, args.probes, os.path.join(directory, 'similarity.sqlite3'))
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print("=" * 60)
+    print(f"📊 유사 중복 인덱스 벤치마크 (글 {report['count']:,}개)")
+    print("=" * 60)
+    print(f"기록: {report['add_elapsed']:.2f}s ({report['add_elapsed'] / max(1, report['count']) * 1000:.3f}ms/글)")
+    print(f"확인: p50 {report['p50'] * 1000:.3f}ms, p95 {report['p95'] * 1000:.3f}ms, "
+          f"max {report['max'] * 1000:.3f}ms (비슷한 글 발견 {report['matched']}/{report['probes']})")
+
+
+if __name__ == "__main__":
+    main()
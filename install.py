@@ -8,6 +8,8 @@ import os
 import json
 import time
 from playwright.sync_api import sync_playwright
+from utils.session_manager import SessionManager
+from utils.selector_resolver import SelectorResolver
 
 def setup_browser_context(context):
    """
@@ -85,6 +87,8 @@ def login_to_velog():
        setup_browser_context(context)
        
        page = context.new_page()
+       # 후보 셀렉터를 동시에 기다리고 맞았던 셀렉터를 기억
+       selectors = SelectorResolver()
        
        try:
            # Velog 메인 페이지로 이동
@@ -104,14 +108,11 @@ def login_to_velog():
                ]
                
                login_clicked = False
-               for selector in login_selectors:
-                   try:
-                       page.click(selector, timeout=3000)
-                       login_clicked = True
-                       print("✅ 로그인 버튼을 클릭했습니다.")
-                       break
-                   except:
-                       continue
+               selector, login_button = selectors.resolve(page, 'login_button', login_selectors, timeout=3000)
+               if login_button:
+                   login_button.click()
+                   login_clicked = True
+                   print("✅ 로그인 버튼을 클릭했습니다.")
                
                if not login_clicked:
                    print("⚠️  로그인 버튼을 자동으로 찾지 못했습니다. 수동으로 로그인 버튼을 클릭해주세요.")
@@ -152,14 +153,10 @@ def login_to_velog():
                '[data-testid="profile"]'
            ]
            
-           for selector in profile_selectors:
-               try:
-                   if page.locator(selector).count() > 0:
-                       login_confirmed = True
-                       print(f"✅ 로그인 확인됨 (프로필 요소 발견: {selector})")
-                       break
-               except:
-                   continue
+           selector, _ = selectors.resolve(page, 'profile', profile_selectors, timeout=2000, state='attached')
+           if selector:
+               login_confirmed = True
+               print(f"✅ 로그인 확인됨 (프로필 요소 발견: {selector})")
            
            # 방법 2: 로그인 버튼이 없는지 확인
            if not login_confirmed:
@@ -228,25 +225,17 @@ def login_to_velog():
 def verify_session():
    """
    저장된 세션이 유효한지 확인
+   토큰의 실제 만료 시각을 읽고 Velog에 가벼운 인증 요청을 한 번 보내 확인
    """
    if not os.path.exists('velog_session.json'):
        return False
    
-   try:
-       with open('velog_session.json', 'r', encoding='utf-8') as f:
-           session_data = json.load(f)
-       
-       # 세션 만료 시간 확인 (7일)
-       if time.time() - session_data.get('timestamp', 0) > 7 * 24 * 3600:
-           print("⚠️  세션이 만료되었습니다. (7일 초과)")
-           return False
-       
+   status = SessionManager('velog_session.json', base_url=os.getenv('VELOG_BASE_URL')).check()
+   print(status.describe())
+   if status.valid is None:
+       # 네트워크 문제 등으로 확인하지 못하면 기존 세션을 그대로 사용
        print("✅ 저장된 세션을 발견했습니다.")
-       return True
-       
-   except Exception as e:
-       print(f"❌ 세션 파일 읽기 오류: {e}")
-       return False
+   return status.ok
 
 def main():
    print("📝 Velog 자동 포스팅 초기 설정")
@@ -275,7 +264,7 @@ def main():
        print("   python post_writer.py")
        print()
        print("📌 주의사항:")
-       print("   - 세션은 약 7일간 유효합니다.")
+       print("   - 세션 만료 여부는 python install.py 실행 시 확인할 수 있습니다.")
        print("   - 만료 시 이 스크립트를 다시 실행해주세요.")
    else:
        print("\n❌ 설정에 실패했습니다.")
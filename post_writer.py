@@ -5,15 +5,70 @@ Velog 자동 포스팅 메인 스크립트
 """
 
 import os
+import sys
 import json
 import time
-from playwright.sync_api import sync_playwright
+import argparse
+import threading
+from utils.wait_budget import DEFAULT_BUDGETS
+from utils.tracing import tracer
+from utils import metrics
+from utils.markdown_stream import StreamingContent
 from utils.content_generator import ContentGenerator
+from utils.session_manager import SessionManager
+from utils.browser_profile import BrowserProfile, parse_viewport
+from utils.selector_resolver import SelectorResolver
+from utils.markdown_check import analyze_markdown
+from utils.failure_capture import FailureCapture
+
+DEFAULT_BASE_URL = 'https://velog.io'
+
+# browser: Playwright로 글쓰기 화면 조작, api: GraphQL API로 게시 (실패 시 browser로 대체)
+PUBLISH_MODES = ('browser', 'api')
 
 class VelogPoster:
-    def __init__(self, ai_api_key=None):
-        self.session_file = 'velog_session.json'
-        self.generator = ContentGenerator(use_ai=bool(ai_api_key), ai_api_key=ai_api_key)
+    def __init__(self, ai_api_key=None, wait_budgets=None, linger_seconds=0,
+                 base_url=None, session_file='velog_session.json', headless=None,
+                 mode='browser', local_images=False, debug_browser=False, viewport=None,
+                 failures=None, llm_backend=None):
+        if mode not in PUBLISH_MODES:
+            raise ValueError(f"지원하지 않는 게시 모드입니다: {mode} ({', '.join(PUBLISH_MODES)})")
+        self.mode = mode
+        self.session_file = session_file
+        # 로컬 대역 서버 등으로 바꿀 수 있는 Velog 주소
+        self.base_url = (base_url or os.getenv('VELOG_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+        # 헤드리스 + 불필요한 리소스 차단 프로필 (debug_browser=True면 창을 띄우고 차단하지 않음)
+        self.profile = BrowserProfile.from_env(headless=headless, debug=debug_browser, base_url=self.base_url)
+        if viewport:
+            self.profile.viewport = viewport
+        self.headless = self.profile.headless
+        # 대기 조건별 제한 시간(ms) 덮어쓰기, 예: {'published_url': 20000}
+        self.wait_budgets = wait_budgets
+        # 브라우저 종료 전 결과 확인용 대기 시간(초)
+        self.linger_seconds = linger_seconds
+        # 마지막 게시 결과 (작업 저장소 기록용)
+        self.last_post_url = None
+        # 출간 요청은 보냈지만 결과를 확인하지 못한 경우 True (재시도 전에 게시 여부 확인 필요)
+        self.last_publish_ambiguous = False
+        self._api = None
+        # 본문의 플레이스홀더 이미지를 로컬 렌더링 후 업로드한 주소로 교체
+        self.local_images = local_images
+        self._uploader = None
+        # 동시 수정 스레드가 업로더를 하나만 만들도록
+        self._uploader_lock = threading.Lock()
+        # 세션 파일 파싱과 브라우저 없는 세션 확인 (결과는 잠시 캐시)
+        self.sessions = SessionManager(session_file, base_url=self.base_url)
+        # 후보 셀렉터를 동시에 기다리고 맞았던 셀렉터를 기억
+        self.selectors = SelectorResolver()
+        # 동시 수정 중 수정 페이지(브라우저) 대체 경로는 한 번에 하나씩
+        self._browser_lock = threading.Lock()
+        # 게시 실패 시 스크린샷/DOM/콘솔 로그(/trace)를 저장하는 개수·용량 제한 디렉터리
+        self.failures = failures if failures is not None else FailureCapture.from_env()
+        # 창을 띄운 디버깅 실행에서만 실패 후 엔터 입력을 기다림 (자동 실행은 멈추지 않음)
+        self.pause_on_failure = debug_browser
+        # llm_backend(utils.llm_backends)를 주면 API 키 없이도 그 백엔드로 본문 생성 (로컬 서버, 대역)
+        self.generator = ContentGenerator(use_ai=bool(ai_api_key) or llm_backend is not None,
+                                          ai_api_key=ai_api_key, backend=llm_backend)
         
     def load_session(self):
         """저장된 세션 정보 로드"""
@@ -22,177 +77,833 @@ class VelogPoster:
             return None
             
         try:
-            with open(self.session_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self.sessions.load()
         except Exception as e:
             print(f"❌ 세션 파일 로드 실패: {e}")
             return None
-    
-    def create_post(self, post_data):
-        """Playwright를 사용하여 Velog에 포스트 작성"""
-        session_data = self.load_session()
+
+    def check_session(self):
+        """
+        브라우저를 띄우기 전에 세션 유효성 확인 (만료면 즉시 실패)
+        네트워크 문제로 확인하지 못한 경우는 진행하고 브라우저에서 다시 확인
+        """
+        with tracer.span('session_check') as span:
+            status = self.sessions.check()
+            span.set(valid=status.valid, refreshed=status.refreshed)
+        if not status.ok:
+            metrics.HTTP_LOGIN_CHECK_FAILED.inc()
+            print(status.describe())
+            print("   python install.py로 다시 로그인해주세요.")
+        elif status.refreshed or status.valid is None:
+            print(status.describe())
+        return status
+
+    def create_post(self, post_data, pool=None):
+        """
+        Playwright를 사용하여 Velog에 포스트 작성 (api 모드면 GraphQL API 우선)
+        pool(BrowserPool)을 주면 새 브라우저를 띄우지 않고 미리 띄워둔 브라우저의 새 페이지 사용
+        """
+        with tracer.run('publish', mode='single', publish_mode=self.mode) as run:
+            # 로그아웃 상태면 브라우저를 띄우지 않고 바로 실패
+            self.last_post_url = None
+            self.last_publish_ambiguous = False
+            status = self.check_session()
+            if not status.ok:
+                run.set(outcome='session_invalid')
+                return False
+            if self.mode == 'api' and self.publish_via_api(post_data):
+                return True
+            if self.last_publish_ambiguous:
+                # API 요청이 처리됐을 수 있으므로 브라우저로 다시 게시하지 않음
+                run.set(outcome='ambiguous')
+                return False
+            verified = status.valid is True
+            if pool is not None:
+                success = self._publish_with_pool(pool, post_data, verified=verified)
+            else:
+                success = self._create_post(post_data, verified=verified)
+            run.set(outcome='ok' if success else ('ambiguous' if self.last_publish_ambiguous else 'failed'))
+            return success
+
+    def _engine(self, session_data, concurrency=1, post_timeout=None, path='browser'):
+        """브라우저 게시 단계를 실행하는 async 엔진 (한 건/큐/동시 게시와 수정 페이지 모두 같은 구현 사용)"""
+        from utils.async_poster import AsyncVelogPoster
+
+        return AsyncVelogPoster(
+            session_data,
+            concurrency=concurrency,
+            post_timeout=post_timeout,
+            profile=self.profile,
+            wait_budgets=self.wait_budgets,
+            base_url=self.base_url,
+            failures=self.failures,
+            selectors=self.selectors,
+            prepare=self.prepare_body,
+            on_published=self.record_published,
+            pause=self._pause if self.pause_on_failure else None,
+            path=path
+        )
+
+    def _publish_with_pool(self, pool, post_data, verified=False):
+        """BrowserPool의 이벤트 루프에서 async 엔진으로 한 건 게시하고 결과를 last_post_url 등에 기록"""
+        engine = self._engine(pool.pool.session_data)
+        try:
+            [result] = pool.run(engine.publish_all(pool.pool, [post_data], verified=verified))
+        except Exception as e:
+            print(f"❌ 포스팅 중 오류 발생: {e}")
+            tracer.annotate(error=str(e))
+            return False
+        self.last_post_url = result['url']
+        self.last_publish_ambiguous = result['ambiguous']
+        return result['success']
+
+    def publish_via_api(self, post_data):
+        """브라우저 없이 GraphQL writePost로 게시, 실패하면 False (호출 측에서 browser로 대체)"""
+        if isinstance(post_data['content'], StreamingContent):
+            with tracer.span('stream_wait'):
+                post_data['content'] = post_data['content'].result(DEFAULT_BUDGETS['stream_body'] / 1000)
+        self.prepare_images(post_data)
+        self.check_markdown(post_data)
+
+        from utils.graphql_publisher import GraphQLPublisher, SessionExpiredError, PublishUnconfirmedError
+
+        with tracer.span('api_publish') as span:
+            if self._api is None:
+                session_data = self.load_session()
+                if not session_data:
+                    return False
+                self._api = GraphQLPublisher(session_data, base_url=self.base_url)
+
+            try:
+                url = self._api.write_post(post_data)
+            except SessionExpiredError as e:
+                print(f"❌ 인증 토큰이 만료되었습니다: {e}")
+                print("   python install.py로 다시 로그인해주세요. 브라우저 방식으로 재시도합니다...")
+                span.set(error='session_expired')
+                metrics.API_PUBLISHES['session_expired'].inc()
+                return False
+            except Exception as e:
+                from requests import Timeout
+
+                if isinstance(e, (Timeout, PublishUnconfirmedError)):
+                    # 요청이 서버에서 처리됐을 수 있으므로 브라우저로 다시 게시하지 않음
+                    print(f"⚠️  API 게시 결과를 확인하지 못해 게시 여부를 알 수 없습니다: {e}")
+                    self.last_publish_ambiguous = True
+                    metrics.API_PUBLISHES['ambiguous'].inc()
+                else:
+                    print(f"⚠️  API 게시 실패, 브라우저 방식으로 재시도합니다: {e}")
+                    metrics.API_PUBLISHES['failed'].inc()
+                span.set(error=str(e))
+                return False
+
+        self.last_post_url = url
+        print(f"✅ 포스트가 API로 게시되었습니다: {url}")
+        tracer.annotate(post_url=url, publish_path='api')
+        metrics.API_PUBLISHES['ok'].inc()
+        self.record_published(post_data, url)
+        return True
+
+    def record_published(self, post_data, url):
+        """게시된 글을 유사 중복 인덱스에 기록 (인덱스를 쓰지 않으면 무시)"""
+        index = self.generator.similarity
+        if index is None or not isinstance(post_data['content'], str):
+            return
+        try:
+            index.add(post_data, state='published', url=url)
+        except Exception as e:
+            print(f"⚠️  유사 중복 인덱스 기록 실패: {e}")
+
+    def prepare_images(self, post_data):
+        """
+        local_images가 켜져 있으면 본문 이미지를 로컬 렌더링·업로드 후 주소 교체
+        업로드에 실패하면 원래 본문 그대로 게시
+        """
+        if not self.local_images or not isinstance(post_data['content'], str):
+            return
+
+        from utils.image_upload import ImageUploader, localize_images
+
+        try:
+            if self._uploader is None:
+                with self._uploader_lock:
+                    if self._uploader is None:
+                        session_data = self.load_session()
+                        if not session_data:
+                            return
+                        self._uploader = ImageUploader(session_data, base_url=self.base_url)
+            counts = {}
+            post_data['content'] = localize_images(post_data['content'], self._uploader, counts=counts)
+            uploaded, reused = counts.get('uploaded', 0), counts.get('reused', 0)
+            if uploaded or reused:
+                print(f"🖼️  이미지 업로드 {uploaded}개, 재사용 {reused}개")
+        except Exception as e:
+            print(f"⚠️  이미지 처리 실패, 원래 이미지 주소로 게시합니다: {e}")
+            tracer.annotate(image_error=str(e))
+
+    def check_markdown(self, post_data, verbose=True):
+        """
+        게시 전에 본문을 한 번 훑어 코드 펜스/제목/이미지 링크 검사와 공백 정리
+        고칠 수 있는 문제(닫히지 않은 코드 블록 등)는 고친 본문으로 교체하고 점검 결과 반환
+        """
+        with tracer.span('markdown_check') as span:
+            report = analyze_markdown(post_data['content'])
+            span.set(chars=report.stats['chars'], chunks=len(report.chunks), issues=len(report.issues))
+        post_data['content'] = report.text
+        if verbose:
+            for issue in report.issues:
+                print(f"   {issue}")
+        return report
+
+    def prepare_body(self, post_data):
+        """확정된 본문의 이미지 교체와 마크다운 점검 (브라우저 엔진이 본문 입력 직전에 호출), 점검 결과 반환"""
+        self.prepare_images(post_data)
+        return self.check_markdown(post_data)
+
+    def _create_post(self, post_data, verified=False):
+        with tracer.span('session_load'):
+            session_data = self.load_session()
         if not session_data:
             return False
             
         print("🚀 Velog 자동 포스팅을 시작합니다...")
         
-        with sync_playwright() as p:
+        from utils.browser_pool import BrowserPool
+
+        pool = BrowserPool(session_data, profile=self.profile)
+        try:
             # 브라우저 시작
-            browser = p.chromium.launch(headless=False)  # 디버깅을 위해 헤드리스 모드 비활성화
-            context = browser.new_context(
-                user_agent=session_data.get('user_agent', '')
-            )
-            
-            # 쿠키 복원
-            if 'cookies' in session_data:
-                context.add_cookies(session_data['cookies'])
-            
-            page = context.new_page()
-            
-            try:
-                # Velog 메인 페이지로 이동
-                print("📄 Velog에 접속 중...")
-                page.goto("https://velog.io", timeout=30000)
-                
-                # 로그인 상태 확인
-                try:
-                    page.wait_for_selector('a[href*="/@"]', timeout=5000)
-                    print("✅ 로그인 상태 확인됨")
-                except:
-                    print("❌ 로그인이 필요합니다. python install.py를 다시 실행해주세요.")
-                    return False
-                
-                # 글쓰기 페이지로 이동
-                print("✏️  글쓰기 페이지로 이동...")
-                page.goto("https://velog.io/write", timeout=30000)
-                
-                # 페이지 로딩 대기
-                time.sleep(2)
-                
-                # 제목 입력
-                print(f"📝 제목 입력: {post_data['title']}")
-                title_input = page.wait_for_selector('textarea[placeholder*="제목"]', timeout=10000)
-                title_input.fill(post_data['title'])
-                
-                # 본문 입력
-                print("📄 본문 입력 중...")
-                # Velog의 에디터는 CodeMirror를 사용하므로 적절한 셀렉터 찾기
-                try:
-                    # 다양한 에디터 셀렉터 시도
-                    editor_selectors = [
-                        '.ProseMirror',
-                        'div[contenteditable="true"]',
-                        '.CodeMirror-code',
-                        'textarea'
-                    ]
-                    
-                    editor = None
-                    for selector in editor_selectors:
-                        try:
-                            editor = page.wait_for_selector(selector, timeout=3000)
-                            if editor:
-                                break
-                        except:
-                            continue
-                    
-                    if editor:
-                        editor.click()
-                        time.sleep(1)
-                        # fill 대신 type 사용
-                        editor.type(post_data['content'], delay=5)
-                        print("✅ 본문 입력 완료")
-                    else:
-                        print("⚠️  에디터를 찾을 수 없어 키보드 입력 시도...")
-                        page.keyboard.type(post_data['content'], delay=5)
-                        
-                except Exception as e:
-                    print(f"⚠️  본문 입력 중 오류: {e}")
-                
-                # 태그 입력
-                print(f"🏷️  태그 입력: {', '.join(post_data['tags'])}")
-                try:
-                    # 태그 입력 필드 찾기
-                    tag_input = page.wait_for_selector('input[placeholder*="태그"]', timeout=5000)
-                    for tag in post_data['tags']:
-                        tag_input.fill(tag)
-                        page.keyboard.press('Enter')
-                        time.sleep(0.5)
-                    print("✅ 태그 입력 완료")
-                except Exception as e:
-                    print(f"⚠️  태그 입력 실패: {e}")
-                
-                # 출간하기 버튼 클릭 (1차)
-                publish_button = page.wait_for_selector('button:has-text("출간하기")', timeout=5000)
-                publish_button.click()
-                time.sleep(1)
-
-                # 최종 출간하기 버튼 클릭 전 오버레이가 사라질 때까지 대기
-                try:
-                    page.wait_for_selector('.sc-bilyIR', state='detached', timeout=10000)
-                except:
-                    pass
-
-                # 최종 출간하기 버튼 찾기 (정확한 셀렉터)
-                final_publish_button = page.wait_for_selector('button[data-testid="publish"]', timeout=5000)
-
-                # 버튼 활성화 및 가시성 체크 후 클릭
-                if final_publish_button.is_enabled() and final_publish_button.is_visible():
-                    final_publish_button.scroll_into_view_if_needed()
-                    final_publish_button.click()
-                    time.sleep(3)
-                else:
-                    print("❌ 최종 출간하기 버튼이 비활성화 상태이거나 보이지 않습니다.")
-                    input("브라우저에서 직접 확인 후 엔터를 누르세요...")
-                    return False
+            with tracer.span('browser_launch'):
+                pool.start()
+            # HTTP로 이미 확인한 세션이면 메인 페이지 로그인 확인 생략
+            return self._publish_with_pool(pool, post_data, verified=verified)
+        except Exception as e:
+            print(f"❌ 포스팅 중 오류 발생: {e}")
+            tracer.annotate(error=str(e))
+            return False
+        finally:
+            # 브라우저 종료 전 잠시 대기 (결과 확인용, 기본값 0)
+            if self.linger_seconds:
+                time.sleep(self.linger_seconds)
+            with tracer.span('browser_close'):
+                pool.close()
 
-                # 에러 메시지 확인
-                error_message = None
-                try:
-                    error_message = page.wait_for_selector('div:has-text("제목 또는 내용이 비어있습니다")', timeout=2000)
-                except:
-                    pass
+    def _pause(self, message):
+        """디버깅 실행(--debug-browser, 터미널)에서만 브라우저를 닫기 전에 대기"""
+        if self.pause_on_failure and sys.stdin.isatty():
+            input(message)
 
-                if error_message:
-                    print("❌ [에러] 제목 또는 내용이 비어있습니다. 실제로 포스팅이 되지 않았습니다.")
-                    input("디버깅을 위해 브라우저를 종료하려면 엔터를 누르세요...")
-                    return False
+    def find_published(self, post_data):
+        """같은 제목(url_slug)의 글이 이미 게시됐는지 API로 확인, 게시됐으면 URL"""
+        from utils.graphql_publisher import GraphQLPublisher
 
-                # 성공적으로 게시된 경우, URL이 /@username/ 으로 이동하는지 확인
-                if "/@" in page.url:
-                    print("✅ 포스트가 성공적으로 게시되었습니다!")
-                else:
-                    print("❌ 포스트가 정상적으로 게시되지 않았습니다. 브라우저에서 직접 확인하세요.")
-                    input("디버깅을 위해 브라우저를 종료하려면 엔터를 누르세요...")
-                    return False
+        if self._api is None:
+            session_data = self.load_session()
+            if not session_data:
+                raise RuntimeError("세션 파일이 없습니다.")
+            self._api = GraphQLPublisher(session_data, base_url=self.base_url)
+        return self._api.find_post(post_data)
 
-                return True
-                
+    def sync_mirror(self, mirror, concurrency=8, full=False):
+        """
+        게시한 글을 로컬 미러로 가져옴 (바뀐 글만), 결과 통계 반환
+        가져온 글은 유사 중복 인덱스에도 게시된 글로 기록
+        """
+        from utils.graphql_publisher import GraphQLPublisher
+        from utils.mirror import MirrorSync
+
+        session_data = self.load_session()
+        if not session_data:
+            return None
+        publisher = GraphQLPublisher(session_data, base_url=self.base_url, pool_size=concurrency)
+        try:
+            with tracer.run('mirror_sync', full=full) as run:
+                stats = MirrorSync(publisher, mirror, concurrency=concurrency).sync(
+                    full=full,
+                    on_post=lambda post, url: self.record_published(
+                        {'title': post['title'], 'content': post.get('body') or ''}, url
+                    )
+                )
+                run.set(**stats)
+        finally:
+            publisher.close()
+        return stats
+
+    def update_posts(self, items, concurrency=4):
+        """
+        이미 게시된 글을 바뀐 필드만 수정 (새 글을 만들지 않으므로 주소와 댓글 유지)
+        items: [(글 주소 또는 id, post_data), ...], post_data에 없는 필드는 그대로 둠
+        """
+        from utils.graphql_publisher import GraphQLPublisher
+        from utils.post_update import PostUpdater
+
+        if not self.check_session().ok:
+            return []
+        session_data = self.load_session()
+        if not session_data:
+            return []
+
+        publisher = GraphQLPublisher(session_data, base_url=self.base_url, pool_size=concurrency)
+        updater = PostUpdater(
+            publisher,
+            prepare=self.prepare_images if self.local_images else None,
+            fallback=self._edit_via_browser
+        )
+        try:
+            with tracer.run('update', count=len(items)) as run:
+                results = updater.update_many(items, concurrency=concurrency)
+                counts = {status: sum(1 for r in results if r['status'] == status)
+                          for status in ('updated', 'unchanged', 'failed')}
+                run.set(**counts)
+        finally:
+            publisher.close()
+
+        for r in results:
+            if r['status'] == 'updated':
+                print(f"   ✏️  {r['url']} ({', '.join(r['changed'])})")
+                if r['unapplied']:
+                    print(f"      ⚠️  적용하지 못한 필드: {', '.join(r['unapplied'])}")
+            elif r['status'] == 'unchanged':
+                print(f"   ⏭️  {r['url']} (변경 없음)")
+            else:
+                print(f"   ❌ {r['ref']}: {r['error']}")
+        print(f"📊 수정 결과: 수정 {counts['updated']}개, 변경 없음 {counts['unchanged']}개, 실패 {counts['failed']}개")
+        return results
+
+    def _edit_via_browser(self, published, changes):
+        """
+        수정 페이지(/write?id=...)에서 바뀐 필드만 고쳐 다시 출간
+        (글 주소 또는 None, 적용하지 못한 필드 목록) 반환 - 시리즈는 수정 페이지에서 바꾸지 않음
+        """
+        unapplied = [field for field in ('series',) if field in changes]
+        changes = {field: value for field, value in changes.items() if field not in unapplied}
+        if unapplied:
+            print(f"⚠️  수정 페이지에서는 바꾸지 않는 필드: {', '.join(unapplied)}")
+        if not changes:
+            return None, unapplied
+        session_data = self.load_session()
+        if not session_data:
+            return None, unapplied
+
+        from utils.browser_pool import BrowserPool
+
+        with self._browser_lock, BrowserPool(session_data, profile=self.profile) as pool:
+            url = pool.run(self._engine(session_data).edit_post(pool.pool, published, changes))
+        return url, unapplied
+
+    def publish_job(self, store, job, pool=None):
+        """
+        작업 저장소에서 가져온 작업 하나를 게시하고 결과 기록
+        결과가 애매했던 작업은 다시 게시하기 전에 이미 올라갔는지 먼저 확인
+        """
+        post_data = job['post']
+        print(f"\n📮 [작업 {job['id']}] {post_data['title']} (시도 {job['attempts']})")
+        if job['attempts'] > 1:
+            metrics.PUBLISH_RETRIES.inc()
+
+        if job['needs_check']:
+            try:
+                url = self.find_published(post_data)
             except Exception as e:
-                print(f"❌ 포스팅 중 오류 발생: {e}")
+                print(f"⚠️  게시 여부를 확인하지 못해 다음에 다시 시도합니다: {e}")
+                store.mark_failed(job['id'], f"게시 여부 확인 실패: {e}", ambiguous=True)
                 return False
-            finally:
-                # 브라우저 종료 전 잠시 대기 (결과 확인용)
-                time.sleep(3)
-                browser.close()
+            if url:
+                print(f"✅ 이미 게시된 글입니다: {url}")
+                store.mark_published(job['id'], url)
+                return True
+
+        success = self.create_post(dict(post_data), pool=pool)
+        if success:
+            store.mark_published(job['id'], self.last_post_url)
+        else:
+            store.mark_failed(job['id'], '게시 실패', ambiguous=self.last_publish_ambiguous)
+        return success
+
+    def run_jobs(self, store, limit=None):
+        """게시할 수 있는 작업을 차례로 가져와 게시, 작업별 성공 여부 목록 반환"""
+        results = []
+        while limit is None or len(results) < limit:
+            job = store.claim()
+            if job is None:
+                break
+            results.append(self.publish_job(store, job))
+        return results
+
+    def publish_queue(self, queue_file):
+        """
+        큐 파일(JSONL)의 포스트를 하나의 브라우저로 연속 게시
+        브라우저와 인증 컨텍스트는 한 번만 띄우고 포스트마다 새 페이지만 사용
+        """
+        session_data = self.load_session()
+        if not session_data:
+            return []
+        status = self.check_session()
+        if not status.ok:
+            return []
+
+        posts = load_queue(queue_file)
+        if not posts:
+            print("⚠️  큐에 게시할 포스트가 없습니다.")
+            return []
+
+        print(f"🚀 큐 게시를 시작합니다... ({len(posts)}개)")
+        results = [None] * len(posts)
+
+        # api 모드: API로 먼저 게시하고 실패한 포스트만 브라우저로 처리
+        if self.mode == 'api':
+            for index, post_data in enumerate(posts):
+                self.last_post_url = None
+                self.last_publish_ambiguous = False
+                with tracer.run('publish', mode='queue', publish_mode='api', index=index + 1) as run:
+                    if self.publish_via_api(post_data):
+                        results[index] = True
+                    elif self.last_publish_ambiguous:
+                        # 이미 게시됐을 수 있으므로 브라우저로 다시 게시하지 않고 실패(확인 필요)로 기록
+                        print(f"⚠️  [{index + 1}] {post_data['title']}: 게시 여부를 확인한 뒤 다시 게시하세요.")
+                        results[index] = False
+                        run.set(outcome='ambiguous')
+            if None not in results:
+                print(f"\n📊 큐 게시 결과: 성공 {sum(results)}개 / 전체 {len(results)}개")
+                return results
+
+        from utils.browser_pool import BrowserPool
+
+        # API로 게시하지 못한 포스트만 브라우저로 (하나씩 차례로)
+        pending = [index for index, result in enumerate(results) if result is None]
+        # 토큰이 갱신됐을 수 있으므로 최신 세션으로 브라우저 준비
+        session_data = self.load_session()
+        with BrowserPool(session_data, profile=self.profile) as pool:
+            # 로그인 확인은 배치당 한 번만 (HTTP로 확인된 세션이면 생략)
+            batch = pool.run(self._engine(session_data).publish_all(
+                pool.pool, [posts[index] for index in pending], verified=status.valid is True
+            ))
+            for index, result in zip(pending, batch):
+                results[index] = result['success']
+
+            if pool.restarts:
+                print(f"♻️  브라우저 재시작 횟수: {pool.restarts}")
+
+        print(f"\n📊 큐 게시 결과: 성공 {sum(results)}개 / 전체 {len(results)}개")
+        return results
+
+    def publish_many(self, posts, concurrency=3, post_timeout=120):
+        """
+        여러 포스트를 하나의 브라우저에서 동시에 게시 (api 모드면 API로 먼저 게시)
+        입력 순서대로 결과 dict 목록 반환
+        """
+        from utils.async_poster import publish_result
+
+        status = self.check_session()
+        if not status.ok:
+            return []
+        session_data = self.load_session()
+        if not session_data:
+            return []
+
+        results = [None] * len(posts)
+        if self.mode == 'api':
+            for index, post_data in enumerate(posts):
+                started = time.perf_counter()
+                self.last_post_url = None
+                self.last_publish_ambiguous = False
+                with tracer.run('publish', mode='async', publish_mode='api', index=index):
+                    if self.publish_via_api(post_data):
+                        results[index] = publish_result(index, post_data, self.last_post_url,
+                                                        elapsed=time.perf_counter() - started)
+                    elif self.last_publish_ambiguous:
+                        # 이미 게시됐을 수 있으므로 브라우저로 다시 게시하지 않음
+                        results[index] = publish_result(index, post_data, None, '게시 여부 확인 필요',
+                                                        ambiguous=True, elapsed=time.perf_counter() - started)
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        if pending:
+            from utils.browser_pool import BrowserPool
+
+            print(f"🚀 동시 게시를 시작합니다... ({len(pending)}개, 동시 {concurrency}개)")
+            engine = self._engine(session_data, concurrency=concurrency, post_timeout=post_timeout, path='async')
+            with BrowserPool(session_data, profile=self.profile) as pool:
+                batch = pool.run(engine.publish_all(
+                    pool.pool, [posts[index] for index in pending], verified=status.valid is True
+                ))
+            for index, result in zip(pending, batch):
+                result['index'] = index
+                results[index] = result
+
+        succeeded = sum(1 for r in results if r['success'])
+        print(f"\n📊 동시 게시 결과: 성공 {succeeded}개 / 전체 {len(results)}개")
+        for r in results:
+            if not r['success']:
+                print(f"   ❌ [{r['index'] + 1}] {r['title']}: {r['error']}")
+        return results
+
+def load_queue(queue_file):
+    """generate_post 형식의 dict가 한 줄씩 저장된 JSONL 큐 파일 로드"""
+    posts = []
+    try:
+        with open(queue_file, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    posts.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    print(f"⚠️  큐 파일 {line_no}번째 줄 파싱 실패: {e}")
+    except Exception as e:
+        print(f"❌ 큐 파일 로드 실패: {e}")
+    return posts
+
+def preview_post(post_data):
+    """생성된 포스트 미리보기 출력"""
+    print("=" * 50)
+    print("📝 생성된 포스트 미리보기")
+    print("=" * 50)
+    print(f"제목: {post_data['title']}")
+    print(f"시리즈: {post_data['series']}")
+    print(f"태그: {', '.join(post_data['tags'])}")
+    report = analyze_markdown(post_data['content'])
+    print(report.summary())
+    for issue in report.issues:
+        print(f"   {issue}")
+    print("\n본문:")
+    print(report.text)
+    print("=" * 50)
+
+def prepare_queue(generator, queue_file, count, topics_file=None, concurrency=4):
+    """포스트를 동시에 생성해 JSONL 큐 파일에 추가하고 항목별 결과 출력"""
+    if topics_file:
+        with open(topics_file, 'r', encoding='utf-8') as f:
+            topics = [line.strip() for line in f if line.strip()]
+    else:
+        topics = [None] * count
+
+    print(f"📝 포스트 {len(topics)}개 생성 중... (동시 {concurrency}개)")
+    results = generator.generate_posts(topics, concurrency=concurrency)
+
+    written = 0
+    with open(queue_file, 'a', encoding='utf-8') as f:
+        for index, result in enumerate(results, 1):
+            if result['post'] is None:
+                print(f"   ❌ [{index}] {result['topic'] or '(무작위 주제)'}: {result['error']}")
+                continue
+            f.write(json.dumps(result['post'], ensure_ascii=False) + '\n')
+            written += 1
+            print(f"   ✅ [{index}] {result['post']['title']}")
+
+    print(f"📦 {written}/{len(results)}개를 {queue_file}에 저장했습니다.")
+    return results
+
+def enqueue_jobs(generator, store, count, topics_file=None, concurrency=4):
+    """포스트를 동시에 생성해 작업 저장소에 저장 (같은 초안은 한 번만)"""
+    if topics_file:
+        with open(topics_file, 'r', encoding='utf-8') as f:
+            topics = [line.strip() for line in f if line.strip()]
+    else:
+        topics = [None] * count
+
+    print(f"📝 포스트 {len(topics)}개 생성 중... (동시 {concurrency}개)")
+    results = generator.generate_posts(topics, concurrency=concurrency)
+
+    added = 0
+    for index, result in enumerate(results, 1):
+        if result['post'] is None:
+            print(f"   ❌ [{index}] {result['topic'] or '(무작위 주제)'}: {result['error']}")
+            continue
+        job_id, created = store.add(result['post'], topic=result['topic'])
+        added += created
+        mark = '✅' if created else '♻️ '
+        print(f"   {mark} [작업 {job_id}] {result['post']['title']}")
+
+    print(f"📦 {added}/{len(results)}개를 작업 저장소({store.path})에 추가했습니다.")
+    return results
+
+
+def publish_as_job(poster, path, post_data, topic=None):
+    """
+    생성 결과를 작업 저장소에 먼저 기록한 뒤 게시 (실패해도 --run-jobs로 같은 내용 재시도)
+    같은 초안이 실패로 남아 있으면 다시 대기열에 넣어 이어서 게시
+    이미 게시됐거나 게시 중인 초안이면 None 반환
+    """
+    from utils.job_store import JobStore
+
+    store = JobStore(path)
+    try:
+        job_id, created = store.add(post_data, topic=topic)
+        job = store.claim(job_id=job_id)
+        if job is None and store.requeue(job_id):
+            print(f"🔁 실패했던 작업 {job_id}번을 다시 게시합니다.")
+            job = store.claim(job_id=job_id)
+        if job is None:
+            print(f"⚠️  같은 초안이 이미 작업 {job_id}번으로 처리되었습니다: {store.get(job_id)['state']}")
+            return None
+        return poster.publish_job(store, job)
+    finally:
+        store.close()
+
+
+def print_job_counts(store):
+    counts = store.counts()
+    print("📊 작업 상태: " + ", ".join(f"{state} {count}" for state, count in counts.items()))
+
+def print_mirror_matches(mirror, query):
+    """'tag:Python series:회고 성능' 형식의 검색어로 미러 검색 결과 출력"""
+    conditions = {'title': []}
+    for word in query.split():
+        field, sep, value = word.partition(':')
+        if sep and field in ('tag', 'series'):
+            conditions[field] = value
+        else:
+            conditions['title'].append(word)
+    matches = mirror.find(title=' '.join(conditions['title']) or None,
+                          tag=conditions.get('tag'), series=conditions.get('series'))
+    print(f"🔎 미러 검색 결과 {len(matches)}개")
+    for match in matches:
+        series = f" [{match['series']}]" if match['series'] else ''
+        print(f"   - {match['title']}{series} {', '.join(match['tags'])}\n     {match['url']}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Velog 자동 포스팅')
+    parser.add_argument('--queue', metavar='FILE',
+                        help='JSONL 큐 파일의 포스트를 하나의 브라우저로 연속 게시')
+    parser.add_argument('--prepare', metavar='FILE',
+                        help='포스트를 미리 생성해 JSONL 큐 파일에 추가 (게시하지 않음)')
+    parser.add_argument('--count', type=int, default=7, help='--prepare로 생성할 포스트 수')
+    parser.add_argument('--topics-file', help='--prepare에 사용할 주제 목록 파일 (한 줄에 하나)')
+    parser.add_argument('--gen-concurrency', type=int, default=4, help='--prepare 동시 생성 수')
+    parser.add_argument('--topic', help='AI 생성 주제 (같은 주제는 캐시된 결과를 재사용)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='포스트를 생성해 미리보기만 출력 (브라우저/Playwright를 로드하지 않음)')
+    parser.add_argument('--stream', action='store_true',
+                        help='AI 본문을 스트리밍으로 생성하면서 동시에 브라우저 게시 준비')
+    parser.add_argument('--no-cache', action='store_true', help='AI 응답 캐시를 사용하지 않음')
+    parser.add_argument('--llm-model', default=os.getenv('VELOG_LLM_MODEL'), metavar='MODEL',
+                        help='본문 생성 모델, "백엔드:모델" 형식으로 백엔드 선택 '
+                             '(예: gpt-4o-mini, local:qwen2.5-7b-instruct, fake; VELOG_LLM_MODEL)')
+    parser.add_argument('--llm-base-url', default=None, metavar='URL',
+                        help='OpenAI 호환 서버 주소 (local 기본값: http://127.0.0.1:8080/v1, VELOG_LLM_BASE_URL)')
+    parser.add_argument('--llm-timeout', type=float, default=None, metavar='SEC',
+                        help='생성 응답 읽기 제한 시간(초) (기본값: openai 30, local 600)')
+    parser.add_argument('--llm-pool-size', type=int, default=None, metavar='N',
+                        help='백엔드별로 유지할 keep-alive 연결 수 (기본값: openai 4, local 2)')
+    parser.add_argument('--mode', choices=PUBLISH_MODES, default='browser',
+                        help='게시 방식 (api: GraphQL API 사용, 실패 시 브라우저로 대체)')
+    parser.add_argument('--base-url', help='Velog 주소 (기본값: VELOG_BASE_URL 또는 https://velog.io)')
+    parser.add_argument('--local-images', action='store_true',
+                        help='플레이스홀더 이미지를 로컬에서 그려 Velog에 업로드한 주소로 교체')
+    parser.add_argument('--job-db', default=None,
+                        help='작업 저장소(SQLite) 경로 (기본값: velog_jobs.sqlite3, '
+                             '대화형 게시는 이 옵션을 줄 때만 작업으로 기록)')
+    parser.add_argument('--enqueue', type=int, metavar='N',
+                        help='포스트 N개를 생성해 작업 저장소에 저장 (게시하지 않음)')
+    parser.add_argument('--run-jobs', action='store_true',
+                        help='작업 저장소의 게시 대기 작업을 차례로 게시 (중단된 작업 이어서 처리)')
+    parser.add_argument('--job-status', action='store_true', help='작업 저장소 상태 출력')
+    parser.add_argument('--sync', action='store_true',
+                        help='게시한 글을 로컬 미러(마크다운 + 색인)로 가져옴 (바뀐 글만)')
+    parser.add_argument('--full-sync', action='store_true', help='--sync 시 모든 글의 본문을 다시 가져옴')
+    parser.add_argument('--sync-concurrency', type=int, default=8, help='--sync 동시 본문 요청 수')
+    parser.add_argument('--mirror-dir', default='velog_mirror', help='로컬 미러 디렉터리')
+    parser.add_argument('--find', metavar='QUERY',
+                        help='로컬 미러 검색: "tag:태그", "series:시리즈" 또는 제목 일부 (공백으로 조건 결합)')
+    parser.add_argument('--update', metavar='FILE',
+                        help='JSONL 파일의 수정 목록({"url" 또는 "id", 바꿀 필드})으로 게시된 글을 바뀐 부분만 수정')
+    parser.add_argument('--update-concurrency', type=int, default=4, help='--update 동시 수정 수')
+    parser.add_argument('--similarity-db', default='.velog_similarity.sqlite3',
+                        help='생성/게시한 글의 유사 중복 인덱스(SQLite) 경로')
+    parser.add_argument('--no-dedupe', action='store_true',
+                        help='비슷한 글이 이미 있는지 확인하지 않음')
+    parser.add_argument('--daemon', action='store_true',
+                        help='일정에 따라 포스트를 미리 생성해 두고 게시 시각마다 게시 (SIGTERM으로 종료)')
+    parser.add_argument('--schedule', default='every 24h jitter 30m', metavar='SPEC',
+                        help='--daemon 게시 일정: cron 표현식("0 9 * * *") 또는 "every 6h jitter 30m"')
+    parser.add_argument('--lookahead', type=int, default=3,
+                        help='--daemon이 미리 생성해 둘 다음 슬롯 수')
+    parser.add_argument('--warmup', type=float, default=120,
+                        help='--daemon이 게시 몇 초 전에 세션 확인/브라우저 준비를 할지')
+    parser.add_argument('--debug-browser', action='store_true',
+                        help='브라우저 창을 띄우고 리소스 차단 없이 실행 (기본값: 헤드리스 + 이미지/폰트/분석 차단)')
+    parser.add_argument('--failure-dir', default=None, metavar='DIR',
+                        help='게시 실패 시 스크린샷/DOM/콘솔 로그를 저장할 디렉터리 (기본값: velog_failures, VELOG_FAILURE_DIR)')
+    parser.add_argument('--max-failures', type=int, default=None, metavar='N',
+                        help='보관할 실패 기록 최대 개수, 오래된 것부터 삭제 (기본값: 20, VELOG_FAILURE_MAX)')
+    parser.add_argument('--failure-trace', action='store_true',
+                        help='게시마다 Playwright trace를 기록해 실패한 경우에만 함께 저장 (VELOG_TRACE=1)')
+    parser.add_argument('--metrics-port', type=int,
+                        default=int(os.getenv('VELOG_METRICS_PORT') or 0) or None, metavar='PORT',
+                        help='지표를 Prometheus 텍스트 형식으로 http://127.0.0.1:PORT/metrics 에 노출 (VELOG_METRICS_PORT)')
+    parser.add_argument('--metrics-file', default=os.getenv('VELOG_METRICS_FILE'), metavar='PATH',
+                        help='종료 시 지표를 Prometheus 텍스트 형식으로 기록할 파일 (VELOG_METRICS_FILE)')
+    parser.add_argument('--viewport', type=parse_viewport, metavar='WxH',
+                        help='브라우저 뷰포트 크기 (기본값: 1280x800, VELOG_VIEWPORT)')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='큐 게시 시 동시에 게시할 포스트 수 (2 이상이면 async 엔진 사용)')
+    parser.add_argument('--post-timeout', type=float, default=120,
+                        help='동시 게시 시 포스트 하나당 제한 시간(초)')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
 
-def main():
     print("🤖 Velog 자동 포스팅 시작")
     print("=" * 40)
+
+    if args.metrics_port or args.metrics_file:
+        # 지표를 내보낼 때만 단계별 소요 시간 측정
+        metrics.registry.observe_stages(tracer, metrics.STAGE_SECONDS)
+        if args.metrics_file:
+            metrics.registry.dump_at_exit(args.metrics_file)
+        if args.metrics_port:
+            metrics.registry.serve(args.metrics_port)
+            print(f"📈 지표 엔드포인트: http://127.0.0.1:{args.metrics_port}/metrics")
     
     # AI API 키 설정 (환경변수에서 가져오기)
     ai_api_key = os.getenv('OPENAI_API_KEY')
-    if ai_api_key:
+    llm_backend = None
+    if args.llm_model or args.llm_base_url:
+        from utils.llm_backends import create_backend
+
+        try:
+            llm_backend = create_backend(args.llm_model, base_url=args.llm_base_url, api_key=ai_api_key,
+                                         timeout=args.llm_timeout, pool_size=args.llm_pool_size)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+    if llm_backend is not None:
+        print(f"✅ AI 콘텐츠 생성 모드 ({llm_backend.describe()})")
+    elif ai_api_key:
         print("✅ AI 콘텐츠 생성 모드")
     else:
         print("📝 기본 콘텐츠 생성 모드 (AI API 키가 없습니다)")
     
     # VelogPoster 인스턴스 생성
-    poster = VelogPoster(ai_api_key=ai_api_key)
+    failures = FailureCapture.from_env(trace=args.failure_trace or None)
+    if args.failure_dir:
+        failures.root = args.failure_dir
+    if args.max_failures:
+        failures.max_entries = max(1, args.max_failures)
+    poster = VelogPoster(ai_api_key=ai_api_key, base_url=args.base_url, mode=args.mode,
+                         local_images=args.local_images, debug_browser=args.debug_browser,
+                         viewport=args.viewport, failures=failures, llm_backend=llm_backend)
+    poster.generator.use_cache = not args.no_cache
+
+    # 미리보기 모드: 생성 결과만 출력하고 게시하지 않음
+    if args.dry_run:
+        preview_post(poster.generator.generate_post(topic=args.topic))
+        return
+
+    # 생성한 초안을 지금까지 생성/게시한 글과 비교해 비슷하면 다시 생성
+    if not args.no_dedupe:
+        from utils.similarity import SimilarityIndex
+
+        poster.generator.similarity = SimilarityIndex(args.similarity_db)
+
+    # 미러: 게시한 글을 로컬로 가져오고 제목/태그/시리즈로 검색
+    if args.sync or args.find:
+        from utils.mirror import PostMirror
+
+        mirror = PostMirror(args.mirror_dir)
+        try:
+            if args.sync:
+                stats = poster.sync_mirror(mirror, concurrency=args.sync_concurrency, full=args.full_sync)
+                if stats:
+                    print(f"🔄 미러 동기화 완료 ({stats['elapsed']:.2f}초): 목록 {stats['listed']}개, "
+                          f"가져옴 {stats['fetched']}개, 변경 없음 {stats['unchanged']}개, "
+                          f"삭제됨 {stats['deleted']}개, 실패 {stats['failed']}개")
+            if args.find:
+                print_mirror_matches(mirror, args.find)
+        finally:
+            mirror.close()
+        return
+
+    # 수정 모드: 게시된 글과 비교해 바뀐 필드만 수정
+    if args.update:
+        items = []
+        for entry in load_queue(args.update):
+            ref = entry.pop('url', None) or entry.pop('id', None)
+            if ref is None:
+                print(f"⚠️  url/id가 없는 수정 항목은 건너뜁니다: {entry.get('title', '')}")
+                continue
+            items.append((ref, entry))
+        print(f"✏️  게시된 글 {len(items)}개를 확인합니다...")
+        poster.update_posts(items, concurrency=args.update_concurrency)
+        return
+
+    # 준비 모드: 여러 포스트를 동시에 생성해 큐 파일에 저장
+    if args.prepare:
+        prepare_queue(poster.generator, args.prepare, args.count, args.topics_file, args.gen_concurrency)
+        return
+
+    # 데몬 모드: 일정에 맞춰 미리 생성하고 게시 (상태는 작업 저장소에 보관)
+    if args.daemon:
+        from utils.job_store import DEFAULT_JOB_DB, JobStore
+        from utils.scheduler import PublishDaemon, parse_schedule
+
+        topics = None
+        if args.topics_file:
+            with open(args.topics_file, 'r', encoding='utf-8') as f:
+                topics = [line.strip() for line in f if line.strip()]
+        store = JobStore(args.job_db or DEFAULT_JOB_DB)
+        daemon = PublishDaemon(poster, store, parse_schedule(args.schedule),
+                               lookahead=args.lookahead, warmup=args.warmup, topics=topics)
+        daemon.install_signal_handlers()
+        try:
+            daemon.run()
+            print_job_counts(store)
+        finally:
+            store.close()
+        return
+
+    # 작업 저장소: 생성 결과를 디스크에 보관하고 중단된 곳부터 이어서 게시
+    if args.enqueue or args.run_jobs or args.job_status:
+        from utils.job_store import DEFAULT_JOB_DB, JobStore
+
+        store = JobStore(args.job_db or DEFAULT_JOB_DB)
+        try:
+            if args.enqueue:
+                enqueue_jobs(poster.generator, store, args.enqueue, args.topics_file, args.gen_concurrency)
+            if args.run_jobs:
+                results = poster.run_jobs(store)
+                print(f"\n📊 작업 게시 결과: 성공 {sum(results)}개 / 전체 {len(results)}개")
+            print_job_counts(store)
+        finally:
+            store.close()
+        return
+
+    # 큐 모드: 미리 준비된 포스트를 한 번에 게시
+    if args.queue:
+        if args.concurrency > 1:
+            results = poster.publish_many(
+                load_queue(args.queue),
+                concurrency=args.concurrency,
+                post_timeout=args.post_timeout
+            )
+            results = [r['success'] for r in results]
+        else:
+            results = poster.publish_queue(args.queue)
+        if results and all(results):
+            print("\n🎉 큐의 모든 포스트가 게시되었습니다!")
+        return
     
+    # 스트리밍 모드: 본문 생성과 브라우저 준비(접속/제목/태그 입력)를 겹쳐서 실행
+    if args.stream:
+        print("📝 포스트 내용을 스트리밍으로 생성하면서 게시합니다...")
+        post_data = poster.generator.generate_post_streaming(
+            topic=args.topic,
+            on_section=lambda section: print(f"   📄 섹션 생성: {section.splitlines()[0][:40]}")
+        )
+        print(f"   제목: {post_data['title']}")
+        print(f"   태그: {', '.join(post_data['tags'])}")
+        success = poster.create_post(post_data)
+        print("\n🎉 자동 포스팅이 완료되었습니다!" if success else "\n❌ 포스팅에 실패했습니다.")
+        return
+
     # 포스트 데이터 생성
     print("📝 포스트 내용 생성 중...")
-    post_data = poster.generator.generate_post()
+    post_data = poster.generator.generate_post(topic=args.topic)
     
+    if poster.generator.ai_enabled and poster.generator.use_cache:
+        stats = poster.generator.cache.stats()
+        print(f"🗄️  AI 캐시: 적중 {stats['hits']} / 미스 {stats['misses']} (저장 {stats['entries']}개)")
     print(f"📋 생성된 포스트 정보:")
     print(f"   제목: {post_data['title']}")
     print(f"   시리즈: {post_data['series']}")
@@ -205,8 +916,12 @@ def main():
         print("포스팅을 취소했습니다.")
         return
     
-    # 포스팅 실행
-    success = poster.create_post(post_data)
+    if args.job_db:
+        success = publish_as_job(poster, args.job_db, post_data, topic=args.topic)
+        if success is None:
+            return
+    else:
+        success = poster.create_post(post_data)
     
     if success:
         print("\n🎉 자동 포스팅이 완료되었습니다!")
@@ -0,0 +1,25 @@
+"""
+테스트 공용 픽스처
+브라우저가 필요 없는 부분만 로컬 Velog 대역 서버(utils.mock_velog)로 확인
+"""
+
+import pytest
+
+from utils.mock_velog import start_in_thread, mock_session_data
+
+
+@pytest.fixture
+def mock_velog():
+    """(server, base_url) - 테스트마다 빈 상태로 새로 띄움"""
+    server, base_url = start_in_thread(modal_delay_ms=0)
+    server.state.chunk_delay_ms = 0
+    try:
+        yield server, base_url
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def mock_session(mock_velog):
+    return mock_session_data(mock_velog[1])
@@ -0,0 +1,90 @@
+"""GraphQL 게시와 결과를 확인하지 못한(애매한) 게시 처리"""
+
+import json
+import sys
+
+import pytest
+import requests
+
+from post_writer import VelogPoster
+from utils.failure_capture import FailureCapture
+from utils.graphql_publisher import GraphQLPublisher, PublishUnconfirmedError
+
+
+def make_poster(tmp_path, base_url, session_data):
+    session_file = tmp_path / 'session.json'
+    session_file.write_text(json.dumps(session_data), encoding='utf-8')
+    return VelogPoster(base_url=base_url, session_file=str(session_file), mode='api',
+                       failures=FailureCapture(root=str(tmp_path / 'failures')))
+
+
+def html_response():
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'<html>502 Bad Gateway</html>'
+    return response
+
+
+def test_write_post_against_mock(mock_velog, mock_session):
+    server, base_url = mock_velog
+    publisher = GraphQLPublisher(mock_session, base_url=base_url)
+    try:
+        url = publisher.write_post({'title': 'API 글', 'content': '본문', 'tags': ['A']})
+    finally:
+        publisher.close()
+    assert url == f"{base_url}/@tester/api-글"
+    assert server.state.posts[0]['title'] == 'API 글'
+
+
+def test_unreadable_write_response_is_unconfirmed(mock_velog, mock_session, monkeypatch):
+    _, base_url = mock_velog
+    publisher = GraphQLPublisher(mock_session, base_url=base_url)
+    post_data = {'title': '글', 'content': '본문'}
+    try:
+        monkeypatch.setattr(publisher, 'execute', lambda query, variables=None: {'writePost': None})
+        with pytest.raises(PublishUnconfirmedError):
+            publisher.write_post(post_data)
+
+        monkeypatch.undo()
+        monkeypatch.setattr(publisher.session, 'post', lambda *args, **kwargs: html_response())
+        with pytest.raises(PublishUnconfirmedError):
+            publisher.write_post(post_data)
+    finally:
+        publisher.close()
+
+
+def test_unconfirmed_api_publish_is_not_retried_in_browser(tmp_path, mock_velog, mock_session, monkeypatch):
+    _, base_url = mock_velog
+    poster = make_poster(tmp_path, base_url, mock_session)
+
+    def unconfirmed(self, post_data):
+        raise PublishUnconfirmedError('writePost 응답에 게시된 글 정보가 없습니다.')
+
+    monkeypatch.setattr(GraphQLPublisher, 'write_post', unconfirmed)
+    monkeypatch.setattr(poster, '_create_post', lambda *args, **kwargs: pytest.fail('브라우저로 다시 게시함'))
+    assert not poster.create_post({'title': '글', 'content': '본문', 'tags': []})
+    assert poster.last_publish_ambiguous
+
+
+def test_queue_records_ambiguous_posts_as_failed(tmp_path, mock_velog, mock_session, monkeypatch):
+    _, base_url = mock_velog
+    poster = make_poster(tmp_path, base_url, mock_session)
+    queue = tmp_path / 'queue.jsonl'
+    queue.write_text('\n'.join(json.dumps({'title': title, 'content': '본문', 'tags': []})
+                               for title in ('첫 글', '애매한 글', '셋째 글')), encoding='utf-8')
+
+    calls = []
+
+    def publish_via_api(post_data):
+        calls.append((post_data['title'], poster.last_publish_ambiguous))
+        if post_data['title'] == '애매한 글':
+            poster.last_publish_ambiguous = True
+            return False
+        return True
+
+    # 브라우저 경로는 import 시점에 실패하게 만들어 쓰이지 않았음을 확인
+    monkeypatch.setattr(poster, 'publish_via_api', publish_via_api)
+    monkeypatch.setitem(sys.modules, 'utils.browser_pool', None)
+    assert poster.publish_queue(str(queue)) == [True, False, True]
+    # 포스트마다 애매함 표시를 초기화
+    assert calls == [('첫 글', False), ('애매한 글', False), ('셋째 글', False)]
@@ -0,0 +1,268 @@
+"""브라우저 게시 엔진의 단계 흐름 (브라우저 대신 가짜 async 페이지)"""
+
+import asyncio
+import json
+import zipfile
+
+from utils.async_poster import AsyncVelogPoster
+from utils.editor_input import READ_EDITOR_JS, SET_CODEMIRROR_JS, CLEAR_EDITOR_JS
+from utils.failure_capture import FailureCapture
+from utils.markdown_check import analyze_markdown
+from utils.markdown_stream import StreamingContent
+
+BASE_URL = 'http://velog.test'
+
+
+class FakeElement:
+    def __init__(self, page, name):
+        self.page = page
+        self.name = name
+
+    async def fill(self, value):
+        self.page.log.append((self.name, value))
+        if self.name == 'tag_input':
+            self.page.tag_value = value
+
+    async def click(self):
+        self.page.log.append(('click', self.name))
+
+    async def is_enabled(self):
+        return self.page.button_enabled
+
+    async def is_visible(self):
+        return True
+
+    async def scroll_into_view_if_needed(self):
+        pass
+
+    async def type(self, text, delay=0):
+        self.page.body += text
+
+
+class FakeKeyboard:
+    def __init__(self, page):
+        self.page = page
+
+    async def press(self, key):
+        # 태그 입력창에서 엔터를 누르면 태그가 등록되고 입력창이 비워짐
+        self.page.tags.append(self.page.tag_value)
+        self.page.tag_value = ''
+
+    async def insert_text(self, text):
+        self.page.body += text
+
+
+class FakeWritePage:
+    """
+    글쓰기/수정 페이지 대역
+    outcome: 최종 버튼을 누른 뒤 결과 ('ok': 글 주소로 이동, 'empty': 빈 내용 오류, 'stuck': 아무 반응 없음)
+    """
+
+    def __init__(self, outcome='ok', button_label='출간하기', button_enabled=True):
+        self.outcome = outcome
+        self.button_label = button_label
+        self.button_enabled = button_enabled
+        self.url = 'about:blank'
+        self.body = ''
+        self.tags = []
+        self.tag_value = ''
+        self.log = []
+        self.keyboard = FakeKeyboard(self)
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    async def goto(self, url, timeout=None):
+        self.url = url
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        if selector.startswith('textarea'):
+            return FakeElement(self, 'title')
+        if selector.startswith('input'):
+            return FakeElement(self, 'tag_input')
+        if selector.startswith('button:has-text'):
+            assert f'"{self.button_label}"' in selector
+            return FakeElement(self, self.button_label)
+        if selector == '.sc-bilyIR':
+            return None
+        if selector == 'button[data-testid="publish"]':
+            return FakeElement(self, 'publish')
+        if '비어있습니다' in selector and self.outcome == 'empty':
+            return FakeElement(self, 'error')
+        raise TimeoutError(selector)
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        assert self.tag_value == ''
+
+    async def wait_for_url(self, pattern, timeout=None):
+        if self.outcome != 'ok' or self.log[-1] != ('click', 'publish'):
+            raise TimeoutError(pattern)
+        self.url = f"{BASE_URL}/@tester/published"
+
+    async def evaluate(self, script, arg=None):
+        if script == SET_CODEMIRROR_JS:
+            self.log.append(('body', arg))
+            self.body = arg
+            return True
+        if script == READ_EDITOR_JS:
+            return self.body
+        if script == CLEAR_EDITOR_JS:
+            self.body = ''
+            return True
+        raise AssertionError('unknown script')
+
+    async def screenshot(self, **kwargs):
+        return b'jpeg'
+
+    async def content(self):
+        return '<html></html>'
+
+    async def console_messages(self):
+        return []
+
+    async def page_errors(self):
+        return []
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePool:
+    def __init__(self, *pages):
+        self.pages = list(pages)
+        self.recycled = []
+
+    async def new_page(self):
+        return self.pages.pop(0)
+
+    async def recycle_page(self, page):
+        self.recycled.append(page)
+        await page.close()
+
+
+class FakeResolver:
+    hits = 0
+
+    async def resolve_async(self, page, group, candidates, timeout=3000, state='visible'):
+        return '.editor', FakeElement(page, 'editor')
+
+
+def make_engine(**kwargs):
+    kwargs.setdefault('selectors', FakeResolver())
+    return AsyncVelogPoster({}, base_url=BASE_URL, **kwargs)
+
+
+def post(content='# 제목\n\n본문\n'):
+    return {'title': '테스트 글', 'content': content, 'tags': ['a', 'b']}
+
+
+def test_publish_fills_body_then_tags_and_reports_url():
+    page = FakeWritePage()
+    published = []
+    engine = make_engine(on_published=lambda post_data, url: published.append(url))
+    [result] = asyncio.run(engine.publish_all(FakePool(page), [post()], verified=True))
+
+    assert result['success'] and result['url'] == f"{BASE_URL}/@tester/published"
+    assert not result['ambiguous']
+    assert page.url.endswith('/@tester/published')
+    assert page.body == '# 제목\n\n본문\n'
+    assert page.tags == ['a', 'b']
+    steps = [entry[0] for entry in page.log]
+    assert steps.index('body') < steps.index('tag_input')
+    assert published == [result['url']]
+    assert page.closed
+
+
+def test_streaming_content_fills_tags_first_and_uses_prepare():
+    page = FakeWritePage()
+    prepared = []
+
+    def prepare(post_data):
+        prepared.append(post_data['content'])
+        report = analyze_markdown(post_data['content'])
+        post_data['content'] = report.text
+        return report
+
+    engine = make_engine(prepare=prepare)
+    post_data = post(StreamingContent(iter(['# 제목\n\n', '스트리밍 본문\n'])))
+    [result] = asyncio.run(engine.publish_all(FakePool(page), [post_data], verified=True))
+
+    assert result['success']
+    steps = [entry[0] for entry in page.log]
+    assert steps.index('tag_input') < steps.index('body')
+    assert prepared == ['# 제목\n\n스트리밍 본문\n']
+    assert page.body == '# 제목\n\n스트리밍 본문\n'
+
+
+def test_empty_content_error_is_captured_and_not_ambiguous(tmp_path):
+    page = FakeWritePage(outcome='empty')
+    failures = FailureCapture(root=str(tmp_path))
+    engine = make_engine(failures=failures)
+    [result] = asyncio.run(engine.publish_all(FakePool(page), [post()], verified=True))
+
+    assert not result['success'] and not result['ambiguous']
+    [(path, _)] = failures.entries()
+    with zipfile.ZipFile(path) as archive:
+        assert json.loads(archive.read('meta.json'))['stage'] == 'empty_content_error'
+
+
+def test_unconfirmed_publish_is_ambiguous():
+    engine = make_engine()
+    [result] = asyncio.run(engine.publish_all(FakePool(FakeWritePage(outcome='stuck')), [post()], verified=True))
+    assert not result['success'] and result['ambiguous']
+
+    # 최종 버튼을 누르지 못했으면 게시되지 않은 것이 확실함
+    page = FakeWritePage(button_enabled=False)
+    [result] = asyncio.run(engine.publish_all(FakePool(page), [post()], verified=True))
+    assert not result['success'] and not result['ambiguous']
+    assert ('click', 'publish') not in page.log
+
+
+def test_edit_post_uses_edit_button_and_adds_only_new_tags():
+    page = FakeWritePage(button_label='수정하기')
+    engine = make_engine()
+    published = {'id': 'post-1', 'tags': ['a']}
+    changes = {'title': '새 제목', 'body': '바뀐 본문\n', 'tags': ['a', 'c']}
+    url = asyncio.run(engine.edit_post(FakePool(page), published, changes))
+
+    assert url == f"{BASE_URL}/@tester/published"
+    assert ('title', '새 제목') in page.log
+    assert page.body == '바뀐 본문\n'
+    assert page.tags == ['c']
+
+
+class FakeBrowserPool:
+    """BrowserPool처럼 전용 이벤트 루프에서 엔진 코루틴을 실행"""
+
+    def __init__(self, *pages):
+        self.pool = FakePool(*pages)
+        self.pool.session_data = {}
+        self._loop = asyncio.new_event_loop()
+
+    def run(self, coro):
+        return self._loop.run_until_complete(coro)
+
+    def close(self):
+        self._loop.close()
+
+
+def test_sync_poster_publishes_through_the_engine(tmp_path):
+    from post_writer import VelogPoster
+
+    poster = VelogPoster(base_url=BASE_URL, session_file=str(tmp_path / 'session.json'),
+                         failures=FailureCapture(root=str(tmp_path / 'failures')))
+    poster.selectors = FakeResolver()
+    pool = FakeBrowserPool(FakeWritePage(), FakeWritePage(outcome='stuck'))
+    try:
+        assert poster._publish_with_pool(pool, post(), verified=True)
+        assert poster.last_post_url == f"{BASE_URL}/@tester/published"
+        assert not poster.last_publish_ambiguous
+
+        assert not poster._publish_with_pool(pool, post(), verified=True)
+        assert poster.last_post_url is None and poster.last_publish_ambiguous
+    finally:
+        pool.close()
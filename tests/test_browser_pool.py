@@ -0,0 +1,152 @@
+"""브라우저 풀 재사용·재시작과 JSONL 큐 로드 (Playwright 대신 가짜 드라이버)"""
+
+from post_writer import load_queue
+from utils.browser_pool import BrowserPool
+from utils.browser_profile import BrowserProfile
+
+
+class FakePage:
+    def __init__(self, fail_close=False):
+        self.closed = False
+        self.fail_close = fail_close
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        if self.fail_close:
+            raise RuntimeError('target closed')
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.cookies = []
+        self.pages = []
+
+    async def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    async def route(self, pattern, handler):
+        self.route_pattern = pattern
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+class FakeBrowser:
+    def __init__(self, options):
+        self.options = options
+        self.connected = True
+        self.handlers = {}
+        self.contexts = []
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = FakeContext()
+        context.options = options
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = self
+        self.browsers = []
+        self.stopped = False
+
+    async def launch(self, **options):
+        browser = FakeBrowser(options)
+        self.browsers.append(browser)
+        return browser
+
+    async def stop(self):
+        self.stopped = True
+
+
+SESSION = {'user_agent': 'test-agent', 'cookies': [{'name': 'access_token', 'value': 'x'}]}
+
+
+def make_pool(**kwargs):
+    pool = BrowserPool(SESSION, **kwargs)
+    # async_playwright()를 띄우지 않도록 드라이버를 미리 넣어 둠
+    pool.pool._playwright = FakePlaywright()
+    pool.start()
+    return pool
+
+
+def new_page(pool):
+    return pool.run(pool.pool.new_page())
+
+
+def test_pages_share_one_browser_and_context():
+    pool = make_pool()
+    first, second = new_page(pool), new_page(pool)
+    driver = pool.pool._playwright
+    assert len(driver.browsers) == 1
+    context = driver.browsers[0].contexts[0]
+    assert context.pages == [first, second]
+    assert context.cookies == SESSION['cookies']
+    assert context.options['user_agent'] == 'test-agent'
+    assert pool.restarts == 0
+
+
+def test_crashed_browser_is_restarted_on_next_page():
+    pool = make_pool()
+    page = new_page(pool)
+    page.handlers['crash']()
+    assert not pool.is_healthy()
+
+    new_page(pool)
+    assert pool.restarts == 1
+    old, new = pool.pool._playwright.browsers
+    assert not old.connected and new.connected
+    assert new.contexts[0].cookies == SESSION['cookies']
+
+
+def test_disconnect_and_unclosable_page_mark_browser_unhealthy():
+    pool = make_pool()
+    pool.pool.browser.handlers['disconnected']()
+    assert not pool.is_healthy()
+
+    pool = make_pool()
+    pool.run(pool.pool.recycle_page(FakePage(fail_close=True)))
+    assert not pool.is_healthy()
+
+
+def test_close_stops_driver():
+    pool = make_pool()
+    driver = pool.pool._playwright
+    browser = pool.pool.browser
+    pool.close()
+    assert driver.stopped and not browser.connected
+    assert pool.pool.browser is None and pool.pool._playwright is None and pool._loop is None
+
+
+def test_profile_options_are_used():
+    pool = make_pool(profile=BrowserProfile(headless=True, viewport=(800, 600), block_domains=('ads.test',)))
+    browser = pool.pool._playwright.browsers[0]
+    assert browser.options['headless'] is True
+    assert browser.contexts[0].options['viewport'] == {'width': 800, 'height': 600}
+    assert browser.contexts[0].route_pattern == '**/*'
+
+
+def test_load_queue_skips_blank_and_broken_lines(tmp_path):
+    queue = tmp_path / 'queue.jsonl'
+    queue.write_text('{"title": "하나"}\n\nnot json\n{"title": "둘"}\n', encoding='utf-8')
+    assert load_queue(str(queue)) == [{'title': '하나'}, {'title': '둘'}]
+    assert load_queue(str(tmp_path / 'missing.jsonl')) == []
@@ -0,0 +1,126 @@
+"""브라우저 프로필 옵션, 요청 차단 규칙과 페이지별 전송량 기록"""
+
+import asyncio
+
+import pytest
+
+from utils.browser_profile import (
+    DEFAULT_BLOCKED_DOMAINS, DEFAULT_BLOCKED_TYPES, LEAN_ARGS, BrowserProfile, PageStats, parse_viewport,
+)
+
+ENV_NAMES = ('VELOG_HEADED', 'VELOG_VIEWPORT', 'VELOG_BLOCK_TYPES', 'VELOG_BLOCK_DOMAINS',
+             'VELOG_BLOCK_THIRD_PARTY')
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    for name in ENV_NAMES:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+def test_parse_viewport():
+    assert parse_viewport('1024x768') == (1024, 768)
+    assert parse_viewport('800X600') == (800, 600)
+    with pytest.raises(ValueError):
+        parse_viewport('wide')
+
+
+def test_default_profile_from_env(clean_env):
+    profile = BrowserProfile.from_env()
+    assert profile.headless
+    assert profile.launch_options() == {'headless': True, 'args': list(LEAN_ARGS)}
+    assert profile.context_options('agent') == {'user_agent': 'agent',
+                                                'viewport': {'width': 1280, 'height': 800}}
+    assert profile.block_resource_types == frozenset(DEFAULT_BLOCKED_TYPES)
+    assert profile.block_domains == DEFAULT_BLOCKED_DOMAINS
+    assert profile.blocking
+
+
+def test_env_overrides(clean_env):
+    clean_env.setenv('VELOG_HEADED', '1')
+    clean_env.setenv('VELOG_VIEWPORT', '800x600')
+    clean_env.setenv('VELOG_BLOCK_TYPES', 'image, font')
+    clean_env.setenv('VELOG_BLOCK_DOMAINS', '')
+    profile = BrowserProfile.from_env()
+    # 창을 띄우면 렌더러 절약 옵션을 쓰지 않음
+    assert profile.launch_options() == {'headless': False}
+    assert profile.viewport == (800, 600)
+    assert profile.block_resource_types == frozenset({'image', 'font'})
+    assert profile.block_domains == ()
+
+    # 인자로 준 headless가 환경변수보다 우선
+    assert BrowserProfile.from_env(headless=True).headless
+
+
+def test_debug_profile_shows_window_and_blocks_nothing(clean_env):
+    clean_env.setenv('VELOG_BLOCK_THIRD_PARTY', '1')
+    profile = BrowserProfile.from_env(debug=True)
+    assert not profile.headless and not profile.blocking
+    assert profile.context_options() == {'user_agent': '', 'no_viewport': True}
+
+
+def test_should_block_types_and_domains():
+    profile = BrowserProfile()
+    assert profile.should_block('image', 'https://velog.io/logo.png')
+    assert profile.should_block('script', 'https://www.google-analytics.com/analytics.js')
+    assert profile.should_block('xhr', 'https://stats.g.doubleclick.net/collect')
+    assert not profile.should_block('script', 'https://notdoubleclick.net/app.js')
+    assert not profile.should_block('document', 'https://velog.io/write')
+    assert not profile.should_block('document', 'data:text/html,')
+
+
+def test_third_party_blocking_allows_first_party_and_base_url(clean_env):
+    clean_env.setenv('VELOG_BLOCK_THIRD_PARTY', '1')
+    profile = BrowserProfile.from_env(base_url='http://127.0.0.1:8765')
+    assert not profile.should_block('script', 'https://static.velcdn.com/main.js')
+    assert not profile.should_block('xhr', 'http://127.0.0.1:8765/graphql')
+    assert profile.should_block('script', 'https://cdn.example.com/widget.js')
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = type('Request', (), {'resource_type': resource_type, 'url': url})()
+        self.result = None
+
+    async def abort(self):
+        self.result = 'abort'
+
+    async def continue_(self):
+        self.result = 'continue'
+
+
+class FakeContext:
+    def __init__(self):
+        self.handler = None
+
+    async def route(self, pattern, handler):
+        assert pattern == '**/*'
+        self.handler = handler
+
+
+def test_install_async_routes_and_counts_blocked_requests():
+    profile = BrowserProfile()
+    context = FakeContext()
+    asyncio.run(profile.install_async(context))
+
+    routes = [FakeRoute('image', 'https://velog.io/a.png'), FakeRoute('document', 'https://velog.io/write')]
+    for route in routes:
+        asyncio.run(context.handler(route))
+    assert [route.result for route in routes] == ['abort', 'continue']
+    assert profile.blocked == 1
+
+    # 차단할 것이 없으면 route를 걸지 않음
+    context = FakeContext()
+    asyncio.run(BrowserProfile(block_resource_types=(), block_domains=()).install_async(context))
+    assert context.handler is None
+
+
+def test_page_stats_counts_bytes_and_blocked_since_attach():
+    profile = BrowserProfile()
+    profile.blocked = 5
+    stats = PageStats(profile)
+    stats._add_sizes({'responseBodySize': 1000, 'responseHeadersSize': 200,
+                      'requestBodySize': -1, 'requestHeadersSize': 100})
+    profile.blocked += 2
+    assert stats.as_dict() == {'requests': 1, 'bytes': 1300, 'blocked': 2, 'loads': {}}
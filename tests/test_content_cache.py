@@ -0,0 +1,130 @@
+"""AI 응답 디스크 캐시의 만료, LRU 제거, 우회와 적중 통계"""
+
+import pytest
+
+from utils import content_cache
+from utils.content_cache import ContentCache, make_cache_key
+from utils.content_generator import ContentGenerator
+from utils.llm_backends import FakeBackend
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(content_cache.time, 'time', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    caches = []
+
+    def make(**kwargs):
+        cache = ContentCache(str(tmp_path / 'cache.sqlite3'), **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+def keys(cache):
+    return sorted(row[0] for row in cache._conn.execute("SELECT key FROM content_cache"))
+
+
+def test_cache_key_depends_on_every_parameter():
+    base = make_cache_key('프롬프트', 'gpt-4o-mini', 0.7, 2000)
+    assert base == make_cache_key('프롬프트', 'gpt-4o-mini', 0.7, 2000)
+    assert len({base, make_cache_key('다른 프롬프트', 'gpt-4o-mini', 0.7, 2000),
+                make_cache_key('프롬프트', 'local:qwen', 0.7, 2000),
+                make_cache_key('프롬프트', 'gpt-4o-mini', 0.2, 2000),
+                make_cache_key('프롬프트', 'gpt-4o-mini', 0.7, 500)}) == 5
+
+
+def test_ttl_expiry(make_cache, clock):
+    cache = make_cache(ttl=60)
+    cache.put('a', '본문')
+    clock[0] += 60
+    assert cache.get('a') == '본문'
+    clock[0] += 1
+    assert cache.get('a') is None
+    # 만료된 항목은 조회할 때 삭제
+    assert keys(cache) == []
+
+    cache.put('b', '본문')
+    cache.put('c', '본문')
+    clock[0] += 30
+    cache.put('d', '본문')
+    clock[0] += 31
+    assert cache.purge_expired() == 2
+    assert keys(cache) == ['d']
+
+
+def test_lru_eviction_by_count_keeps_recently_used(make_cache, clock):
+    cache = make_cache(max_entries=2)
+    cache.put('a', '1')
+    clock[0] += 1
+    cache.put('b', '2')
+    clock[0] += 1
+    assert cache.get('a') == '1'
+    clock[0] += 1
+    cache.put('c', '3')
+    assert keys(cache) == ['a', 'c']
+
+
+def test_eviction_by_bytes(make_cache, clock):
+    cache = make_cache(max_bytes=10)
+    cache.put('a', 'x' * 4)
+    clock[0] += 1
+    cache.put('b', 'y' * 4)
+    clock[0] += 1
+    cache.put('c', 'z' * 4)
+    assert keys(cache) == ['b', 'c']
+    assert cache.stats()['bytes'] == 8
+
+
+def test_eviction_with_tied_timestamps_drops_exact_count(make_cache, clock):
+    cache = make_cache(max_entries=3)
+    # 시계가 움직이지 않아 accessed_at이 모두 같음
+    for key in 'abcde':
+        cache.put(key, key)
+    assert cache.stats()['entries'] == 3
+    # 같은 시각이면 나중에 저장한 항목을 남김
+    assert keys(cache) == ['c', 'd', 'e']
+
+
+def test_stats_count_hits_and_misses(make_cache, clock):
+    cache = make_cache()
+    assert cache.get('a') is None
+    cache.put('a', '본문')
+    assert cache.get('a') == '본문'
+    assert cache.get('a') == '본문'
+    stats = cache.stats()
+    assert stats == {'hits': 2, 'misses': 1, 'hit_rate': 2 / 3, 'entries': 1,
+                     'bytes': len('본문'.encode('utf-8'))}
+
+
+def test_generator_reuses_cache_unless_bypassed(make_cache):
+    cache = make_cache()
+    backend = FakeBackend()
+    calls = []
+    complete = backend.complete
+
+    def counting_complete(*args):
+        calls.append(args)
+        return complete(*args)
+
+    backend.complete = counting_complete
+    generator = ContentGenerator(backend=backend, cache=cache)
+
+    first = generator.request_ai_content('프롬프트')
+    assert generator.request_ai_content('프롬프트') == first
+    assert len(calls) == 1
+
+    # 우회하면 캐시를 읽지도 쓰지도 않음
+    generator.request_ai_content('프롬프트', bypass_cache=True)
+    generator.request_ai_content('새 프롬프트', bypass_cache=True)
+    assert len(calls) == 3
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+    assert cache.stats()['entries'] == 1
@@ -0,0 +1,24 @@
+"""AI 없이 만드는 기본 콘텐츠와 배치 생성"""
+
+from utils.content_generator import ContentGenerator
+
+
+def test_basic_batch_uses_topic():
+    generator = ContentGenerator(use_ai=False, seed=3, use_cache=False)
+    results = generator.generate_posts(['Redis 캐시 전략', 'GraphQL 스키마 설계'], concurrency=2)
+    assert [r['topic'] for r in results] == ['Redis 캐시 전략', 'GraphQL 스키마 설계']
+    for result in results:
+        assert result['error'] is None
+        assert result['post']['content'].startswith(f"# {result['topic']}\n")
+
+
+def test_basic_batch_does_not_open_the_ai_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ContentGenerator(use_ai=False, seed=3).generate_posts(['Redis 캐시 전략'], concurrency=1)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_basic_content_without_topic_is_reproducible():
+    first = ContentGenerator(use_ai=False, seed=7).generate_basic_content()
+    assert first == ContentGenerator(use_ai=False, seed=7).generate_basic_content()
+    assert first.startswith('# ')
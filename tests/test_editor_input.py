@@ -0,0 +1,145 @@
+"""본문 일괄 입력 전략 선택과 검증 (브라우저 대신 가짜 페이지)"""
+
+import asyncio
+
+import pytest
+
+from utils.editor_input import (
+    CLEAR_EDITOR_JS, NEXT_FRAME_JS, PASTE_JS, READ_EDITOR_JS, SET_CODEMIRROR_JS,
+    EditorInputError, content_matches, insert_body, insert_body_async, normalize_newlines,
+)
+
+
+class FakeEditorPage:
+    """
+    에디터 내용을 문자열로 흉내내는 페이지
+    broken: 결과를 망가뜨릴 입력 방식 이름 집합 ('codemirror', 'insert_text', 'paste', 'type')
+    """
+
+    def __init__(self, broken=(), codemirror=True, newline='\n'):
+        self.text = ''
+        self.broken = set(broken)
+        self.codemirror = codemirror
+        self.newline = newline
+        self.frames = 0
+        self.keyboard = self
+        self.editor = FakeEditor(self)
+
+    def _write(self, method, text):
+        # 망가진 입력 방식은 자동 들여쓰기처럼 줄마다 공백을 덧붙임
+        if method in self.broken:
+            text = text.replace('\n', '\n  ')
+        self.text += text
+
+    def evaluate(self, script, arg=None):
+        if script == READ_EDITOR_JS:
+            return self.text.replace('\n', self.newline)
+        if script == SET_CODEMIRROR_JS:
+            if not self.codemirror:
+                return False
+            self.text = ''
+            self._write('codemirror', arg)
+            return True
+        if script == PASTE_JS:
+            self._write('paste', arg[1])
+            return True
+        if script == CLEAR_EDITOR_JS:
+            self.text = ''
+            return True
+        if script == NEXT_FRAME_JS:
+            self.frames += 1
+            return True
+        raise AssertionError('unknown script')
+
+    def insert_text(self, text):
+        self._write('insert_text', text)
+
+
+class FakeEditor:
+    def __init__(self, page):
+        self.page = page
+
+    def click(self):
+        pass
+
+    def type(self, text, delay=0):
+        self.page._write('type', text)
+
+
+class AsyncFakeEditorPage(FakeEditorPage):
+    """같은 동작의 async API 버전"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.keyboard = AsyncProxy(self, 'insert_text')
+        self.editor = AsyncProxy(FakeEditor(self), 'click', 'type')
+
+    async def evaluate(self, script, arg=None):
+        return FakeEditorPage.evaluate(self, script, arg)
+
+
+class AsyncProxy:
+    def __init__(self, target, *names):
+        for name in names:
+            method = getattr(target, name)
+            setattr(self, name, self._wrap(method))
+
+    @staticmethod
+    def _wrap(method):
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+
+BODY = '# 제목\n\n본문 첫 줄\n    들여쓴 코드\n'
+
+
+def test_normalize_newlines():
+    assert normalize_newlines('a\r\nb\rc\n') == 'a\nb\nc\n'
+    assert normalize_newlines(None) is None
+
+
+def test_content_matches_ignores_line_endings_and_trailing_newlines():
+    page = FakeEditorPage(newline='\r\n')
+    page.text = BODY + '\n\n'
+    assert content_matches(page, '.editor', BODY)
+    assert not content_matches(page, '.editor', BODY.replace('첫', '두'))
+
+
+def test_codemirror_is_used_first():
+    page = FakeEditorPage()
+    assert insert_body(page, page.editor, '.editor', BODY) == 'codemirror'
+    assert page.text == BODY
+
+
+def test_chunks_yield_a_frame_between_pieces():
+    page = FakeEditorPage(codemirror=False)
+    chunks = ['# 제목\n\n', '본문 첫 줄\n', '    들여쓴 코드\n']
+    assert insert_body(page, page.editor, '.editor', BODY, chunks=chunks) == 'insert_text'
+    assert page.text == BODY
+    assert page.frames == 2
+
+
+def test_mismatch_falls_through_to_next_strategy():
+    page = FakeEditorPage(broken={'codemirror', 'insert_text'})
+    assert insert_body(page, page.editor, '.editor', BODY) == 'paste'
+    assert page.text == BODY
+
+
+def test_type_fallback_is_verified():
+    page = FakeEditorPage(broken={'codemirror', 'insert_text', 'paste'})
+    assert insert_body(page, page.editor, '.editor', BODY) == 'type'
+    assert page.text == BODY
+
+    page = FakeEditorPage(broken={'codemirror', 'insert_text', 'paste', 'type'})
+    with pytest.raises(EditorInputError):
+        insert_body(page, page.editor, '.editor', BODY)
+
+
+def test_async_type_fallback_is_verified():
+    page = AsyncFakeEditorPage(broken={'codemirror', 'insert_text'})
+    assert asyncio.run(insert_body_async(page, page.editor, '.editor', BODY)) == 'paste'
+
+    page = AsyncFakeEditorPage(broken={'codemirror', 'insert_text', 'paste', 'type'})
+    with pytest.raises(EditorInputError):
+        asyncio.run(insert_body_async(page, page.editor, '.editor', BODY))
@@ -0,0 +1,85 @@
+"""실패 기록 링 디렉터리: 개수/용량 한도, 최근 기록 보존, 임시 파일 정리"""
+
+import os
+import json
+import time
+import zipfile
+
+import pytest
+
+from utils.failure_capture import STALE_TMP_SECONDS, FailureCapture
+
+
+@pytest.fixture
+def make_capture(tmp_path):
+    def make(**kwargs):
+        return FailureCapture(root=str(tmp_path / 'failures'), **kwargs)
+    return make
+
+
+def write(capture, stage, size=0, age=0):
+    """기록 하나 저장 후 수정 시각을 age초 전으로 맞춤 (같은 시각에 저장돼도 순서가 정해지도록)"""
+    path = capture._write({'stage': stage}, {'dom.html': os.urandom(size).hex()})
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    capture._prune()
+    return path
+
+
+def stages(capture):
+    stages = []
+    for path, _ in capture.entries():
+        with zipfile.ZipFile(path) as archive:
+            stages.append(json.loads(archive.read('meta.json'))['stage'])
+    return stages
+
+
+def test_ring_keeps_newest_entries_by_count(make_capture):
+    capture = make_capture(max_entries=3)
+    for n in range(5):
+        write(capture, f'stage{n}', age=100 - n)
+    assert stages(capture) == ['stage2', 'stage3', 'stage4']
+    assert capture.captured == 5
+
+
+def test_ring_drops_oldest_over_byte_limit(make_capture):
+    capture = make_capture(max_bytes=5000)
+    for n in range(4):
+        write(capture, f'stage{n}', size=1000, age=100 - n)
+    entries = capture.entries()
+    assert sum(size for _, size in entries) <= 5000
+    assert stages(capture)[-1] == 'stage3'
+    assert len(entries) < 4
+
+
+def test_newest_entry_is_kept_even_over_byte_limit(make_capture):
+    capture = make_capture(max_bytes=100)
+    write(capture, 'old', size=500, age=10)
+    path = write(capture, 'huge', size=5000)
+    assert [p for p, _ in capture.entries()] == [path]
+
+
+def test_failed_write_leaves_no_tmp(make_capture, capsys):
+    capture = make_capture()
+    # 직렬화할 수 없는 값으로 zip 쓰기 도중 실패
+    assert capture._write({'stage': 'broken'}, {'dom.html': object()}) is None
+    assert '실패 기록 저장 실패' in capsys.readouterr().out
+    assert os.listdir(capture.root) == []
+    assert capture.captured == 0
+
+
+def test_stale_tmp_is_pruned_but_recent_tmp_kept(make_capture):
+    capture = make_capture()
+    os.makedirs(capture.root)
+    stale = os.path.join(capture.root, 'crashed.zip.tmp')
+    recent = os.path.join(capture.root, 'writing.zip.tmp')
+    for path in (stale, recent):
+        with open(path, 'wb') as f:
+            f.write(b'partial')
+    old = time.time() - STALE_TMP_SECONDS - 1
+    os.utime(stale, (old, old))
+
+    path = write(capture, 'stage')
+    assert sorted(os.listdir(capture.root)) == sorted([os.path.basename(path), 'writing.zip.tmp'])
+    # 임시 파일은 기록 목록과 용량 계산에 들어가지 않음
+    assert [p for p, _ in capture.entries()] == [path]
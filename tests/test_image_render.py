@@ -0,0 +1,78 @@
+"""플레이스홀더 이미지 찾기와 로컬 렌더링"""
+
+from utils.image_render import find_placeholder_images, is_placeholder, render_images, spec_from_image
+
+
+def test_is_placeholder():
+    assert is_placeholder('https://via.placeholder.com/600x300?text=Hello')
+    assert is_placeholder('https://example.com/diagram.png')
+    assert is_placeholder('이미지URL')
+    assert is_placeholder('')
+    assert not is_placeholder('https://velog.velcdn.com/images/me/post/a.png')
+    assert not is_placeholder('/images/x.png')
+    assert not is_placeholder('images/x.png')
+    assert not is_placeholder('data:image/png;base64,iVBORw0KGgo=')
+
+
+def test_find_placeholder_images_keeps_real_images():
+    markdown = (
+        "![개요](https://via.placeholder.com/500x250?text=Overview)\n"
+        "![상대 경로](/images/x.png)\n"
+        "![데이터](data:image/png;base64,AAAA)\n"
+        "![성능 비교](이미지URL)\n"
+    )
+    found = find_placeholder_images(markdown)
+    assert [url for url, _ in found] == ['https://via.placeholder.com/500x250?text=Overview', '이미지URL']
+    assert (found[0][1].width, found[0][1].height, found[0][1].label) == (500, 250, 'Overview')
+    assert found[1][1].kind == 'chart'
+
+
+def test_render_images_keeps_order_and_dedupes():
+    card = spec_from_image('개요', 'https://via.placeholder.com/120x60')
+    chart = spec_from_image('성능 결과', 'https://via.placeholder.com/120x60')
+    blobs = render_images([card, chart, card], workers=0)
+    assert len(blobs) == 3
+    assert blobs[0] == blobs[2] != blobs[1]
+    assert all(blob.startswith(b'\x89PNG\r\n\x1a\n') for blob in blobs)
+
+
+def test_pool_is_reused_across_calls(monkeypatch):
+    from utils import image_render
+
+    specs = [spec_from_image(f'그림 {i}', 'https://via.placeholder.com/64x32') for i in range(3)]
+    expected = render_images(specs, workers=0)
+    monkeypatch.setattr(image_render, 'IN_PROCESS_PIXELS', 0)
+    try:
+        assert render_images(specs, workers=2) == expected
+        pool = image_render._pool
+        assert pool is not None
+        assert render_images(specs, workers=2) == expected
+        assert image_render._pool is pool
+    finally:
+        image_render.shutdown_pool()
+    assert image_render._pool is None
+
+
+def test_small_batches_render_in_process():
+    from utils import image_render
+
+    image_render.shutdown_pool()
+    specs = [spec_from_image(f'그림 {i}', 'https://via.placeholder.com/600x300') for i in range(3)]
+    render_images(specs, workers=4)
+    assert image_render._pool is None
+
+
+def test_recreating_the_pool_does_not_register_more_exit_handlers(monkeypatch):
+    from utils import image_render
+
+    registered = []
+    monkeypatch.setattr(image_render.atexit, 'register', registered.append)
+    monkeypatch.setattr(image_render, 'IN_PROCESS_PIXELS', 0)
+    specs = [spec_from_image(f'그림 {i}', 'https://via.placeholder.com/64x32') for i in range(2)]
+    try:
+        for _ in range(2):
+            render_images(specs, workers=2)
+            image_render.shutdown_pool()
+    finally:
+        image_render.shutdown_pool()
+    assert registered == []
@@ -0,0 +1,178 @@
+"""작업 저장소 상태 전이 (generated → publishing → published / failed)"""
+
+import time
+
+import pytest
+
+from utils.job_store import JobStore
+
+
+def make_post(n=1):
+    return {'title': f'제목 {n}', 'content': f'본문 {n}', 'tags': ['Python'], 'series': None}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite3'), lease_seconds=60, max_attempts=2, retry_delay=10)
+    yield store
+    store.close()
+
+
+def test_add_is_idempotent(store):
+    job_id, added = store.add(make_post())
+    again, added_again = store.add(make_post())
+    assert added and not added_again
+    assert again == job_id
+    assert store.counts()['generated'] == 1
+
+
+def test_claim_publish(store):
+    job_id, _ = store.add(make_post())
+    job = store.claim()
+    assert job['id'] == job_id
+    assert job['state'] == 'publishing'
+    assert job['attempts'] == 1
+    assert job['post']['tags'] == ['Python']
+    # 이미 가져간 작업은 다시 가져가지 않음
+    assert store.claim() is None
+
+    store.mark_published(job_id, 'https://velog.io/@me/post')
+    job = store.get(job_id)
+    assert job['state'] == 'published'
+    assert job['post_url'] == 'https://velog.io/@me/post'
+    assert store.pending() == 0
+
+
+def test_not_before_delays_claim(store):
+    now = time.time()
+    store.add(make_post(), not_before=now + 100)
+    assert store.claim(now=now) is None
+    assert store.claim(now=now + 101) is not None
+
+
+def test_failed_job_retries_after_delay(store):
+    job_id, _ = store.add(make_post())
+    now = time.time()
+    store.claim(now=now)
+    store.mark_failed(job_id, '네트워크 오류', ambiguous=True)
+
+    job = store.get(job_id)
+    assert job['state'] == 'failed'
+    assert job['needs_check']
+    assert store.claim(now=now) is None
+    retried = store.claim(now=job['not_before'] + 1)
+    assert retried['id'] == job_id
+    assert retried['attempts'] == 2
+    assert retried['needs_check']
+
+
+def test_attempts_are_limited(store):
+    job_id, _ = store.add(make_post())
+    for _ in range(2):
+        job = store.claim(now=time.time() + 10000)
+        store.mark_failed(job['id'], '실패')
+    assert store.claim(now=time.time() + 100000) is None
+    assert store.pending() == 0
+
+
+def test_expired_lease_is_reclaimed_with_check(store):
+    job_id, _ = store.add(make_post())
+    now = time.time()
+    store.claim(now=now)
+    # 임대 시간 안에는 다른 작업자가 가져가지 않음
+    assert store.claim(now=now + 30) is None
+    job = store.claim(now=now + 61)
+    assert job['id'] == job_id
+    assert job['needs_check']
+    assert job['attempts'] == 2
+
+
+def test_expired_lease_on_last_attempt_fails(store):
+    job_id, _ = store.add(make_post())
+    now = time.time()
+    store.claim(now=now)
+    store.mark_failed(job_id, '첫 시도 실패')
+    job = store.claim(now=store.get(job_id)['not_before'] + 1)
+    assert job['attempts'] == store.max_attempts
+
+    # 마지막 시도 중 작업자가 죽음: 임대 시간이 지나면 publishing에 남지 않고 failed(확인 필요)
+    assert store.claim(now=job['claimed_at'] + 61) is None
+    job = store.get(job_id)
+    assert job['state'] == 'failed'
+    assert job['needs_check']
+    assert job['claimed_by'] is None
+    assert store.counts()['publishing'] == 0
+    assert store.pending() == 0
+    assert store.next_due() is None
+    assert '재시도 횟수 소진' in job['error']
+
+
+def test_requeue_failed_job_keeps_check(store):
+    job_id, _ = store.add(make_post())
+    for _ in range(2):
+        job = store.claim(now=time.time() + 10000)
+        store.mark_failed(job['id'], '실패', ambiguous=True)
+    assert store.claim(job_id=job_id) is None
+
+    assert store.requeue(job_id)
+    job = store.claim(job_id=job_id)
+    assert job['attempts'] == 1
+    # 게시됐을 수도 있는 작업은 다시 올리기 전에 확인
+    assert job['needs_check']
+
+    # 실패 상태가 아닌 작업은 되돌리지 않음
+    assert not store.requeue(job_id)
+    store.mark_published(job_id, 'https://velog.io/@me/post')
+    assert not store.requeue(job_id)
+    assert store.get(job_id)['state'] == 'published'
+
+
+class FakePoster:
+    def __init__(self, results):
+        self.results = list(results)
+        self.jobs = []
+
+    def publish_job(self, store, job):
+        self.jobs.append((job['id'], job['attempts']))
+        success = self.results.pop(0)
+        if success:
+            store.mark_published(job['id'], 'https://velog.io/@me/post')
+        else:
+            store.mark_failed(job['id'], '게시 실패')
+        return success
+
+
+def test_interactive_publish_requeues_failed_draft(tmp_path):
+    from post_writer import publish_as_job
+
+    path = str(tmp_path / 'jobs.sqlite3')
+    poster = FakePoster([False, True])
+    assert publish_as_job(poster, path, make_post()) is False
+    # 같은 초안으로 다시 실행하면 재시도 대기 없이 같은 작업을 다시 게시
+    assert publish_as_job(poster, path, make_post()) is True
+    assert poster.jobs == [(1, 1), (1, 1)]
+    # 이미 게시된 초안은 다시 올리지 않음
+    assert publish_as_job(poster, path, make_post()) is None
+    assert len(poster.jobs) == 2
+
+
+def test_interactive_publish_without_job_db_skips_store(tmp_path, monkeypatch):
+    import post_writer
+
+    monkeypatch.chdir(tmp_path)
+    posted = []
+
+    class Poster:
+        def __init__(self, **kwargs):
+            self.generator = type('Generator', (), {'ai_enabled': False,
+                                                    'generate_post': lambda self, topic=None: make_post()})()
+
+        def create_post(self, post_data):
+            posted.append(post_data['title'])
+            return True
+
+    monkeypatch.setattr(post_writer, 'VelogPoster', Poster)
+    monkeypatch.setattr('builtins.input', lambda prompt='': 'y')
+    post_writer.main([])
+    assert posted == ['제목 1']
+    assert not (tmp_path / 'velog_jobs.sqlite3').exists()
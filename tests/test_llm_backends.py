@@ -0,0 +1,116 @@
+"""본문 생성 백엔드 선택과 응답 파싱"""
+
+import pytest
+
+from utils.content_generator import ContentGenerator
+from utils.llm_backends import (
+    AIGenerationError, FakeBackend, LocalBackend, OpenAICompatibleBackend, create_backend, iter_sse_deltas,
+    parse_model,
+)
+from utils.mock_velog import MOCK_COMPLETION
+
+
+@pytest.mark.parametrize('spec, expected', [
+    ('fake', ('fake', None)),
+    ('fake:slow', ('fake', 'slow')),
+    ('local:qwen2.5-7b-instruct', ('local', 'qwen2.5-7b-instruct')),
+    ('openai:gpt-4o-mini', ('openai', 'gpt-4o-mini')),
+    ('gpt-4o-mini', ('openai', 'gpt-4o-mini')),
+    ('ft:gpt-3.5-turbo:org::id', ('openai', 'ft:gpt-3.5-turbo:org::id')),
+    (None, ('openai', 'gpt-3.5-turbo')),
+])
+def test_parse_model(spec, expected):
+    assert parse_model(spec) == expected
+
+
+def test_create_backend(monkeypatch):
+    monkeypatch.delenv('VELOG_LLM_BASE_URL', raising=False)
+    assert isinstance(create_backend('fake'), FakeBackend)
+
+    local = create_backend('local:qwen', timeout=120, pool_size=3)
+    assert isinstance(local, LocalBackend)
+    assert local.url == 'http://127.0.0.1:8080/v1/chat/completions'
+    assert local.timeout[1] == 120 and local.pool_size == 3
+    assert local.cache_model == 'local:qwen'
+
+    openai = create_backend('gpt-4o-mini', api_key='sk-test')
+    assert type(openai) is OpenAICompatibleBackend
+    # 기존 캐시 키와 호환
+    assert openai.cache_model == 'gpt-4o-mini'
+    with pytest.raises(ValueError):
+        create_backend('gpt-4o-mini')
+
+
+def test_fake_backend_is_deterministic():
+    prompt = '주제: 캐시 설계\n개발 블로그 글을 써주세요.'
+    first = FakeBackend().complete(prompt)
+    assert first == FakeBackend().complete(prompt)
+    assert first.startswith('# 캐시 설계')
+    assert ''.join(FakeBackend().stream(prompt)) == first
+    assert FakeBackend(model='other').complete(prompt) != first
+
+
+def test_complete_and_stream_against_mock(mock_velog):
+    _, base_url = mock_velog
+    backend = OpenAICompatibleBackend(model='mock', base_url=f"{base_url}/v1", api_key='mock')
+    try:
+        assert backend.complete('안녕') == MOCK_COMPLETION
+        assert ''.join(backend.stream('안녕')) == MOCK_COMPLETION
+    finally:
+        backend.close()
+
+
+def test_http_error_is_generation_error(mock_velog):
+    _, base_url = mock_velog
+    backend = OpenAICompatibleBackend(model='mock', base_url=f"{base_url}/missing", api_key='mock')
+    try:
+        with pytest.raises(AIGenerationError) as info:
+            backend.complete('안녕')
+        assert info.value.status_code == 404
+    finally:
+        backend.close()
+
+
+def test_generator_falls_back_to_basic_content():
+    class Broken(FakeBackend):
+        def complete(self, prompt, max_tokens=2000, temperature=0.7):
+            raise AIGenerationError('서버 오류', 500)
+
+    generator = ContentGenerator(backend=Broken(), use_cache=False, seed=1)
+    content = generator.generate_ai_content('주제')
+    assert content == ContentGenerator(use_ai=False, seed=1).generate_basic_content('주제')
+
+
+def test_stream_decodes_utf8_without_charset(mock_velog):
+    server, base_url = mock_velog
+    # 한 글자씩 보내 UTF-8 바이트(녕 = EB 85 95 등)가 조각 경계와 겹치게 함
+    server.state.chunk_size = 1
+    backend = OpenAICompatibleBackend(model='mock', base_url=f"{base_url}/v1", api_key='mock')
+    try:
+        assert b'\x85' in MOCK_COMPLETION.encode('utf-8')
+        assert ''.join(backend.stream('안녕')) == MOCK_COMPLETION
+    finally:
+        backend.close()
+
+
+def _sse(*payloads):
+    return [f"data: {payload}".encode('utf-8') for payload in payloads]
+
+
+def test_sse_deltas_decode_utf8_and_stop_at_done():
+    # '₅'의 UTF-8 바이트에 0x85(ISO-8859-1 해석 시 줄바꿈)가 들어 있음
+    assert b'\x85' in '₅'.encode('utf-8')
+    lines = _sse('{"choices": [{"delta": {"role": "assistant"}}]}',
+                 '{"choices": [{"delta": {"content": "한글 ₅"}}]}') + [b'', b': keep-alive']
+    lines += _sse('{"choices": [{"delta": {"content": " 끝"}}]}', '[DONE]',
+                  '{"choices": [{"delta": {"content": "무시"}}]}')
+    assert list(iter_sse_deltas(lines)) == ['한글 ₅', ' 끝']
+
+
+@pytest.mark.parametrize('payload', ['{"choices": [', '{"error": "overloaded"}', '{"choices": []}', '[1, 2]'])
+def test_sse_malformed_chunk_is_generation_error(payload):
+    lines = _sse('{"choices": [{"delta": {"content": "앞부분"}}]}', payload)
+    deltas = iter_sse_deltas(lines)
+    assert next(deltas) == '앞부분'
+    with pytest.raises(AIGenerationError, match='스트림 형식 오류'):
+        next(deltas)
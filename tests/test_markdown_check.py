@@ -0,0 +1,50 @@
+"""마크다운 점검과 블록 경계 조각 나누기"""
+
+from utils.markdown_check import analyze_markdown, MarkdownAnalyzer
+
+
+def test_chunks_join_to_text_and_respect_limit():
+    paragraphs = [f"## 섹션 {i}\n\n" + '가나다라마바사 ' * 20 for i in range(30)]
+    report = analyze_markdown('\n\n'.join(paragraphs), chunk_chars=500)
+    assert len(report.chunks) > 1
+    assert ''.join(report.chunks) == report.text
+    assert all(len(chunk) <= 500 for chunk in report.chunks)
+    # 블록(빈 줄) 경계에서만 나눔
+    assert all(chunk.endswith('\n') for chunk in report.chunks[:-1])
+
+
+def test_code_block_is_not_split():
+    code = '```python\n' + ''.join(f"print({i})\n" for i in range(40)) + '```'
+    report = analyze_markdown(f"소개\n\n{code}\n\n끝", chunk_chars=1000)
+    assert any(code in chunk for chunk in report.chunks)
+
+
+def test_unclosed_fence_is_closed():
+    report = analyze_markdown("# 제목\n\n```python\nprint('hi')\n")
+    assert report.text.rstrip().endswith('```')
+    assert report.ok
+    assert any(issue.fixed for issue in report.issues)
+
+
+def test_blank_lines_and_heading_space_are_normalized():
+    report = analyze_markdown("\n\n# 제목\n\n\n\n##소제목\n본문 \n강제 줄바꿈   \n")
+    # 줄 끝 공백 두 칸 이상은 강제 줄바꿈으로 남김
+    assert report.text == "# 제목\n\n## 소제목\n본문\n강제 줄바꿈  \n"
+    assert report.stats['headings'] == 2
+
+
+def test_feed_in_pieces_matches_whole():
+    text = "# 제목\n\n```js\nconst a = 1;\n```\n\n![그림](https://example.com/a.png)\n\n끝\n"
+    analyzer = MarkdownAnalyzer(chunk_chars=20)
+    for start in range(0, len(text), 7):
+        analyzer.feed(text[start:start + 7])
+    report = analyzer.finish()
+    whole = analyze_markdown(text, chunk_chars=20)
+    assert report.text == whole.text
+    assert report.chunks == whole.chunks
+    assert report.stats['images'] == 1
+
+
+def test_image_urls():
+    report = analyze_markdown("![](  )\n\n![상대 경로](/images/a.png)\n\n![데이터](data:image/png;base64,AAAA)")
+    assert [issue.level for issue in report.issues] == ['error']
@@ -0,0 +1,108 @@
+"""지표 레지스트리와 Prometheus 텍스트 출력 (render 결과를 파싱해 확인)"""
+
+import re
+
+import pytest
+
+from utils import metrics
+from utils.metrics import MetricsRegistry
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)$')
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"(?:,|$)')
+
+
+def parse(text):
+    """{'types': {이름: 종류}, 'help': {이름: 설명}, 'samples': {(이름, ((레이블, 값), ...)): 값}}"""
+    assert text.endswith('\n')
+    types, helps, samples = {}, {}, {}
+    for line in text.splitlines():
+        if line.startswith('# HELP '):
+            name, _, help_text = line[7:].partition(' ')
+            helps[name] = help_text
+        elif line.startswith('# TYPE '):
+            name, _, kind = line[7:].partition(' ')
+            types[name] = kind
+        else:
+            match = _SAMPLE.match(line)
+            assert match, f"형식이 잘못된 줄: {line!r}"
+            name, labels, value = match.groups()
+            pairs = _LABEL.findall(labels or '')
+            assert ','.join(f'{k}="{v}"' for k, v in pairs) == (labels or '')
+            key = (name, tuple(pairs))
+            assert key not in samples, f"중복 샘플: {line!r}"
+            samples[key] = float(value)
+    return {'types': types, 'help': helps, 'samples': samples}
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_render_counters_gauges_and_escaping(registry):
+    counter = registry.counter('test_requests_total', '요청 수', ('path', 'outcome'))
+    ok = counter.labels('api', 'ok')
+    ok.inc()
+    ok.inc(2)
+    counter.labels('a"b\\c\nd', 'failed').inc()
+    gauge = registry.gauge('test_in_flight', '진행 중')
+    gauge.set(3)
+    gauge.dec()
+
+    parsed = parse(registry.render())
+    assert parsed['types'] == {'test_requests_total': 'counter', 'test_in_flight': 'gauge'}
+    assert parsed['help']['test_requests_total'] == '요청 수'
+    assert parsed['samples'] == {
+        ('test_in_flight', ()): 2.0,
+        ('test_requests_total', (('path', 'a\\"b\\\\c\\nd'), ('outcome', 'failed'))): 1.0,
+        ('test_requests_total', (('path', 'api'), ('outcome', 'ok'))): 3.0,
+    }
+
+
+def test_labels_returns_same_child_for_bound_and_string_values(registry):
+    counter = registry.counter('test_total', '수', ('code',))
+    bound = counter.labels(200)
+    assert counter.labels(200) is bound and counter.labels('200') is bound
+    bound.inc()
+    # 같은 자식을 여러 키로 찾아도 한 번만 출력
+    assert parse(registry.render())['samples'] == {('test_total', (('code', '200'),)): 1.0}
+    with pytest.raises(ValueError):
+        counter.labels('200', 'extra')
+
+
+def test_render_histogram_buckets_are_cumulative(registry):
+    histogram = registry.histogram('test_seconds', '소요 시간', ('stage',), buckets=(0.1, 1.0))
+    child = histogram.labels('publish')
+    for value in (0.05, 0.1, 0.5, 3.0):
+        child.observe(value)
+
+    samples = parse(registry.render())['samples']
+    stage = ('stage', 'publish')
+    assert samples[('test_seconds_bucket', (stage, ('le', '0.1')))] == 2
+    assert samples[('test_seconds_bucket', (stage, ('le', '1')))] == 3
+    assert samples[('test_seconds_bucket', (stage, ('le', '+Inf')))] == 4
+    assert samples[('test_seconds_count', (stage,))] == 4
+    assert samples[('test_seconds_sum', (stage,))] == pytest.approx(3.65)
+
+
+def test_callback_gauge_skips_missing_values(registry):
+    registry.callback_gauge('test_rss_bytes', '메모리', lambda: None)
+    registry.callback_gauge('test_broken', '오류', lambda: 1 / 0)
+    registry.callback_gauge('test_pool', '풀', lambda: {('a',): 1, ('b',): 2}, ('pool',))
+    parsed = parse(registry.render())
+    assert set(parsed['types']) == {'test_pool'}
+    assert parsed['samples'] == {('test_pool', (('pool', 'a'),)): 1.0, ('test_pool', (('pool', 'b'),)): 2.0}
+
+
+def test_prebound_children_are_exported():
+    # 모듈 상수로 받아 둔 자식은 labels(...)로 찾은 자식과 같고, 값이 0이어도 출력됨
+    assert metrics.API_PUBLISHES['ok'] is metrics.PUBLISHES.labels('api', 'ok')
+    assert metrics.publish_outcomes('api')['failed'] is metrics.API_PUBLISHES['failed']
+    assert metrics.HTTP_LOGIN_CHECK_FAILED is metrics.LOGIN_CHECK_FAILURES.labels('http')
+
+    before = metrics.API_PUBLISHES['ok'].value
+    metrics.API_PUBLISHES['ok'].inc()
+    samples = parse(metrics.registry.render())['samples']
+    assert samples[('velog_publish_total', (('path', 'api'), ('outcome', 'ok')))] == before + 1
+    assert ('velog_publish_total', (('path', 'api'), ('outcome', 'session_expired'))) in samples
+    assert ('velog_ai_fallbacks_total', (('reason', 'stream_error'),)) in samples
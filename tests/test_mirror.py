@@ -0,0 +1,91 @@
+"""로컬 미러 동기화 (대역 서버의 GraphQL 목록/본문 조회)"""
+
+import os
+
+import pytest
+
+from utils.graphql_publisher import GraphQLPublisher
+from utils.mirror import MirrorSync, PostMirror, _filename
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = PostMirror(str(tmp_path / 'mirror'))
+    yield mirror
+    mirror.close()
+
+
+@pytest.fixture
+def publisher(mock_velog, mock_session):
+    publisher = GraphQLPublisher(mock_session, base_url=mock_velog[1])
+    yield publisher
+    publisher.close()
+
+
+def add_posts(state, count, series=None):
+    for n in range(1, count + 1):
+        state.add_post({'title': f'글 {n}', 'body': f'본문 {n}', 'tags': ['Python', f'태그{n % 2}'],
+                        'series_id': series and series['id']})
+
+
+def test_filename_keeps_posts_with_same_slug_apart():
+    long_slug = 'a' * 130
+    names = {_filename({'id': '1', 'url_slug': 'redis 캐시'}), _filename({'id': '2', 'url_slug': 'redis/캐시'}),
+             _filename({'id': '3', 'url_slug': long_slug + 'x'}), _filename({'id': '4', 'url_slug': long_slug + 'y'})}
+    assert len(names) == 4
+    assert _filename({'id': '5', 'url_slug': ''}) == '5.md'
+    assert _filename({'id': '6', 'url_slug': 'hello world'}) == 'hello-world-6.md'
+
+
+def test_first_sync_fetches_everything_across_pages(mock_velog, publisher, mirror):
+    server, base_url = mock_velog
+    series = server.state.add_series('캐시 시리즈', 'cache')
+    add_posts(server.state, 5, series=series)
+
+    stats = MirrorSync(publisher, mirror, concurrency=2, page_size=2).sync()
+    assert (stats['listed'], stats['fetched'], stats['unchanged'], stats['failed']) == (5, 5, 0, 0)
+    assert mirror.count() == 5
+    assert mirror.read_body('3') == '본문 3'
+    assert mirror.series_counts() == {'캐시 시리즈': 5}
+
+    [found] = mirror.find(title='글 2')
+    assert found['url'] == f"{base_url}/@tester/post-2"
+    assert found['tags'] == ['Python', '태그0']
+    with open(found['path'], encoding='utf-8') as f:
+        assert f.read().startswith('---\nid: "2"\ntitle: "글 2"\n')
+    assert {p['id'] for p in mirror.find(tag='태그1')} == {'1', '3', '5'}
+
+
+def test_sync_fetches_only_changed_and_marks_deleted(mock_velog, publisher, mirror):
+    server, _ = mock_velog
+    add_posts(server.state, 3)
+    sync = MirrorSync(publisher, mirror)
+    sync.sync()
+
+    server.state.update_post('2', title='고친 글', url_slug='fixed', body='새 본문')
+    fetched = []
+    stats = sync.sync(on_post=lambda post, url: fetched.append(post['id']))
+    assert fetched == ['2']
+    assert (stats['fetched'], stats['unchanged']) == (1, 2)
+    assert mirror.read_body('2') == '새 본문'
+    # slug가 바뀌면 이전 파일은 지움
+    assert sorted(os.listdir(mirror.posts_dir)) == ['fixed-2.md', 'post-1-1.md', 'post-3-3.md']
+
+    server.state.posts.pop()
+    stats = sync.sync()
+    assert stats['deleted'] == 1 and stats['fetched'] == 0
+    assert mirror.count() == 2
+
+    # full=True면 바뀌지 않은 글도 다시 가져옴
+    assert sync.sync(full=True)['fetched'] == 2
+
+
+def test_posts_with_colliding_slugs_are_both_kept(mock_velog, publisher, mirror):
+    server, _ = mock_velog
+    server.state.add_post({'title': '첫 글', 'body': '첫 본문', 'url_slug': 'redis 캐시'})
+    server.state.add_post({'title': '둘째 글', 'body': '둘째 본문', 'url_slug': 'redis/캐시'})
+
+    MirrorSync(publisher, mirror).sync()
+    assert len(os.listdir(mirror.posts_dir)) == 2
+    assert mirror.read_body('1') == '첫 본문'
+    assert mirror.read_body('2') == '둘째 본문'
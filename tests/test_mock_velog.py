@@ -0,0 +1,39 @@
+"""로컬 Velog 대역 서버 (로그인 판별, 글 저장, GraphQL 인증 오류)"""
+
+import requests
+
+from utils.mock_velog import MOCK_REFRESH_TOKEN, MOCK_TOKEN, MOCK_USERNAME
+
+
+def test_home_shows_login_state(mock_velog):
+    _, base_url = mock_velog
+    assert '로그인' in requests.get(base_url, timeout=5).text
+
+    logged_in = requests.get(base_url, cookies={'access_token': MOCK_TOKEN}, timeout=5)
+    assert f'href="/@{MOCK_USERNAME}"' in logged_in.text
+
+
+def test_refresh_token_issues_access_token(mock_velog):
+    _, base_url = mock_velog
+    response = requests.get(base_url, cookies={'refresh_token': MOCK_REFRESH_TOKEN}, timeout=5)
+    assert response.cookies.get('access_token') == MOCK_TOKEN
+
+
+def test_posts_require_login(mock_velog):
+    server, base_url = mock_velog
+    post = {'title': '대역 글', 'body': '본문', 'tags': ['A']}
+    assert requests.post(f"{base_url}/api/posts", json=post, timeout=5).status_code == 401
+
+    created = requests.post(f"{base_url}/api/posts", json=post, cookies={'access_token': MOCK_TOKEN},
+                            timeout=5).json()
+    assert created['title'] == '대역 글'
+    assert [p['title'] for p in server.state.posts] == ['대역 글']
+    assert requests.get(f"{base_url}/@{MOCK_USERNAME}/{created['url_slug']}", timeout=5).status_code == 200
+
+
+def test_graphql_without_session_is_unauthenticated(mock_velog):
+    _, base_url = mock_velog
+    result = requests.post(f"{base_url}/graphql", json={'query': 'query { auth { username } }'},
+                           timeout=5).json()
+    assert result['data'] is None
+    assert result['errors'][0]['extensions']['code'] == 'UNAUTHENTICATED'
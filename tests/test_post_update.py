@@ -0,0 +1,170 @@
+"""게시된 글 비교(diff_post)와 바뀐 필드만 수정"""
+
+import pytest
+
+from utils.graphql_publisher import GraphQLPublisher, GraphQLError, EDIT_POST_MUTATION
+from utils.post_update import PostUpdater, diff_post, parse_post_ref
+
+PUBLISHED = {
+    'id': '1',
+    'title': '제목',
+    'body': '# 제목\n\n본문입니다.',
+    'tags': ['Python', 'Velog'],
+    'url_slug': 'title',
+    'series': {'id': '3', 'name': '개발 일기'},
+}
+
+
+def test_parse_post_ref():
+    assert parse_post_ref('https://velog.io/@me/%EC%A0%9C%EB%AA%A9/') == ('slug', '제목')
+    assert parse_post_ref('0f6c-1234') == ('id', '0f6c-1234')
+    with pytest.raises(ValueError):
+        parse_post_ref('https://velog.io/about')
+
+
+def test_diff_post_ignores_whitespace_and_tag_order():
+    post = {
+        'title': '제목',
+        'content': '\n# 제목\n\n\n본문입니다.\t\n',
+        'tags': ['Velog', 'Python'],
+        'series': '개발 일기',
+    }
+    assert diff_post(PUBLISHED, post) == {}
+
+
+def test_diff_post_reports_changed_fields_only():
+    changes = diff_post(PUBLISHED, {'title': '새 제목', 'tags': ['Python'], 'series': None})
+    assert changes == {'title': '새 제목', 'tags': ['Python'], 'series': None}
+    assert diff_post(PUBLISHED, {'content': '# 제목\n\n고친 본문'}) == {'body': '# 제목\n\n고친 본문\n'}
+
+
+def test_update_against_mock(mock_velog, mock_session):
+    server, base_url = mock_velog
+    server.state.add_post({'title': '원래 제목', 'body': '원래 본문', 'tags': ['A'], 'url_slug': 'original'})
+    publisher = GraphQLPublisher(mock_session, base_url=base_url)
+    try:
+        updater = PostUpdater(publisher)
+        unchanged, updated = updater.update_many([
+            (f"{base_url}/@tester/original", {'title': '원래 제목'}),
+            ('1', {'tags': ['A', 'B']}),
+        ], concurrency=2)
+    finally:
+        publisher.close()
+
+    assert unchanged['status'] == 'unchanged'
+    assert updated['status'] == 'updated' and updated['changed'] == ['tags']
+    assert updated['url'] == f"{base_url}/@tester/original"
+    post = server.state.posts[0]
+    assert post['tags'] == ['A', 'B']
+    assert post['title'] == '원래 제목'
+    assert post['body'] == '원래 본문'
+
+
+def test_edit_keeps_fields_that_did_not_change(mock_velog, mock_session):
+    server, base_url = mock_velog
+    series_id = server.state.add_series('개발 일기', 'dev-diary')['id']
+    server.state.add_post({
+        'title': '원래 제목', 'body': '원래 본문', 'tags': ['A'], 'url_slug': 'original',
+        'series_id': series_id, 'thumbnail': 'https://images.example/thumb.png',
+        'meta': {'short_description': '요약'}, 'is_private': True,
+    })
+    publisher = GraphQLPublisher(mock_session, base_url=base_url)
+    try:
+        result = PostUpdater(publisher).update('1', {'tags': ['B']})
+    finally:
+        publisher.close()
+
+    assert result['status'] == 'updated', result['error']
+    assert server.state.edits == [['tags']]
+    post = server.state.posts[0]
+    assert post['title'] == '원래 제목' and post['body'] == '원래 본문'
+    assert post['series_id'] == series_id
+    assert post['url_slug'] == 'original'
+    assert post['thumbnail'] == 'https://images.example/thumb.png'
+    assert post['meta'] == {'short_description': '요약'}
+    assert post['is_private'] is True
+
+
+def test_mock_rejects_partial_edit(mock_velog, mock_session):
+    server, base_url = mock_velog
+    server.state.add_post({'title': '원래 제목', 'body': '원래 본문', 'tags': ['A'], 'url_slug': 'original'})
+    publisher = GraphQLPublisher(mock_session, base_url=base_url)
+    try:
+        with pytest.raises(GraphQLError, match='빠진 인자'):
+            publisher.execute(EDIT_POST_MUTATION, {'id': '1', 'tags': ['B']})
+    finally:
+        publisher.close()
+
+    assert server.state.posts[0]['title'] == '원래 제목'
+    assert server.state.edits == []
+
+
+def test_concurrent_updates_create_new_series_once(mock_velog, mock_session):
+    server, base_url = mock_velog
+    for i in range(6):
+        server.state.add_post({'title': f"글 {i}", 'body': '본문', 'tags': [], 'url_slug': f"post-{i}"})
+    publisher = GraphQLPublisher(mock_session, base_url=base_url)
+    try:
+        results = PostUpdater(publisher).update_many(
+            [(str(i + 1), {'series': '새 시리즈'}) for i in range(6)], concurrency=6)
+    finally:
+        publisher.close()
+
+    assert [r['status'] for r in results] == ['updated'] * 6
+    assert [s['name'] for s in server.state.series] == ['새 시리즈']
+    assert {post['series_id'] for post in server.state.posts} == {server.state.series[0]['id']}
+
+
+def test_expired_session_fails_every_item(mock_velog, mock_session, monkeypatch):
+    from utils.graphql_publisher import SessionExpiredError
+
+    _, base_url = mock_velog
+    publisher = GraphQLPublisher(mock_session, base_url=base_url)
+
+    def expired():
+        raise SessionExpiredError('로그인이 필요합니다.')
+
+    monkeypatch.setattr(publisher, 'current_username', expired)
+    try:
+        results = PostUpdater(publisher).update_many([('1', {'title': '새 제목'}), ('2', {'tags': []})])
+    finally:
+        publisher.close()
+
+    assert [(r['ref'], r['status'], r['error']) for r in results] == [
+        ('1', 'failed', '로그인이 필요합니다.'), ('2', 'failed', '로그인이 필요합니다.')]
+
+
+def test_fallback_reports_unapplied_fields(mock_velog, mock_session, monkeypatch):
+    server, base_url = mock_velog
+    server.state.add_post({'title': '제목', 'body': '본문', 'tags': [], 'url_slug': 'title'})
+    publisher = GraphQLPublisher(mock_session, base_url=base_url)
+    calls = []
+
+    def fallback(published, changes):
+        calls.append(sorted(changes))
+        return f"{base_url}/@tester/title", ['series']
+
+    def broken_edit(published, changes):
+        raise GraphQLError('editPost 실패')
+
+    monkeypatch.setattr(publisher, 'edit_post', broken_edit)
+    try:
+        result = PostUpdater(publisher, fallback=fallback).update('1', {'title': '새 제목', 'series': '새 시리즈'})
+    finally:
+        publisher.close()
+
+    assert calls == [['series', 'title']]
+    assert result['status'] == 'updated'
+    assert result['changed'] == ['series', 'title'] and result['unapplied'] == ['series']
+
+
+def test_browser_edit_skips_series_only_changes(tmp_path, monkeypatch):
+    import sys
+
+    from post_writer import VelogPoster
+
+    poster = VelogPoster(session_file=str(tmp_path / 'session.json'))
+    # 적용할 필드가 없으면 브라우저를 띄우지 않음
+    monkeypatch.setitem(sys.modules, 'utils.browser_pool', None)
+    monkeypatch.setattr(poster, 'load_session', lambda: pytest.fail('세션을 읽음'))
+    assert poster._edit_via_browser(PUBLISHED, {'series': '새 시리즈'}) == (None, ['series'])
@@ -0,0 +1,76 @@
+"""토큰 버킷 속도 제한과 재시도 백오프 (가짜 시계 주입)"""
+
+import pytest
+
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter, TokenBucket, backoff_delay, is_retryable_status
+
+
+class FakeClock:
+    """sleep하면 그만큼 시간이 흐르는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_bucket_starts_full_then_waits_for_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock=clock, sleep=clock.sleep)
+    for _ in range(60):
+        assert bucket.acquire() == 0.0
+    # 초당 1개씩 채워짐
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_bucket_refills_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(60, capacity=10, clock=clock, sleep=clock.sleep)
+    assert bucket.acquire(10) == 0.0
+    clock.now += 3600
+    assert bucket.acquire(10) == 0.0
+    assert bucket.acquire(5) == pytest.approx(5.0)
+
+
+def test_bucket_caps_oversized_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(60, capacity=10, clock=clock, sleep=clock.sleep)
+    # 용량보다 큰 요청도 용량만큼 채워지면 통과
+    assert bucket.acquire(100) == 0.0
+    assert bucket.acquire(100) == pytest.approx(10.0)
+
+
+def test_limiter_waits_for_both_requests_and_tokens():
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=600, clock=clock, sleep=clock.sleep)
+    assert limiter.acquire(tokens=300) == 0.0
+    assert limiter.acquire(tokens=300) == 0.0
+    # 요청 버킷: 30초에 1개, 토큰 버킷: 초당 10개 → 30초 뒤 300개가 이미 차 있음
+    assert limiter.acquire(tokens=300) == pytest.approx(30.0)
+    assert clock.now == pytest.approx(30.0)
+
+    unlimited = RateLimiter(requests_per_minute=0, tokens_per_minute=0, clock=clock, sleep=clock.sleep)
+    assert unlimited.acquire(tokens=10 ** 9) == 0.0
+
+
+def test_backoff_delay_is_capped_full_jitter(monkeypatch):
+    bounds = []
+    monkeypatch.setattr(rate_limiter.random, 'uniform', lambda low, high: bounds.append((low, high)) or high)
+    assert [backoff_delay(attempt) for attempt in range(7)] == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+    assert all(low == 0 for low, _ in bounds)
+    assert backoff_delay(2, base=0.5, cap=10.0) == 2.0
+
+
+def test_retryable_statuses():
+    assert is_retryable_status(429)
+    assert is_retryable_status(503)
+    assert not is_retryable_status(400)
+    assert not is_retryable_status(401)
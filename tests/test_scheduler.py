@@ -0,0 +1,42 @@
+"""스케줄러 데몬의 슬롯용 생성"""
+
+import time
+
+from utils.content_generator import ContentGenerator
+from utils.llm_backends import AIGenerationError, FakeBackend
+from utils.scheduler import PublishDaemon, IntervalSchedule
+from utils.similarity import SimilarityIndex
+
+
+class RejectingBackend(FakeBackend):
+    def complete(self, prompt, max_tokens=2000, temperature=0.7):
+        raise AIGenerationError('인증 실패', 401)
+
+
+class FakePoster:
+    def __init__(self, generator):
+        self.generator = generator
+
+
+def test_fallback_post_goes_through_dedupe(tmp_path):
+    # 같은 시드로 만든 기본 포스트를 조금 고쳐 이미 게시해 둠
+    existing = ContentGenerator(use_ai=False, use_cache=False, seed=5).generate_basic_post('캐시 설계')
+    existing['content'] += '\n\n게시 후 덧붙인 문단입니다.'
+    index = SimilarityIndex(str(tmp_path / 'similarity.sqlite3'))
+    index.add(existing, state='published')
+
+    generator = ContentGenerator(backend=RejectingBackend(), use_cache=False, seed=5)
+    generator.similarity = index
+    daemon = PublishDaemon(FakePoster(generator), store=None, schedule=IntervalSchedule(3600),
+                           topics=['캐시 설계'], warmup=120)
+    try:
+        post, topic = daemon._generate_for(time.time())
+        index_count = index.count()
+    finally:
+        index.close()
+
+    assert topic == '캐시 설계'
+    assert post['content'].startswith('# 캐시 설계')
+    assert post['title'] != existing['title']
+    # 게시 전 초안은 인덱스에 기록하지 않음
+    assert index_count == 1
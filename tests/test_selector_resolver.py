@@ -0,0 +1,171 @@
+"""셀렉터 후보 탐색과 기억 (브라우저 대신 페이지 대역 사용)"""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from utils.selector_resolver import SelectorCache, SelectorResolver, EDITOR_SELECTORS, page_fingerprint
+
+VISIBLE = ' >> visible=true'
+
+
+class FakeLocator:
+    def __init__(self, page, selectors):
+        self.page = page
+        self.selectors = selectors
+
+    def or_(self, other):
+        return FakeLocator(self.page, self.selectors + other.selectors)
+
+    @property
+    def first(self):
+        return self
+
+    def wait_for(self, state, timeout):
+        self.page.waited.append((self.selectors, state))
+        if not any(self.page.query_selector(selector) for selector in self.selectors):
+            raise TimeoutError('timeout')
+
+
+class FakePage:
+    """elements: {셀렉터: 보이는지} (DOM 순서대로 첫 요소만)"""
+
+    url = 'https://velog.io/write'
+
+    def __init__(self, elements):
+        self.elements = elements
+        self.waited = []
+
+    def locator(self, selector):
+        return FakeLocator(self, [selector])
+
+    def query_selector(self, selector):
+        visible_only = selector.endswith(VISIBLE)
+        base = selector[:-len(VISIBLE)] if visible_only else selector
+        if base not in self.elements:
+            return None
+        if visible_only and not self.elements[base]:
+            return None
+        return base
+
+
+@pytest.fixture
+def resolver(tmp_path):
+    return SelectorResolver(SelectorCache(str(tmp_path / 'selectors.json')))
+
+
+def test_hidden_candidate_does_not_hide_visible_one(resolver):
+    # CodeMirror의 숨은 입력 textarea가 보이는 에디터보다 DOM에서 앞서 있어도 보이는 에디터를 찾음
+    page = FakePage({'textarea:not([placeholder*="제목"])': False, '.CodeMirror-code': True})
+    selector, element = resolver.resolve(page, 'editor', EDITOR_SELECTORS)
+    assert selector == '.CodeMirror-code'
+    assert all(s.endswith(VISIBLE) for s in page.waited[0][0])
+    assert resolver.cache.get('editor', 'velog.io/write') == '.CodeMirror-code'
+
+
+def test_cached_selector_survives_timeout(resolver):
+    resolver.cache.put('editor', 'velog.io/write', '.CodeMirror-code')
+    # 페이지가 아직 준비되지 않음: 어느 후보도 없음
+    assert resolver.resolve(FakePage({}), 'editor', EDITOR_SELECTORS) == (None, None)
+    assert resolver.cache.get('editor', 'velog.io/write') == '.CodeMirror-code'
+
+    selector, _ = resolver.resolve(FakePage({'.CodeMirror-code': True}), 'editor', EDITOR_SELECTORS)
+    assert selector == '.CodeMirror-code'
+    assert resolver.hits == 1
+
+
+def test_cached_selector_is_replaced_when_another_matches(resolver):
+    resolver.cache.put('editor', 'velog.io/write', '.CodeMirror-code')
+    selector, _ = resolver.resolve(FakePage({'.ProseMirror': True}), 'editor', EDITOR_SELECTORS)
+    assert selector == '.ProseMirror'
+    assert resolver.cache.get('editor', 'velog.io/write') == '.ProseMirror'
+
+
+def test_attached_state_does_not_filter_visibility(resolver):
+    page = FakePage({'.ProseMirror': False})
+    selector, _ = resolver.resolve(page, 'editor', EDITOR_SELECTORS, state='attached')
+    assert selector == '.ProseMirror'
+
+
+class UrlPage:
+    def __init__(self, url):
+        self.url = url
+
+
+@pytest.mark.parametrize('url, fingerprint', [
+    ('https://velog.io/write', 'velog.io/write'),
+    ('https://velog.io/write?id=abc#top', 'velog.io/write'),
+    ('https://velog.io/@alice/first-post', 'velog.io/@*/first-post'),
+    ('https://velog.io/@bob', 'velog.io/@*'),
+    ('http://127.0.0.1:8765', '127.0.0.1:8765/'),
+])
+def test_page_fingerprint_normalizes_user_paths(url, fingerprint):
+    assert page_fingerprint(UrlPage(url)) == fingerprint
+
+
+def test_cache_persists_and_invalidates(tmp_path):
+    path = str(tmp_path / 'selectors.json')
+    cache = SelectorCache(path)
+    cache.put('editor', 'velog.io/write', '.ProseMirror')
+    mtime = os.stat(path).st_mtime_ns
+    # 같은 셀렉터가 다시 맞으면 적중 횟수만 늘리고 파일은 다시 쓰지 않음
+    cache.put('editor', 'velog.io/write', '.ProseMirror')
+    assert os.stat(path).st_mtime_ns == mtime
+    assert cache._data['editor']['velog.io/write']['hits'] == 2
+
+    # 새 인스턴스(다음 실행)도 파일에서 읽어 같은 셀렉터를 씀
+    assert SelectorCache(path).get('editor', 'velog.io/write') == '.ProseMirror'
+
+    cache.invalidate('editor', 'velog.io/write')
+    assert cache.get('editor', 'velog.io/write') is None
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {'editor': {}}
+    # 없는 항목 무효화는 아무 일도 하지 않음
+    cache.invalidate('editor', 'velog.io/edit')
+
+
+def test_broken_cache_file_is_ignored(tmp_path):
+    path = tmp_path / 'selectors.json'
+    path.write_text('{broken', encoding='utf-8')
+    assert SelectorCache(str(path)).get('editor', 'velog.io/write') is None
+
+
+def test_stale_cached_selector_is_invalidated(resolver):
+    resolver.cache.put('editor', 'velog.io/write', '.CodeMirror-code')
+    # 후보는 나타났지만 기억한 셀렉터는 아님: 기억을 지운 뒤 새로 맞은 셀렉터를 저장
+    invalidated = []
+    invalidate = resolver.cache.invalidate
+    resolver.cache.invalidate = lambda *args: (invalidated.append(args), invalidate(*args))
+    resolver.resolve(FakePage({'div[contenteditable="true"]': True}), 'editor', EDITOR_SELECTORS)
+    assert invalidated == [('editor', 'velog.io/write')]
+    assert resolver.cache.get('editor', 'velog.io/write') == 'div[contenteditable="true"]'
+    assert (resolver.hits, resolver.misses) == (0, 1)
+
+
+class AsyncLocator(FakeLocator):
+    def or_(self, other):
+        return AsyncLocator(self.page, self.selectors + other.selectors)
+
+    async def wait_for(self, state, timeout):
+        self.page.waited.append((self.selectors, state))
+        if not any(FakePage.query_selector(self.page, selector) for selector in self.selectors):
+            raise TimeoutError('timeout')
+
+
+class AsyncFakePage(FakePage):
+    def locator(self, selector):
+        return AsyncLocator(self, [selector])
+
+    async def query_selector(self, selector):
+        return FakePage.query_selector(self, selector)
+
+
+def test_resolve_async_prefers_cached_selector(resolver):
+    resolver.cache.put('editor', 'velog.io/write', '.CodeMirror-code')
+    page = AsyncFakePage({'.ProseMirror': True, '.CodeMirror-code': True})
+    selector, _ = asyncio.run(resolver.resolve_async(page, 'editor', EDITOR_SELECTORS))
+    assert selector == '.CodeMirror-code'
+    assert page.waited[0][0][0] == '.CodeMirror-code' + VISIBLE
+    assert resolver.hits == 1
@@ -0,0 +1,160 @@
+"""브라우저 없는 세션 확인: 토큰 만료 판단, refresh_token 갱신, 세션 파일 교체"""
+
+import base64
+import json
+import time
+
+import pytest
+
+from utils.mock_velog import MOCK_REFRESH_TOKEN, MOCK_TOKEN, MOCK_USERNAME
+from utils.session_manager import (
+    EXPIRY_MARGIN, FALLBACK_MAX_AGE, SessionManager, SessionStatus, decode_jwt_payload, token_expiry,
+)
+
+NOW = 1_700_000_000.0
+
+
+def jwt(payload):
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+    return f"{encode({'alg': 'HS256'})}.{encode(payload)}.signature"
+
+
+def cookie(name, value='token', **fields):
+    return dict(name=name, value=value, **fields)
+
+
+def session(*cookies, timestamp=NOW):
+    return {'cookies': list(cookies), 'timestamp': timestamp}
+
+
+def write_session(tmp_path, data):
+    path = tmp_path / 'velog_session.json'
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return path
+
+
+def test_decode_jwt_payload():
+    assert decode_jwt_payload(jwt({'exp': 123, 'sub': '사용자'})) == {'exp': 123, 'sub': '사용자'}
+    assert decode_jwt_payload('not-a-jwt') is None
+    assert decode_jwt_payload('a.!!!.c') is None
+    assert decode_jwt_payload('') is None
+
+
+def test_token_expiry_prefers_jwt_exp_over_cookie_expires():
+    assert token_expiry(cookie('access_token', jwt({'exp': NOW}), expires=NOW + 999)) == NOW
+    # exp가 없거나 JWT가 아니면 쿠키 만료 시각
+    assert token_expiry(cookie('access_token', jwt({'sub': 'x'}), expires=NOW)) == NOW
+    assert token_expiry(cookie('access_token', 'opaque', expires=NOW)) == NOW
+    assert token_expiry(cookie('access_token', jwt({'exp': 'soon'}), expires=NOW)) == NOW
+    # Playwright 세션 쿠키(-1)나 만료 정보가 없으면 알 수 없음
+    assert token_expiry(cookie('access_token', 'opaque', expires=-1)) is None
+    assert token_expiry(cookie('access_token', 'opaque')) is None
+    assert token_expiry(None) is None
+
+
+@pytest.mark.parametrize('access_exp, refresh, expected', [
+    # access_token이 충분히 남음: 서버 확인만
+    (NOW + 3600, None, None),
+    # 만료 직전(여유 시간 안)은 만료로 취급, refresh_token이 살아 있으면 갱신
+    (NOW + EXPIRY_MARGIN - 1, cookie('refresh_token', jwt({'exp': NOW + 86400})), 'refresh'),
+    (NOW - 10, cookie('refresh_token', 'opaque'), 'refresh'),
+])
+def test_local_status_needs_remote_check_or_refresh(access_exp, refresh, expected):
+    data = session(cookie('access_token', jwt({'exp': access_exp})), *([refresh] if refresh else []))
+    assert SessionManager().local_status(data, now=NOW) == expected
+
+
+def test_local_status_rejects_expired_or_missing_tokens():
+    manager = SessionManager()
+
+    status = manager.local_status(session(), now=NOW)
+    assert status.valid is False and status.reason == '인증 쿠키가 없습니다'
+
+    expired = session(cookie('access_token', jwt({'exp': NOW - 10})),
+                      cookie('refresh_token', jwt({'exp': NOW + EXPIRY_MARGIN - 1})))
+    status = manager.local_status(expired, now=NOW)
+    assert status.valid is False and status.refresh_expires == NOW + EXPIRY_MARGIN - 1
+
+
+def test_local_status_without_expiry_uses_session_age():
+    manager = SessionManager()
+    # 만료 정보가 없는 토큰(잘못된 JWT 포함)은 서버에 확인
+    fresh = session(cookie('access_token', 'a.!!!.c'), timestamp=NOW - 3600)
+    assert manager.local_status(fresh, now=NOW) is None
+
+    old = session(cookie('access_token', 'opaque'), timestamp=NOW - FALLBACK_MAX_AGE - 1)
+    assert manager.local_status(old, now=NOW).valid is False
+
+
+def test_missing_or_broken_session_file(tmp_path):
+    assert SessionManager(str(tmp_path / 'missing.json')).check().valid is False
+
+    broken = tmp_path / 'broken.json'
+    broken.write_text('{not json', encoding='utf-8')
+    status = SessionManager(str(broken)).check()
+    assert status.valid is False and '읽을 수 없습니다' in status.reason
+
+
+def test_remote_check_is_cached(tmp_path, mock_velog, monkeypatch):
+    _, base_url = mock_velog
+    data = session(cookie('access_token', MOCK_TOKEN, expires=time.time() + 3600), timestamp=time.time())
+    manager = SessionManager(str(write_session(tmp_path, data)), base_url=base_url)
+
+    status = manager.check()
+    assert status.valid and status.username == MOCK_USERNAME and not status.refreshed
+
+    # ttl 안에서는 서버에 다시 묻지 않음
+    monkeypatch.setattr(manager, '_verify_remote', lambda *args, **kwargs: pytest.fail('다시 확인함'))
+    assert manager.check() is status
+
+
+def test_expired_access_token_is_dropped_and_refreshed(tmp_path, mock_velog, monkeypatch):
+    from utils import graphql_publisher
+
+    _, base_url = mock_velog
+    now = time.time()
+    data = session(cookie('access_token', jwt({'exp': now - 10})),
+                   cookie('refresh_token', MOCK_REFRESH_TOKEN), timestamp=now)
+    path = write_session(tmp_path, data)
+    manager = SessionManager(str(path), base_url=base_url)
+
+    sent = []
+    init = graphql_publisher.GraphQLPublisher.__init__
+
+    def record_cookies(self, session_data, **kwargs):
+        sent.append([c['name'] for c in session_data['cookies']])
+        init(self, session_data, **kwargs)
+
+    monkeypatch.setattr(graphql_publisher.GraphQLPublisher, '__init__', record_cookies)
+    status = manager.check()
+    assert sent == [['refresh_token']]
+    assert status.valid and status.refreshed
+
+    saved = json.loads(path.read_text(encoding='utf-8'))
+    access = next(c for c in saved['cookies'] if c['name'] == 'access_token')
+    assert access['value'] == MOCK_TOKEN and access['expires'] > now
+    assert next(c for c in saved['cookies'] if c['name'] == 'refresh_token')['value'] == MOCK_REFRESH_TOKEN
+    assert manager.load() == saved
+
+
+def test_save_replaces_file_atomically(tmp_path):
+    path = write_session(tmp_path, session(cookie('access_token', 'old')))
+    manager = SessionManager(str(path))
+    manager.load()
+
+    manager._save(session(cookie('access_token', 'new')))
+    assert json.loads(path.read_text(encoding='utf-8'))['cookies'][0]['value'] == 'new'
+    assert [p.name for p in tmp_path.iterdir()] == ['velog_session.json']
+
+    # 직렬화 도중 실패해도 기존 파일은 그대로
+    with pytest.raises(TypeError):
+        manager._save({'cookies': [], 'timestamp': object()})
+    assert json.loads(path.read_text(encoding='utf-8'))['cookies'][0]['value'] == 'new'
+
+
+def test_status_description():
+    assert SessionStatus(True, 'ok', username='me').describe() == "✅ 세션 유효 (@me)"
+    assert SessionStatus(None, 'timeout').describe().startswith("⚠️")
+    assert SessionStatus(False, '만료', refreshed=True).describe() == "❌ 세션이 유효하지 않습니다: 만료 - 토큰을 갱신했습니다"
+    assert not SessionStatus(False, '만료').ok and SessionStatus(None, 'timeout').ok
@@ -0,0 +1,95 @@
+"""MinHash/LSH 유사 중복 인덱스"""
+
+import pytest
+
+from utils.similarity import SimilarityIndex, minhash_signature, shingles, estimate_similarity
+
+BODY = """# Redis 캐시 도입기
+
+서비스 응답 시간이 느려져서 조회가 많은 API 앞에 Redis 캐시를 두었습니다.
+만료 시간은 5분으로 정하고, 쓰기 요청이 오면 관련 키를 지우는 방식으로 일관성을 맞췄습니다.
+결과적으로 p95 지연 시간이 800ms에서 120ms로 줄었고 데이터베이스 부하도 절반으로 줄었습니다.
+"""
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SimilarityIndex(str(tmp_path / 'similarity.sqlite3'))
+    yield index
+    index.close()
+
+
+def test_signature_is_deterministic():
+    items = shingles(BODY)
+    assert minhash_signature(items) == minhash_signature(set(items))
+    assert estimate_similarity(minhash_signature(items), minhash_signature(items)) == 1.0
+
+
+def test_near_duplicate_is_found(index):
+    index.add({'title': 'Redis 캐시 도입기', 'content': BODY}, state='published', url='https://velog.io/@me/redis')
+    edited = BODY.replace('5분', '10분')
+    match = index.check({'title': 'Redis 캐시 도입 후기', 'content': edited})
+    assert match is not None
+    assert match['reason'] == 'content'
+    assert match['similarity'] >= index.threshold
+    assert match['url'] == 'https://velog.io/@me/redis'
+
+
+def test_same_title_is_found(index):
+    index.add({'title': 'Docker 입문 가이드', 'content': BODY})
+    match = index.check({'title': 'docker 입문 가이드!', 'content': '전혀 다른 내용의 글입니다. ' * 20})
+    assert match is not None and match['reason'] == 'title'
+
+
+def test_unrelated_post_is_not_matched(index):
+    index.add({'title': 'Redis 캐시 도입기', 'content': BODY})
+    other = '쿠버네티스 클러스터에서 롤링 업데이트 중 파드가 준비되기 전에 트래픽을 받는 문제를 readiness probe로 해결한 기록입니다. ' * 3
+    assert index.check({'title': '쿠버네티스 배포 회고', 'content': other}) is None
+
+
+def test_own_draft_is_ignored_and_promoted(index):
+    post = {'title': 'Redis 캐시 도입기', 'content': BODY}
+    post_id = index.add(post)
+    assert index.check(post) is None
+    assert index.add(post, state='published', url='https://velog.io/@me/redis') == post_id
+    assert index.count() == 1
+
+
+def test_add_many_commits_once(index):
+    posts = [{'title': f'글 {n}', 'content': f'{n}번째 글의 본문입니다. ' * 10} for n in range(5)]
+    commits = []
+    conn = index._conn
+    index._conn = type('Conn', (), {
+        'execute': lambda self, *args: conn.execute(*args),
+        'executemany': lambda self, *args: conn.executemany(*args),
+        'commit': lambda self: (commits.append(1), conn.commit()),
+        'rollback': lambda self: conn.rollback(),
+        'close': lambda self: conn.close(),
+    })()
+    ids = index.add_many(posts[:3] + [(posts[3], 'https://velog.io/@me/3'), posts[0]])
+    assert len(commits) == 1
+    # 같은 글은 한 번만 기록
+    assert ids[4] == ids[0] and len(set(ids)) == 4
+    assert index.check({'title': '글 3', 'content': '다른 본문'})['url'] == 'https://velog.io/@me/3'
+
+
+def test_crowded_band_reads_only_recent_candidates(tmp_path):
+    index = SimilarityIndex(str(tmp_path / 'similarity.sqlite3'), max_candidates=4, band_limit=2)
+    try:
+        index.add_many([{'title': f'Redis 캐시 도입기 {n}', 'content': BODY} for n in range(10)])
+        match = index.check({'title': 'Redis 캐시 정리', 'content': BODY})
+        # 같은 본문이 10개여도 밴드마다 최근 2개만 후보로 읽음
+        assert match['reason'] == 'content'
+        assert match['title'] in ('Redis 캐시 도입기 9', 'Redis 캐시 도입기 8')
+    finally:
+        index.close()
+
+
+def test_generator_does_not_record_drafts(index):
+    from utils.content_generator import ContentGenerator
+
+    generator = ContentGenerator(use_ai=False, use_cache=False, seed=3)
+    generator.similarity = index
+    generator.generate_basic_post('캐시 설계')
+    # 게시가 확인된 글만 기록 (VelogPoster.record_published)
+    assert index.count() == 0
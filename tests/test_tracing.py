@@ -0,0 +1,110 @@
+"""실행/단계 기록과 p50/p95 요약 CLI"""
+
+import asyncio
+import json
+
+import pytest
+
+from utils import tracing
+from utils.tracing import Tracer, percentile, summarize
+
+
+def read_records(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(n) for n in range(1, 21)]
+    assert percentile(values, 50) == 10.0
+    assert percentile(values, 95) == 19.0
+    assert percentile(values, 100) == 20.0
+    assert percentile([0.5], 95) == 0.5
+    assert percentile([], 50) == 0.0
+
+
+def test_disabled_tracer_writes_nothing():
+    tracer = Tracer()
+    with tracer.run('publish') as run:
+        with tracer.span('goto_write'):
+            pass
+        run.set(outcome='ok')
+    assert run is tracing._NULL
+
+
+def test_run_records_stages_attrs_and_errors(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    tracer = Tracer(str(path))
+    with tracer.run('publish', mode='single'):
+        with tracer.span('goto_write'):
+            pass
+        tracer.annotate(title='글')
+        # 진행 중인 실행 안의 run은 단계로 기록
+        with tracer.run('publish', index=0) as nested:
+            nested.set(outcome='failed')
+        with pytest.raises(ValueError):
+            with tracer.span('body_insert'):
+                raise ValueError('mismatch')
+
+    [record] = read_records(path)
+    assert record['kind'] == 'publish'
+    assert record['attrs'] == {'mode': 'single', 'title': '글', 'outcome': 'ok'}
+    assert [stage['name'] for stage in record['stages']] == ['goto_write', 'publish', 'body_insert']
+    assert record['stages'][1]['attrs'] == {'index': 0, 'outcome': 'failed'}
+    assert record['stages'][2]['attrs'] == {'error': 'ValueError'}
+
+
+def test_concurrent_tasks_keep_separate_runs(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    tracer = Tracer(str(path))
+
+    async def publish(index):
+        with tracer.run('publish', index=index):
+            await asyncio.sleep(0)
+            with tracer.span(f'step{index}'):
+                await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(publish(0), publish(1))
+
+    asyncio.run(main())
+    records = sorted(read_records(path), key=lambda r: r['attrs']['index'])
+    assert [[s['name'] for s in r['stages']] for r in records] == [['step0'], ['step1']]
+
+
+def write_trace(path, durations):
+    with open(path, 'w', encoding='utf-8') as f:
+        for total, tags in durations:
+            stages = [{'name': 'tags', 'duration': d} for d in tags]
+            f.write(json.dumps({'kind': 'publish', 'duration': total, 'stages': stages}) + '\n')
+        f.write('\n')
+
+
+def test_summarize_sums_repeated_stages_per_run(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    write_trace(path, [(1.0, [0.1, 0.2]), (2.0, [0.5]), (3.0, [0.25, 0.5])])
+
+    rows = {row['stage']: row for row in summarize(str(path))}
+    assert rows['(total)'] == {'kind': 'publish', 'stage': '(total)', 'count': 3,
+                               'p50': 2.0, 'p95': 3.0, 'max': 3.0}
+    assert rows['tags']['count'] == 3
+    # 실행별 합계 0.3, 0.5, 0.75
+    assert rows['tags']['p50'] == 0.5
+    assert rows['tags']['max'] == 0.75
+
+
+def test_summary_cli(tmp_path, capsys):
+    path = tmp_path / 'trace.jsonl'
+    write_trace(path, [(1.0, [0.1]), (2.0, [0.2])])
+
+    assert tracing.main([str(path)]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split() == ['kind', 'stage', 'n', 'p50(ms)', 'p95(ms)', 'max(ms)']
+    assert lines[2].split() == ['publish', '(total)', '2', '1000.0', '2000.0', '2000.0']
+    assert lines[3].split() == ['publish', 'tags', '2', '100.0', '200.0', '200.0']
+
+    assert tracing.main([]) == 1
+    empty = tmp_path / 'empty.jsonl'
+    empty.write_text('', encoding='utf-8')
+    assert tracing.main([str(empty)]) == 0
+    assert '기록이 없습니다.' in capsys.readouterr().out
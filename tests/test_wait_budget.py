@@ -0,0 +1,54 @@
+"""대기 조건별 제한 시간과 실제 대기 시간 누적"""
+
+import pytest
+
+from utils import wait_budget
+from utils.wait_budget import DEFAULT_BUDGETS, WaitBudget
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """measure가 읽는 perf_counter를 손으로 움직이는 시계로 교체"""
+    now = [100.0]
+    monkeypatch.setattr(wait_budget.time, 'perf_counter', lambda: now[0])
+    return now
+
+
+def test_overrides_keep_other_defaults():
+    budget = WaitBudget({'published_url': 20000})
+    assert budget.timeout('published_url') == 20000
+    assert budget.timeout('tag_chip') == DEFAULT_BUDGETS['tag_chip']
+    # 기본값 사전은 바뀌지 않음
+    assert DEFAULT_BUDGETS['published_url'] == 10000
+
+
+def test_measure_yields_timeout_and_accumulates(clock):
+    budget = WaitBudget()
+    for waited in (0.25, 0.5):
+        with budget.measure('tag_chip') as timeout:
+            assert timeout == DEFAULT_BUDGETS['tag_chip']
+            clock[0] += waited
+    with budget.measure('publish_modal'):
+        clock[0] += 1.0
+
+    assert budget.used == {'tag_chip': 0.75, 'publish_modal': 1.0}
+    assert budget.total() == 1.75
+    assert budget.last == 'publish_modal'
+    assert budget.report() == "⏱️  대기 시간 1.75s (tag_chip 0.75s/2.0s, publish_modal 1.00s/5.0s)"
+
+
+def test_failed_wait_is_still_recorded(clock):
+    budget = WaitBudget()
+    with pytest.raises(TimeoutError):
+        with budget.measure('published_url'):
+            clock[0] += 10.0
+            raise TimeoutError('published_url')
+    assert budget.used == {'published_url': 10.0}
+    assert budget.last == 'published_url'
+
+
+def test_unknown_condition_is_rejected():
+    budget = WaitBudget()
+    with pytest.raises(KeyError):
+        with budget.measure('not_a_condition'):
+            pass
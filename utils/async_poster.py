@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+playwright.async_api 기반 Velog 포스팅 엔진 (브라우저 게시 단계의 유일한 구현)
+하나의 브라우저 컨텍스트에서 여러 페이지를 열어 준비된 글을 동시에 게시
+VelogPoster(동기 API)는 BrowserPool의 전용 이벤트 루프에서 이 엔진을 실행하는 얇은 래퍼
+"""
+
+import asyncio
+import time
+from utils.editor_input import insert_body_async, clear_editor_async, EditorInputError
+from utils.markdown_check import analyze_markdown
+from utils.markdown_stream import StreamingContent
+from utils.wait_budget import WaitBudget
+from utils.tracing import tracer
+from utils import metrics
+from utils.browser_profile import BrowserProfile, PageStats
+from utils.browser_pool import AsyncBrowserPool
+from utils.selector_resolver import SelectorResolver, EDITOR_SELECTORS
+
+
+def publish_result(index, post_data, url, error=None, ambiguous=False, elapsed=0.0):
+    """게시 한 건의 결과 dict (브라우저/API 경로 공통)"""
+    return {
+        'index': index,
+        'title': post_data.get('title'),
+        'success': bool(url),
+        'url': url,
+        'error': error,
+        'ambiguous': ambiguous,
+        'elapsed': round(elapsed, 3),
+    }
+
+
+class PublishAttempt:
+    """페이지 하나에서 진행 중인 게시 한 건의 상태 (실패 기록과 결과 보고용)"""
+
+    __slots__ = ('budget', 'stats', 'stage', 'ambiguous')
+
+    def __init__(self, budget, stats):
+        self.budget = budget
+        self.stats = stats
+        # 실패를 판단한 단계 (없으면 마지막 대기 조건)
+        self.stage = None
+        # 최종 출간 버튼은 눌렀지만 결과를 확인하지 못함 (다시 게시하기 전에 게시 여부 확인 필요)
+        self.ambiguous = False
+
+
+class AsyncVelogPoster:
+    def __init__(self, session_data, concurrency=3, post_timeout=120, headless=True,
+                 wait_budgets=None, base_url='https://velog.io', profile=None, failures=None,
+                 selectors=None, prepare=None, on_published=None, pause=None, path='async'):
+        self.session_data = session_data
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = max(1, concurrency)
+        # 포스트 하나의 제한 시간(초), None이면 제한 없음
+        self.post_timeout = post_timeout
+        self.profile = profile or BrowserProfile(headless=headless)
+        self.headless = self.profile.headless
+        self.wait_budgets = wait_budgets
+        self.selectors = selectors if selectors is not None else SelectorResolver()
+        # 실패한 페이지의 진단 자료 저장 (FailureCapture, None이면 저장하지 않음)
+        self.failures = failures
+        # 본문 확정 후 게시 전에 스레드에서 호출 (post_data) → MarkdownReport, 이미지 업로드 등
+        self.prepare = prepare
+        # 게시가 확인된 글마다 호출 (post_data, url)
+        self.on_published = on_published
+        # 디버깅 실행에서 실패 화면을 닫기 전에 호출 (message), 보통 input
+        self.pause = pause
+        # 지표/추적에 남길 게시 경로 이름 (browser: 한 건/큐, async: 동시 게시)
+        self.path = path
+        self._outcomes = metrics.publish_outcomes(path)
+        # 페이지별 진행 상태
+        self._attempts = {}
+
+    async def publish_many(self, posts):
+        """
+        브라우저를 띄워 여러 포스트를 동시에 게시
+        결과는 입력 순서대로 [{'index', 'title', 'success', 'url', 'error', 'ambiguous', 'elapsed'}, ...]
+        """
+        if not posts:
+            return []
+        async with AsyncBrowserPool(self.session_data, profile=self.profile) as pool:
+            return await self.publish_all(pool, posts)
+
+    async def publish_all(self, pool, posts, verified=False):
+        """
+        이미 띄운 AsyncBrowserPool에서 여러 포스트를 최대 concurrency개씩 게시 (publish_many와 같은 결과)
+        verified=True면 HTTP로 확인한 세션이므로 메인 페이지 로그인 확인 생략
+        """
+        if not posts:
+            return []
+
+        if not verified:
+            # 로그인 확인은 한 번만
+            page = await pool.new_page()
+            try:
+                logged_in = await self.check_login(page)
+            finally:
+                await pool.recycle_page(page)
+            if not logged_in:
+                return [
+                    publish_result(index, post_data, None, '로그인 필요')
+                    for index, post_data in enumerate(posts)
+                ]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [
+            self._publish_with_limit(semaphore, pool, index, post_data)
+            for index, post_data in enumerate(posts)
+        ]
+        # gather는 입력 순서대로 결과를 돌려줌
+        return await asyncio.gather(*tasks)
+
+    async def _publish_with_limit(self, semaphore, pool, index, post_data):
+        async with semaphore:
+            started = time.perf_counter()
+            with tracer.run('publish', mode=self.path, index=index) as run:
+                with tracer.span('page_open'):
+                    page = await pool.new_page()
+                # 취소(CancelledError)는 Exception이 아니므로 finally에서 쓸 값을 먼저 정해 둠
+                url, error, cancelled = None, None, False
+                try:
+                    url = await asyncio.wait_for(
+                        self.publish_on_page(page, post_data),
+                        timeout=self.post_timeout
+                    )
+                    error = None if url else '게시 실패'
+                except asyncio.TimeoutError:
+                    error = f'시간 초과 ({self.post_timeout}s)'
+                except asyncio.CancelledError:
+                    cancelled, error = True, '취소됨'
+                    raise
+                except Exception as e:
+                    print(f"❌ 포스팅 중 오류 발생: {e}")
+                    error = str(e)
+                finally:
+                    success = bool(url)
+                    attempt = self._attempts.pop(page, None)
+                    ambiguous = bool(attempt and attempt.ambiguous) and not success
+                    if success:
+                        await self._end_trace(page)
+                    elif not cancelled:
+                        # 취소된 경우는 종료 중이므로 진단 자료를 남기지 않음
+                        await self._capture_failure(page, attempt, error)
+                    await pool.recycle_page(page)
+                outcome = 'ok' if success else ('ambiguous' if ambiguous else 'failed')
+                run.set(outcome=outcome, error=error)
+                self._outcomes[outcome].inc()
+
+            elapsed = time.perf_counter() - started
+            mark = '✅' if success else '❌'
+            print(f"{mark} [{index + 1}] {post_data['title']} ({elapsed:.1f}s)")
+            return publish_result(index, post_data, url, error, ambiguous, elapsed)
+
+    async def _capture_failure(self, page, attempt, error):
+        if self.failures is None:
+            return
+        budget = attempt.budget if attempt else None
+        stage = (attempt.stage if attempt else None) or (budget.last if budget else None) or 'goto_write'
+        timings = {k: round(v, 4) for k, v in budget.used.items()} if budget else {}
+        extra = {'network': attempt.stats.as_dict()} if attempt else None
+        metrics.FAILURE_CAPTURES.labels(stage).inc()
+        with tracer.span('failure_capture', stage=stage):
+            path = await self.failures.capture_async(page, stage, error=error, timings=timings, extra=extra)
+        if path:
+            tracer.annotate(failure_artifact=path, failure_stage=stage)
+
+    async def _end_trace(self, page):
+        if self.failures is not None:
+            await self.failures.end_async(page)
+
+    async def _pause(self, message):
+        if self.pause is not None:
+            await asyncio.to_thread(self.pause, message)
+
+    async def check_login(self, page):
+        """Velog 메인 페이지에서 로그인 상태 확인"""
+        print("📄 Velog에 접속 중...")
+        with tracer.span('goto_home'):
+            await page.goto(self.base_url, timeout=30000)
+        try:
+            with tracer.span('login_check'):
+                await page.wait_for_selector('a[href*="/@"]', timeout=5000)
+            print("✅ 로그인 상태 확인됨")
+            return True
+        except Exception:
+            tracer.annotate(outcome='login_required')
+            metrics.BROWSER_LOGIN_CHECK_FAILED.inc()
+            print("❌ 로그인이 필요합니다. python install.py를 다시 실행해주세요.")
+            return False
+
+    async def _find_editor(self, page, timeout):
+        """에디터 셀렉터를 순서대로 기다리지 않고 동시에 탐색 (지난번에 맞았던 셀렉터 우선)"""
+        return await self.selectors.resolve_async(page, 'editor', EDITOR_SELECTORS, timeout=timeout)
+
+    def _begin(self, page):
+        attempt = PublishAttempt(WaitBudget(self.wait_budgets), PageStats(self.profile).attach_async(page))
+        self._attempts[page] = attempt
+        return attempt
+
+    async def publish_on_page(self, page, post_data):
+        """글쓰기 페이지를 열어 포스트 하나를 게시, 게시된 글 주소 반환 (실패 시 None)"""
+        attempt = self._begin(page)
+        tracer.annotate(title=post_data['title'], tag_count=len(post_data['tags']))
+        if self.failures is not None:
+            await self.failures.begin_async(page)
+        try:
+            return await self._publish_steps(page, post_data, attempt)
+        finally:
+            tracer.annotate(
+                content_size=len(post_data['content']),
+                waits={k: round(v, 4) for k, v in attempt.budget.used.items()},
+                network=attempt.stats.as_dict()
+            )
+            print(f"   [{post_data['title']}] {attempt.budget.report()}")
+            print(f"   [{post_data['title']}] {attempt.stats.report()}")
+
+    async def _publish_steps(self, page, post_data, attempt):
+        # 글쓰기 페이지로 이동
+        print("✏️  글쓰기 페이지로 이동...")
+        with tracer.span('goto_write'):
+            await page.goto(f"{self.base_url}/write", timeout=30000)
+
+        # 제목 입력 (제목 입력창이 나타나면 에디터가 마운트된 것으로 판단)
+        print(f"📝 제목 입력: {post_data['title']}")
+        with tracer.span('title'):
+            with attempt.budget.measure('editor_mounted') as timeout:
+                title_input = await page.wait_for_selector('textarea[placeholder*="제목"]', timeout=timeout)
+            await title_input.fill(post_data['title'])
+
+        if isinstance(post_data['content'], StreamingContent):
+            # 본문이 생성되는 동안 태그를 먼저 입력
+            await self._fill_tags(page, post_data['tags'], attempt.budget)
+            await self._fill_body(page, post_data, attempt)
+        else:
+            await self._fill_body(page, post_data, attempt)
+            await self._fill_tags(page, post_data['tags'], attempt.budget)
+
+        return await self._submit_post(page, attempt, post_data)
+
+    async def _prepare(self, post_data):
+        """본문 확정 후 이미지/마크다운 정리 (prepare가 없으면 마크다운 정리만)"""
+        if self.prepare is not None:
+            return await asyncio.to_thread(self.prepare, post_data)
+        report = analyze_markdown(post_data['content'])
+        post_data['content'] = report.text
+        return report
+
+    async def _fill_body(self, page, post_data, attempt):
+        print("📄 본문 입력 중...")
+        editor, selector = None, None
+        try:
+            # 에디터 후보 셀렉터를 하나씩 기다리지 않고 동시에 탐색 (지난번에 맞았던 셀렉터 우선)
+            with tracer.span('editor_probe') as span:
+                hits = self.selectors.hits
+                with attempt.budget.measure('editor_probe') as timeout:
+                    selector, editor = await self._find_editor(page, timeout)
+                span.set(selector=selector, cached=self.selectors.hits > hits)
+        except Exception as e:
+            print(f"⚠️  에디터 탐색 중 오류: {e}")
+
+        # 스트리밍 생성 중이면 에디터를 찾은 뒤에야 본문 완성을 기다림
+        # (생성 실패는 빈 글이 게시되지 않도록 그대로 전달)
+        content = post_data['content']
+        if isinstance(content, StreamingContent):
+            with tracer.span('stream_wait'):
+                with attempt.budget.measure('stream_body') as timeout:
+                    post_data['content'] = await asyncio.to_thread(content.result, timeout / 1000)
+        report = await self._prepare(post_data)
+        content = post_data['content']
+
+        try:
+            with tracer.span('body_insert', size=len(content), chunks=len(report.chunks)) as span:
+                if editor:
+                    await editor.click()
+                    # 한 글자씩 입력하지 않고 일괄 입력 후 검증 (실패 시에만 type으로 대체)
+                    # 큰 본문은 블록 경계에서 나눈 조각을 차례로 입력
+                    method = await insert_body_async(page, editor, selector, content, chunks=report.chunks)
+                    print(f"✅ 본문 입력 완료 ({method})")
+                else:
+                    print("⚠️  에디터를 찾을 수 없어 키보드 입력 시도...")
+                    method = 'keyboard'
+                    await page.keyboard.type(content, delay=5)
+                span.set(method=method)
+        except EditorInputError:
+            # 본문이 달라진 채로 게시하지 않음
+            attempt.stage = 'body_mismatch'
+            raise
+        except Exception as e:
+            print(f"⚠️  본문 입력 중 오류: {e}")
+
+    async def _fill_tags(self, page, tags, budget):
+        # 고정 대기 대신 입력창이 비워질 때(태그가 등록될 때)까지 대기
+        print(f"🏷️  태그 입력: {', '.join(tags)}")
+        try:
+            with tracer.span('tags', count=len(tags)):
+                tag_input = await page.wait_for_selector('input[placeholder*="태그"]', timeout=5000)
+                for tag in tags:
+                    await tag_input.fill(tag)
+                    await page.keyboard.press('Enter')
+                    with budget.measure('tag_chip') as timeout:
+                        await page.wait_for_function("(el) => el.value === ''", arg=tag_input, timeout=timeout)
+            print("✅ 태그 입력 완료")
+        except Exception as e:
+            print(f"⚠️  태그 입력 실패: {e}")
+
+    async def _submit_post(self, page, attempt, post_data=None):
+        """출간하기 → 출간 모달 → 최종 버튼 클릭 후 글 주소로 이동했는지 확인 (새 글/수정 공통), 글 주소 반환"""
+        budget = attempt.budget
+        with tracer.span('publish_modal'):
+            # 수정 페이지에서는 버튼 이름이 '수정하기'
+            publish_button = await page.wait_for_selector(
+                'button:has-text("출간하기"), button:has-text("수정하기")', timeout=5000
+            )
+            await publish_button.click()
+
+            # 최종 출간하기 버튼 클릭 전 오버레이가 사라질 때까지 대기
+            try:
+                with budget.measure('overlay_gone') as timeout:
+                    await page.wait_for_selector('.sc-bilyIR', state='detached', timeout=timeout)
+            except Exception:
+                pass
+
+            # 출간 모달이 열리면 최종 출간하기 버튼이 보임
+            with budget.measure('publish_modal') as timeout:
+                final_publish_button = await page.wait_for_selector(
+                    'button[data-testid="publish"]', state='visible', timeout=timeout
+                )
+
+        if not (await final_publish_button.is_enabled() and await final_publish_button.is_visible()):
+            print("❌ 최종 출간하기 버튼이 비활성화 상태이거나 보이지 않습니다.")
+            attempt.stage = 'publish_button_disabled'
+            await self._pause("브라우저에서 직접 확인 후 엔터를 누르세요...")
+            return None
+
+        await final_publish_button.scroll_into_view_if_needed()
+        await final_publish_button.click()
+        # 여기부터는 실패로 보여도 실제로는 게시됐을 수 있음
+        attempt.ambiguous = True
+
+        # 게시 완료 시 /@username/... 으로 이동
+        try:
+            with tracer.span('publish_confirm'):
+                with budget.measure('published_url') as timeout:
+                    await page.wait_for_url("**/@*/**", timeout=timeout)
+        except Exception:
+            pass
+
+        if "/@" in page.url:
+            print("✅ 포스트가 성공적으로 게시되었습니다!")
+            tracer.annotate(post_url=page.url)
+            attempt.ambiguous = False
+            if post_data is not None and self.on_published is not None:
+                self.on_published(post_data, page.url)
+            return page.url
+
+        # 이동하지 않았다면 에러 메시지 확인
+        error_message = None
+        try:
+            with budget.measure('error_message') as timeout:
+                error_message = await page.wait_for_selector(
+                    'div:has-text("제목 또는 내용이 비어있습니다")', timeout=timeout
+                )
+        except Exception:
+            pass
+
+        if error_message:
+            attempt.ambiguous = False
+            print("❌ [에러] 제목 또는 내용이 비어있습니다. 실제로 포스팅이 되지 않았습니다.")
+            attempt.stage = 'empty_content_error'
+            await self._pause("디버깅을 위해 브라우저를 종료하려면 엔터를 누르세요...")
+            return None
+
+        print("❌ 포스트가 정상적으로 게시되지 않았습니다. 브라우저에서 직접 확인하세요.")
+        attempt.stage = 'publish_unconfirmed'
+        await self._pause("디버깅을 위해 브라우저를 종료하려면 엔터를 누르세요...")
+        return None
+
+    async def edit_post(self, pool, published, changes):
+        """
+        수정 페이지(/write?id=...)에서 바뀐 필드만 고쳐 다시 출간, 성공하면 글 주소 (실패 시 None)
+        changes는 diff_post 결과 (series는 호출 측에서 처리)
+        """
+        page = await pool.new_page()
+        attempt = self._begin(page)
+        url, error = None, None
+        try:
+            url = await self._edit_steps(page, published, changes, attempt)
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            self._attempts.pop(page, None)
+            if not url:
+                await self._capture_failure(page, attempt, error)
+            await pool.recycle_page(page)
+        return url
+
+    async def _edit_steps(self, page, published, changes, attempt):
+        budget = attempt.budget
+        with tracer.span('goto_edit'):
+            await page.goto(f"{self.base_url}/write?id={published['id']}", timeout=30000)
+        with budget.measure('editor_mounted') as timeout:
+            title_input = await page.wait_for_selector('textarea[placeholder*="제목"]', timeout=timeout)
+        if 'title' in changes:
+            await title_input.fill(changes['title'])
+
+        if 'body' in changes:
+            with budget.measure('editor_probe') as timeout:
+                selector, editor = await self._find_editor(page, timeout)
+            if not editor:
+                print("❌ 수정 페이지에서 에디터를 찾을 수 없습니다.")
+                attempt.stage = 'editor_missing'
+                return None
+            await clear_editor_async(page, selector)
+            report = analyze_markdown(changes['body'])
+            with tracer.span('body_insert', size=len(report.text), chunks=len(report.chunks)):
+                try:
+                    await insert_body_async(page, editor, selector, report.text, chunks=report.chunks)
+                except EditorInputError:
+                    attempt.stage = 'body_mismatch'
+                    raise
+
+        if 'tags' in changes:
+            existing = set(published.get('tags') or [])
+            if existing - set(changes['tags']):
+                print("⚠️  수정 페이지에서는 태그를 추가만 합니다 (삭제는 API로만 가능).")
+            await self._fill_tags(page, [t for t in changes['tags'] if t not in existing], budget)
+
+        return await self._submit_post(page, attempt)
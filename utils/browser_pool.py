@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+장시간 유지되는 Playwright 브라우저 풀
+브라우저와 인증된 컨텍스트를 한 번만 띄워두고 포스트마다 새 페이지만 발급
+
+게시 단계는 async API(AsyncVelogPoster) 하나로만 구현하므로 풀도 async API로 유지하고,
+동기 코드는 BrowserPool이 가진 전용 이벤트 루프에서 같은 풀과 게시 코루틴을 실행
+"""
+
+import asyncio
+
+from utils.browser_profile import BrowserProfile
+
+
+class AsyncBrowserPool:
+    def __init__(self, session_data, headless=True, profile=None):
+        self.session_data = session_data
+        self.profile = profile or BrowserProfile(headless=headless)
+        self.headless = self.profile.headless
+        self._playwright = None
+        self.browser = None
+        self.context = None
+        self._crashed = False
+        self.restarts = 0
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Playwright 드라이버와 브라우저 시작"""
+        if self._playwright is None:
+            # Playwright는 실제로 브라우저를 띄울 때만 import (--dry-run 등은 로드하지 않음)
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+        await self._launch()
+
+    async def _launch(self):
+        """브라우저 실행 후 세션 쿠키를 복원한 컨텍스트 생성"""
+        self.browser = await self._playwright.chromium.launch(**self.profile.launch_options())
+        self.browser.on('disconnected', self._on_crash)
+        self.context = await self.browser.new_context(
+            **self.profile.context_options(self.session_data.get('user_agent', ''))
+        )
+        await self.profile.install_async(self.context)
+
+        # 쿠키 복원
+        if 'cookies' in self.session_data:
+            await self.context.add_cookies(self.session_data['cookies'])
+
+        self._crashed = False
+
+    def _on_crash(self, *args):
+        self._crashed = True
+
+    def is_healthy(self):
+        """브라우저가 살아있는지 확인"""
+        return (
+            self.browser is not None
+            and not self._crashed
+            and self.browser.is_connected()
+        )
+
+    async def restart(self):
+        """브라우저가 죽었을 때 다시 실행"""
+        print("♻️  브라우저를 재시작합니다...")
+        await self._close_browser()
+        await self._launch()
+        self.restarts += 1
+
+    async def new_page(self):
+        """작업용 새 페이지 발급 (브라우저가 죽어 있으면 먼저 재시작)"""
+        if not self.is_healthy():
+            await self.restart()
+        page = await self.context.new_page()
+        page.on('crash', self._on_crash)
+        return page
+
+    async def recycle_page(self, page):
+        """사용이 끝났거나 실패한 페이지 정리"""
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception:
+            # 페이지를 닫지 못하면 브라우저 자체가 문제인 경우가 많음
+            self._crashed = True
+
+    async def _close_browser(self):
+        try:
+            if self.browser is not None:
+                await self.browser.close()
+        except Exception:
+            pass
+        self.browser = None
+        self.context = None
+
+    async def close(self):
+        """브라우저와 Playwright 드라이버 종료"""
+        await self._close_browser()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+class BrowserPool:
+    """
+    동기 코드용 브라우저 풀
+    전용 이벤트 루프에서 AsyncBrowserPool을 유지하고, run()으로 넘긴 코루틴을 그 루프에서 실행
+    (루프를 닫지 않고 계속 쓰므로 브라우저와 컨텍스트가 호출 사이에도 살아 있음)
+    """
+
+    def __init__(self, session_data, headless=True, profile=None):
+        self.pool = AsyncBrowserPool(session_data, headless=headless, profile=profile)
+        self.profile = self.pool.profile
+        self.headless = self.pool.headless
+        self._loop = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def restarts(self):
+        return self.pool.restarts
+
+    def start(self):
+        """이벤트 루프를 만들고 브라우저 시작"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        self.run(self.pool.start())
+
+    def run(self, coro):
+        """풀의 이벤트 루프에서 코루틴을 끝까지 실행하고 결과 반환"""
+        return self._loop.run_until_complete(coro)
+
+    def is_healthy(self):
+        return self.pool.is_healthy()
+
+    def close(self):
+        """브라우저와 Playwright 드라이버 종료 후 이벤트 루프 정리"""
+        if self._loop is None:
+            return
+        try:
+            self.run(self.pool.close())
+        finally:
+            self._loop.close()
+            self._loop = None
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+게시용 브라우저 프로필
+폼 입력에 필요 없는 리소스(이미지, 폰트, 미디어)와 분석/광고 도메인을 page.route로 차단하고,
+헤드리스 실행과 작은 뷰포트로 메모리/CPU 사용을 줄임
+포스트마다 전송량과 페이지 로드 시간을 PageStats로 기록
+"""
+
+import os
+import time
+from urllib.parse import urlparse
+
+DEFAULT_BLOCKED_TYPES = ('image', 'media', 'font')
+
+DEFAULT_BLOCKED_DOMAINS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'doubleclick.net',
+    'adservice.google.com',
+    'facebook.net',
+    'connect.facebook.net',
+    'hotjar.com',
+    'clarity.ms',
+    'sentry.io',
+    'kakao.com',
+    'daumcdn.net',
+)
+
+# block_third_party=True일 때 허용하는 Velog 도메인 (base_url 호스트는 자동 추가)
+FIRST_PARTY_DOMAINS = ('velog.io', 'velcdn.com')
+
+DEFAULT_VIEWPORT = (1280, 800)
+
+# 크롬 렌더러 메모리를 줄이는 실행 옵션
+LEAN_ARGS = (
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--mute-audio',
+    '--no-first-run',
+)
+
+
+def _split_env(name):
+    value = os.getenv(name)
+    if value is None:
+        return None
+    return tuple(item.strip() for item in value.split(',') if item.strip())
+
+
+def parse_viewport(value):
+    """'1280x800' → (1280, 800)"""
+    width, _, height = value.lower().partition('x')
+    return int(width), int(height)
+
+
+def _matches_domain(host, domains):
+    return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+
+class BrowserProfile:
+    def __init__(self, headless=True, viewport=DEFAULT_VIEWPORT,
+                 block_resource_types=DEFAULT_BLOCKED_TYPES,
+                 block_domains=DEFAULT_BLOCKED_DOMAINS,
+                 block_third_party=False, first_party_domains=FIRST_PARTY_DOMAINS):
+        self.headless = headless
+        self.viewport = viewport
+        self.block_resource_types = frozenset(block_resource_types or ())
+        self.block_domains = tuple(block_domains or ())
+        self.block_third_party = block_third_party
+        self.first_party_domains = tuple(first_party_domains)
+        # route 핸들러가 차단한 요청 수 (컨텍스트 전체 누적)
+        self.blocked = 0
+
+    @classmethod
+    def from_env(cls, headless=None, debug=False, base_url=None):
+        """
+        환경변수로 조정한 기본 프로필
+        VELOG_HEADED=1, VELOG_VIEWPORT=1280x800, VELOG_BLOCK_TYPES=image,font,
+        VELOG_BLOCK_DOMAINS=..., VELOG_BLOCK_THIRD_PARTY=1
+        debug=True면 창을 띄우고 아무것도 차단하지 않음 (화면으로 문제 확인용)
+        """
+        if debug:
+            return cls(headless=False, viewport=None, block_resource_types=(), block_domains=())
+
+        if headless is None:
+            headless = os.getenv('VELOG_HEADED', '') not in ('1', 'true', 'yes')
+        viewport = os.getenv('VELOG_VIEWPORT')
+        types = _split_env('VELOG_BLOCK_TYPES')
+        domains = _split_env('VELOG_BLOCK_DOMAINS')
+        first_party = FIRST_PARTY_DOMAINS
+        if base_url:
+            first_party += (urlparse(base_url).hostname or '',)
+        return cls(
+            headless=headless,
+            viewport=parse_viewport(viewport) if viewport else DEFAULT_VIEWPORT,
+            block_resource_types=DEFAULT_BLOCKED_TYPES if types is None else types,
+            block_domains=DEFAULT_BLOCKED_DOMAINS if domains is None else domains,
+            block_third_party=os.getenv('VELOG_BLOCK_THIRD_PARTY', '') in ('1', 'true', 'yes'),
+            first_party_domains=first_party,
+        )
+
+    @property
+    def blocking(self):
+        return bool(self.block_resource_types or self.block_domains or self.block_third_party)
+
+    def launch_options(self):
+        """chromium.launch(**options)"""
+        options = {'headless': self.headless}
+        if self.headless:
+            options['args'] = list(LEAN_ARGS)
+        return options
+
+    def context_options(self, user_agent=''):
+        """browser.new_context(**options)"""
+        options = {'user_agent': user_agent}
+        if self.viewport:
+            options['viewport'] = {'width': self.viewport[0], 'height': self.viewport[1]}
+        else:
+            options['no_viewport'] = True
+        return options
+
+    def should_block(self, resource_type, url):
+        if resource_type in self.block_resource_types:
+            return True
+        host = urlparse(url).hostname or ''
+        if not host:
+            return False
+        if self.block_domains and _matches_domain(host, self.block_domains):
+            return True
+        return self.block_third_party and not _matches_domain(host, self.first_party_domains)
+
+    def install(self, context):
+        """컨텍스트의 모든 요청에 차단 규칙 적용 (sync API)"""
+        if not self.blocking:
+            return
+
+        def handle(route):
+            request = route.request
+            if self.should_block(request.resource_type, request.url):
+                self.blocked += 1
+                route.abort()
+            else:
+                route.continue_()
+
+        context.route('**/*', handle)
+
+    async def install_async(self, context):
+        """install의 async API 버전"""
+        if not self.blocking:
+            return
+
+        async def handle(route):
+            request = route.request
+            if self.should_block(request.resource_type, request.url):
+                self.blocked += 1
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route('**/*', handle)
+
+
+class PageStats:
+    """
+    페이지 하나의 요청 수, 전송 바이트, 차단 수, 메인 프레임 로드 시간 기록
+    동시에 여러 페이지를 쓰는 경우 차단 수는 같은 프로필을 쓰는 다른 페이지 것도 섞일 수 있음
+    """
+
+    def __init__(self, profile=None):
+        self.profile = profile
+        self.requests = 0
+        self.bytes = 0
+        self.loads = []
+        self._blocked_start = profile.blocked if profile else 0
+        self._nav_started = None
+        self._nav_url = None
+
+    @property
+    def blocked(self):
+        return (self.profile.blocked - self._blocked_start) if self.profile else 0
+
+    def _on_request(self, request):
+        if request.is_navigation_request() and request.frame.parent_frame is None:
+            self._nav_started = time.perf_counter()
+            self._nav_url = request.url
+
+    def _on_load(self, *args):
+        if self._nav_started is not None:
+            path = urlparse(self._nav_url).path or '/'
+            self.loads.append((path, time.perf_counter() - self._nav_started))
+            self._nav_started = None
+
+    def _add_sizes(self, sizes):
+        self.requests += 1
+        self.bytes += (max(0, sizes.get('responseBodySize', 0))
+                       + max(0, sizes.get('responseHeadersSize', 0))
+                       + max(0, sizes.get('requestBodySize', 0))
+                       + max(0, sizes.get('requestHeadersSize', 0)))
+
+    def attach(self, page):
+        """sync API 페이지에 리스너 연결"""
+        page.on('request', self._on_request)
+        page.on('load', self._on_load)
+
+        def finished(request):
+            try:
+                self._add_sizes(request.sizes())
+            except Exception:
+                self.requests += 1
+
+        page.on('requestfinished', finished)
+        return self
+
+    def attach_async(self, page):
+        """async API 페이지에 리스너 연결"""
+        page.on('request', self._on_request)
+        page.on('load', self._on_load)
+
+        async def finished(request):
+            try:
+                self._add_sizes(await request.sizes())
+            except Exception:
+                self.requests += 1
+
+        page.on('requestfinished', finished)
+        return self
+
+    def as_dict(self):
+        return {
+            'requests': self.requests,
+            'bytes': self.bytes,
+            'blocked': self.blocked,
+            'loads': {path: round(seconds, 4) for path, seconds in self.loads},
+        }
+
+    def report(self):
+        loads = ', '.join(f"{path} {seconds * 1000:.0f}ms" for path, seconds in self.loads)
+        return (f"🌐 전송량 {self.bytes / 1024:.1f}KB (요청 {self.requests}개, 차단 {self.blocked}개)"
+                + (f", 페이지 로드 {loads}" if loads else ""))
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+AI 생성 결과 디스크 캐시 (SQLite)
+프롬프트/모델/temperature/max_tokens로 만든 해시를 키로 사용하고
+TTL 만료와 용량 기준 LRU 제거를 지원
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+DEFAULT_CACHE_FILE = '.velog_cache.sqlite3'
+
+
+def make_cache_key(prompt, model, temperature, max_tokens):
+    """요청 파라미터로 콘텐츠 주소 키 생성"""
+    payload = json.dumps({
+        'prompt': prompt,
+        'model': model,
+        'temperature': temperature,
+        'max_tokens': max_tokens,
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ContentCache:
+    def __init__(self, path=DEFAULT_CACHE_FILE, ttl=7 * 24 * 3600,
+                 max_entries=500, max_bytes=50 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS content_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_content_cache_accessed ON content_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        """캐시 조회 (만료된 항목은 삭제 후 None)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM content_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM content_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE content_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """캐시 저장 후 용량 한도를 넘으면 오래 쓰지 않은 항목부터 제거"""
+        now = time.time()
+        size = len(value.encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO content_cache (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM content_cache"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        # 최근 사용 순으로 훑으면서 한도 안에 들어오는 항목만 남김
+        # (accessed_at이 같은 항목은 나중에 저장한 것을 최근으로 보고, 시각이 아닌 행 단위로 제거)
+        keep, kept_bytes = 0, 0
+        for size, in self._conn.execute(
+            "SELECT size FROM content_cache ORDER BY accessed_at DESC, rowid DESC"
+        ):
+            if keep + 1 > self.max_entries or kept_bytes + size > self.max_bytes:
+                break
+            keep += 1
+            kept_bytes += size
+
+        self._conn.execute(
+            "DELETE FROM content_cache WHERE rowid IN ("
+            "SELECT rowid FROM content_cache ORDER BY accessed_at DESC, rowid DESC LIMIT -1 OFFSET ?)",
+            (keep,)
+        )
+
+    def purge_expired(self):
+        """만료된 항목 일괄 삭제"""
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM content_cache WHERE created_at < ?", (time.time() - self.ttl,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM content_cache")
+            self._conn.commit()
+
+    def stats(self):
+        """적중/미스 횟수와 저장 용량"""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM content_cache"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'bytes': total,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -4,63 +4,78 @@ Velog 자동 포스팅용 콘텐츠 생성기
 제목, 본문, 태그, 시리즈를 자동 생성
 """
 
-import random
-import requests
-import json
-from faker import Faker
+import os
+import time
+from utils.tracing import tracer
+from utils import metrics
+from utils.rate_limiter import RateLimiter, backoff_delay, is_retryable_status
+from utils.markdown_stream import StreamingContent
+from utils.templates import TemplateEngine, load_template_pack
+# AIGenerationError는 기존 import 경로(utils.content_generator) 그대로 사용 가능
+from utils.llm_backends import AIGenerationError, OpenAICompatibleBackend, DEFAULT_MODEL
 
-# 한글 콘텐츠 생성을 위한 Faker 인스턴스
-fake = Faker('ko_KR')
+# requests / faker / sqlite 캐시는 실제로 쓸 때만 import (미리보기·기본 생성 시작 속도)
 
 class ContentGenerator:
-    def __init__(self, use_ai=True, ai_api_key=None):
+    def __init__(self, use_ai=True, ai_api_key=None, cache=None, use_cache=True, ai_base_url=None,
+                 template_pack='default', seed=None, backend=None):
         self.use_ai = use_ai
         self.ai_api_key = ai_api_key
-        
-        self.tech_keywords = [
-            'Python', 'JavaScript', 'React', 'Vue', 'Django', 'Flask',
-            'FastAPI', 'Docker', 'Kubernetes', 'AWS', 'Git', 'Linux',
-            'API', 'Database', 'MongoDB', 'PostgreSQL', 'Redis', 'Nginx'
-        ]
-        
-        self.dev_topics = [
-            '개발 일지', '프로젝트 회고', '기술 정리', '학습 노트',
-            '트러블슈팅', '성능 최적화', '코드 리뷰', '아키텍처 설계'
-        ]
-        
-        self.available_tags = [
-            'Python', 'JavaScript', 'React', 'Vue', 'Django', 'Flask',
-            'Playwright', 'Velog', '자동화', 'GPT', '개발일지', 'API',
-            'Docker', 'AWS', 'Git', 'Linux', 'Database', 'Frontend',
-            'Backend', '웹개발', '데이터베이스', '성능최적화'
-        ]
-        
-        self.series_options = [
-            '개발자동화', 'Velog 자동화 실험', 'AI 포스팅 시리즈',
-            '개발 일기', '기술 탐구', '프로젝트 회고록'
-        ]
-    
+        # OpenAI 호환 API 주소 (로컬 대역 서버로 바꿀 수 있음, backend를 주지 않았을 때만 사용)
+        self.ai_base_url = ai_base_url or os.getenv('OPENAI_BASE_URL')
+        # 본문 생성 백엔드 (utils.llm_backends), 없으면 API 키가 있을 때 OpenAI 백엔드를 만들어 사용
+        self._backend = backend
+        self.max_tokens = 2000
+        self.temperature = 0.7
+        # AI 응답 디스크 캐시 (필요할 때 생성)
+        self.use_cache = use_cache
+        self._cache = cache
+
+        # 키워드/주제/태그/시리즈 목록과 템플릿은 템플릿 팩(utils/template_packs)에서 로드
+        # seed를 주면 같은 순서로 같은 포스트를 재현
+        self.templates = TemplateEngine(load_template_pack(template_pack), seed=seed)
+        pack = self.templates.pack
+        self.tech_keywords = pack.lists['tech']
+        self.dev_topics = pack.lists['topic']
+        self.available_tags = pack.lists['tags']
+        self.series_options = pack.lists['series']
+
+        # 유사 중복 인덱스 (utils.similarity.SimilarityIndex), 설정되면 비슷한 글이 이미 있는 초안을 다시 생성
+        self.similarity = None
+        self.max_regenerate = 3
+
+    @property
+    def backend(self):
+        if self._backend is None and self.ai_api_key:
+            self._backend = OpenAICompatibleBackend(model=DEFAULT_MODEL, base_url=self.ai_base_url,
+                                                    api_key=self.ai_api_key)
+        return self._backend
+
+    @property
+    def ai_enabled(self):
+        """AI로 본문을 생성하는지 (로컬/대역 백엔드는 API 키 없이도 사용)"""
+        return self.use_ai and (self._backend is not None or bool(self.ai_api_key))
+
     def generate_title(self):
         """자연스러운 개발 관련 제목 생성"""
-        patterns = [
-            f"{random.choice(self.tech_keywords)}로 {random.choice(['구현하는', '만드는', '개발하는'])} {fake.word()}",
-            f"{random.choice(self.dev_topics)}: {random.choice(self.tech_keywords)} {fake.word()}",
-            f"{fake.word()} {random.choice(['개발', '구현', '최적화'])} 경험 공유",
-            f"{random.choice(self.tech_keywords)} {random.choice(['입문', '심화', '활용'])} 가이드",
-            f"실무에서 배운 {random.choice(self.tech_keywords)} {fake.word()}"
-        ]
-        
-        return random.choice(patterns)
-    
-    def generate_ai_content(self, topic=None):
-        """AI를 이용한 고품질 콘텐츠 생성"""
-        if not self.use_ai or not self.ai_api_key:
-            return self.generate_basic_content()
-        
+        return self.templates.title()
+
+    @property
+    def cache(self):
+        """AI 응답 캐시 (use_cache=False면 None)"""
+        if not self.use_cache:
+            return None
+        if self._cache is None:
+            from utils.content_cache import ContentCache
+            self._cache = ContentCache()
+        return self._cache
+
+    def build_ai_prompt(self, topic=None):
+        """AI 요청 프롬프트 생성 (주제가 없으면 무작위 선택)"""
         if not topic:
-            topic = f"{random.choice(self.tech_keywords)} {random.choice(self.dev_topics)}"
+            topic = f"{self.templates.pick('tech')} {self.templates.pick('topic')}"
         
-        prompt = f"""
+        return f"""
 다음 주제로 개발 블로그 포스트를 마크다운 형식으로 작성해주세요:
 주제: {topic}
 
@@ -79,74 +94,109 @@ class ContentGenerator:
 - 결과 및 개선사항
 - 마무리 및 다음 계획
 """
-        
+
+    def request_ai_content(self, prompt, bypass_cache=False, limiter=None, max_retries=0):
+        """
+        AI 백엔드 호출 (실패 시 기본 콘텐츠로 대체하지 않고 AIGenerationError 발생)
+        limiter가 있으면 분당 요청/토큰 한도를 지키고, 429/5xx/네트워크 오류는 max_retries번까지 백오프 후 재시도
+        """
+        from utils.content_cache import make_cache_key
+
+        backend = self.backend
+        if backend is None:
+            raise AIGenerationError("AI 백엔드가 설정되지 않았습니다.")
+
+        cache = None if bypass_cache else self.cache
+        if cache is not None:
+            cache_key = make_cache_key(prompt, backend.cache_model, self.temperature, self.max_tokens)
+            cached = cache.get(cache_key)
+            tracer.annotate(cache_hit=cached is not None)
+            if cached is not None:
+                metrics.AI_CACHE_HIT.inc()
+                return cached
+            metrics.AI_CACHE_MISS.inc()
+
+        # 토큰 사용량 추정: 응답 최대치 + 프롬프트 길이 기반 근사
+        estimated_tokens = self.max_tokens + len(prompt) // 2
+
+        for attempt in range(max_retries + 1):
+            if limiter is not None:
+                limiter.acquire(estimated_tokens)
+
+            try:
+                with tracer.span('ai_request', backend=backend.name, model=backend.model, attempt=attempt) as span:
+                    try:
+                        content = backend.complete(prompt, self.max_tokens, self.temperature)
+                    except AIGenerationError as e:
+                        span.set(status=e.status_code)
+                        raise
+            except AIGenerationError as e:
+                if e.status_code is None:
+                    metrics.AI_REQUEST_NETWORK_ERROR.inc()
+                else:
+                    metrics.AI_REQUEST_HTTP_ERROR.inc()
+                retryable = e.status_code is None or is_retryable_status(e.status_code)
+                if retryable and attempt < max_retries:
+                    metrics.AI_RETRIES.inc()
+                    time.sleep(e.retry_after if e.retry_after is not None else backoff_delay(attempt))
+                    continue
+                raise
+
+            metrics.AI_REQUEST_OK.inc()
+            if cache is not None:
+                cache.put(cache_key, content)
+            return content
+
+    def stream_ai_content(self, topic=None):
+        """
+        AI 응답을 스트림으로 받아 텍스트 조각을 차례로 반환하는 제너레이터
+        첫 조각을 받기 전에 실패하면 기본 콘텐츠 전체를 한 조각으로 반환
+        """
+        if not self.ai_enabled:
+            yield self.generate_basic_content(topic)
+            return
+
+        received = False
         try:
-            # OpenAI API 호출 (예시)
-            headers = {
-                'Authorization': f'Bearer {self.ai_api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            data = {
-                'model': 'gpt-3.5-turbo',
-                'messages': [{'role': 'user', 'content': prompt}],
-                'max_tokens': 2000,
-                'temperature': 0.7
-            }
-            
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result['choices'][0]['message']['content']
-            else:
-                print(f"AI API 오류: {response.status_code}")
-                return self.generate_basic_content()
-                
+            for delta in self.backend.stream(self.build_ai_prompt(topic), self.max_tokens, self.temperature):
+                received = True
+                yield delta
         except Exception as e:
-            print(f"AI 콘텐츠 생성 실패: {e}")
-            return self.generate_basic_content()
-    
-    def generate_basic_content(self):
-        """기본 콘텐츠 생성 (AI 미사용 시)"""
-        paragraphs = []
-        
-        # 인트로 문단
-        intro_templates = [
-            f"# {random.choice(self.tech_keywords)} 프로젝트 경험\n\n오늘은 {random.choice(self.tech_keywords)}를 활용한 프로젝트를 진행했습니다.",
-            f"# {random.choice(self.dev_topics)} 정리\n\n최근 {random.choice(self.dev_topics)}를 정리하면서 느낀 점들을 공유하고자 합니다.",
-            f"# {random.choice(self.tech_keywords)} 개발 기록\n\n{random.choice(self.tech_keywords)} 관련 작업을 하면서 겪었던 경험을 기록해보겠습니다."
-        ]
-        paragraphs.append(random.choice(intro_templates))
-        
-        # 이미지 플레이스홀더 추가
-        paragraphs.append(f"![프로젝트 개요](https://via.placeholder.com/600x300?text={random.choice(self.tech_keywords)}+Project)")
-        
-        # 메인 콘텐츠 문단들 (2-3개)
-        main_content_count = random.randint(2, 3)
-        for i in range(main_content_count):
-            content_templates = [
-                f"## 주요 기능 구현\n\n이번 작업에서 가장 중요했던 부분은 **{random.choice(self.tech_keywords)}**의 핵심 기능을 제대로 활용하는 것이었습니다.\n\n```python\n# 예시 코드\ndef main_function():\n    return 'Hello World'\n```\n\n![구현 과정](https://via.placeholder.com/500x250?text=Implementation)",
-                f"## 문제 해결 과정\n\n{random.choice(self.tech_keywords)}를 사용하면서 새롭게 알게 된 점들을 정리해보겠습니다:\n\n- **성능 최적화** 방법\n- **에러 처리** 개선\n- **코드 품질** 향상\n\n![결과 화면](https://via.placeholder.com/400x200?text=Result)",
-                f"## 성능 개선 결과\n\n개발 과정에서 **{random.choice(['성능', '보안', '유지보수성'])}** 측면을 중점적으로 고려했습니다.\n\n> 💡 **팁**: 이런 방식으로 접근하면 더 효율적입니다.\n\n![성능 비교](https://via.placeholder.com/550x300?text=Performance+Chart)"
-            ]
-            paragraphs.append(random.choice(content_templates))
+            if received:
+                # 이미 일부를 내보낸 뒤라 기본 콘텐츠로 바꿀 수 없음
+                raise
+            print(f"AI 스트리밍 실패, 기본 콘텐츠로 대체: {e}")
+            metrics.AI_FALLBACK_STREAM_ERROR.inc()
+            yield self.generate_basic_content(topic)
+
+    def generate_ai_content(self, topic=None, bypass_cache=False):
+        """AI를 이용한 고품질 콘텐츠 생성 (같은 요청은 캐시에서 반환)"""
+        if not self.ai_enabled:
+            return self.generate_basic_content(topic)
         
-        # 마무리 문단
-        outro_templates = [
-            f"## 마무리\n\n이번 경험을 통해 **{random.choice(self.tech_keywords)}**에 대한 이해를 더욱 깊게 할 수 있었습니다. 다음에는 더 복잡한 기능도 시도해보고 싶습니다.\n\n![다음 계획](https://via.placeholder.com/400x150?text=Next+Plan)",
-            f"## 정리\n\n앞으로도 지속적으로 학습하고 기록하면서 개발 실력을 향상시켜 나가겠습니다.\n\n**관련 링크:**\n- [공식 문서](https://example.com)\n- [GitHub 저장소](https://github.com/example)",
-            f"## 마치며\n\n비슷한 작업을 하시는 분들께 도움이 되었으면 좋겠습니다. 궁금한 점이 있으시면 댓글로 남겨주세요!\n\n![마무리](https://via.placeholder.com/300x100?text=Thank+You)"
-        ]
-        paragraphs.append(random.choice(outro_templates))
+        prompt = self.build_ai_prompt(topic)
         
-        return '\n\n'.join(paragraphs)
+        try:
+            content = self.request_ai_content(prompt, bypass_cache=bypass_cache)
+            metrics.GENERATED_AI.inc()
+            return content
+        except AIGenerationError as e:
+            print(e)
+            tracer.annotate(fallback='basic', ai_status=e.status_code)
+            metrics.AI_FALLBACK_API_ERROR.inc()
+            return self.generate_basic_content(topic)
+        except Exception as e:
+            print(f"AI 콘텐츠 생성 실패: {e}")
+            tracer.annotate(fallback='basic', error=str(e))
+            metrics.AI_FALLBACK_ERROR.inc()
+            return self.generate_basic_content(topic)
     
+    @tracer.traced('basic_content')
+    def generate_basic_content(self, topic=None):
+        """기본 콘텐츠 생성 (AI 미사용 시, topic을 주면 주제를 제목과 본문에 사용)"""
+        metrics.GENERATED_BASIC.inc()
+        return self.templates.content(topic)
+
     def generate_content(self):
         """콘텐츠 생성 메인 메서드"""
         if self.use_ai:
@@ -156,26 +206,145 @@ class ContentGenerator:
     
     def generate_tags(self, count=3):
         """랜덤 태그 3개 선택"""
-        return random.sample(self.available_tags, min(count, len(self.available_tags)))
+        return self.templates.tags(count)
     
     def generate_series(self):
         """시리즈 이름 선택"""
-        return random.choice(self.series_options)
+        return self.templates.series()
     
     def set_ai_config(self, api_key):
-        """AI API 키 설정"""
+        """AI API 키 설정 (기본 OpenAI 백엔드는 새 키로 다시 만듦)"""
+        if isinstance(self._backend, OpenAICompatibleBackend) and self._backend.name == 'openai':
+            self._backend.close()
+            self._backend = None
         self.ai_api_key = api_key
         self.use_ai = True
     
     def generate_post(self, topic=None):
         """전체 포스트 데이터 생성"""
+        with tracer.run('generate', use_ai=self.use_ai) as run:
+            with tracer.span('title'):
+                title = self.generate_title()
+            with tracer.span('content'):
+                content = self.generate_content() if not topic else self.generate_ai_content(topic)
+            with tracer.span('tags_series'):
+                tags = self.generate_tags()
+                series = self.generate_series()
+            run.set(content_size=len(content))
+            post = {
+                'title': title,
+                'content': content,
+                'tags': tags,
+                'series': series
+            }
+            # 기본 콘텐츠는 싸게 다시 만들 수 있으므로 본문까지 다시 생성
+            basic = not self.ai_enabled
+            self.avoid_duplicates(post, (lambda: self.generate_basic_content(topic)) if basic else None)
+            return post
+
+    def avoid_duplicates(self, post, regenerate_content=None):
+        """
+        similarity 인덱스에 비슷한 글이 있으면 제목(과 regenerate_content가 있으면 본문)을 다시 생성
+        max_regenerate번 안에 벗어나지 못하면 경고만 남김 (인덱스에는 게시가 확인된 글만 기록)
+        마지막으로 찾은 비슷한 글 정보 반환 (없으면 None)
+        """
+        if self.similarity is None:
+            return None
+
+        with tracer.span('dedupe') as span:
+            match = None
+            for attempt in range(self.max_regenerate + 1):
+                match = self.similarity.check(post)
+                if match is None:
+                    break
+                if attempt == self.max_regenerate:
+                    print(f"⚠️  비슷한 글이 이미 있습니다 ({match['similarity']:.0%}, {match['reason']}): {match['title']}")
+                    break
+                post['title'] = self.generate_title()
+                if match['reason'] == 'content' and regenerate_content is not None:
+                    post['content'] = regenerate_content()
+            span.set(regenerated=attempt, similar=match and round(match['similarity'], 3))
+        return match
+
+    def generate_basic_post(self, topic=None):
+        """
+        AI 없이 기본 템플릿으로 포스트 하나 생성 (AI 생성이 실패했을 때의 대체용)
+        generate_post와 같이 유사 중복 인덱스를 거쳐 비슷한 글이 있으면 제목과 본문을 다시 생성
+        """
+        post = {
+            'title': self.generate_title(),
+            'content': self.generate_basic_content(topic),
+            'tags': self.generate_tags(),
+            'series': self.generate_series()
+        }
+        self.avoid_duplicates(post, lambda: self.generate_basic_content(topic))
+        return post
+
+    def generate_basic_batch(self, count):
+        """
+        AI 없이 기본 템플릿 포스트를 대량 생성 (하위 단계 부하 테스트용)
+        트레이싱 없이 템플릿 엔진만 사용하므로 초당 수천 개 수준
+        """
+        return self.templates.batch(count)
+
+    def generate_post_streaming(self, topic=None, on_section=None):
+        """
+        본문을 스트리밍으로 생성하는 포스트 데이터
+        제목/태그/시리즈는 즉시 채우고 content는 StreamingContent(백그라운드 생성)로 반환
+        """
         return {
             'title': self.generate_title(),
-            'content': self.generate_content() if not topic else self.generate_ai_content(topic),
+            'content': StreamingContent(self.stream_ai_content(topic), on_section=on_section),
             'tags': self.generate_tags(),
             'series': self.generate_series()
         }
 
+    def generate_posts(self, topics, concurrency=4, requests_per_minute=60,
+                       tokens_per_minute=90000, max_retries=4):
+        """
+        여러 주제의 포스트를 동시에 생성
+        AI 모드에서는 실패해도 기본 콘텐츠로 대체하지 않고 항목별 오류를 기록
+        결과는 입력 순서대로 [{'topic', 'post', 'error'}, ...] 형태로 반환
+        """
+        limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        if self.ai_enabled:
+            # 캐시 연결은 스레드 시작 전에 한 번만 생성 (AI를 쓰지 않으면 캐시 파일을 만들지 않음)
+            self.cache
+
+        def generate_one(topic):
+            if not self.ai_enabled:
+                # 기본 템플릿도 주제를 본문에 반영
+                return {'topic': topic, 'post': self.generate_post(topic), 'error': None}
+
+            with tracer.run('generate', use_ai=True, batch=True) as run:
+                try:
+                    content = self.request_ai_content(
+                        self.build_ai_prompt(topic),
+                        limiter=limiter,
+                        max_retries=max_retries
+                    )
+                except Exception as e:
+                    run.set(outcome='failed', error=str(e))
+                    return {'topic': topic, 'post': None, 'error': str(e)}
+
+                run.set(content_size=len(content))
+                metrics.GENERATED_AI.inc()
+                post = {
+                    'title': self.generate_title(),
+                    'content': content,
+                    'tags': self.generate_tags(),
+                    'series': self.generate_series()
+                }
+                # AI 본문은 다시 요청하지 않고 제목만 바꾸거나 경고
+                self.avoid_duplicates(post)
+                return {'topic': topic, 'post': post, 'error': None}
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            # map은 입력 순서대로 결과를 돌려줌
+            return list(executor.map(generate_one, topics))
+
 # 테스트용 실행 코드
 if __name__ == "__main__":
     generator = ContentGenerator()
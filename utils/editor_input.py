@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Velog 에디터 본문 일괄 입력기
+키 입력을 한 글자씩 보내는 대신 에디터 API / insertText / 붙여넣기 이벤트로
+본문을 한 번에 넣고, 최종 내용이 원문과 일치하는지 검증
+큰 본문은 블록 경계에서 나눈 조각(chunks)을 차례로 넣고 조각마다 렌더링 프레임을 양보
+"""
+
+
+class EditorInputError(Exception):
+    """모든 입력 방식으로 넣은 본문이 원문과 일치하지 않는 경우"""
+
+
+# 에디터 종류별로 현재 내용을 읽어오는 스크립트
+# (CodeMirror 5 인스턴스 → textarea → contenteditable 순서)
+READ_EDITOR_JS = """
+(selector) => {
+    const cm = document.querySelector('.CodeMirror');
+    if (cm && cm.CodeMirror) {
+        return cm.CodeMirror.getValue();
+    }
+    const el = document.querySelector(selector);
+    if (!el) {
+        return null;
+    }
+    if (el.tagName === 'TEXTAREA' || el.tagName === 'INPUT') {
+        return el.value;
+    }
+    return el.innerText;
+}
+"""
+
+# CodeMirror 인스턴스가 있으면 setValue로 한 번에 교체
+SET_CODEMIRROR_JS = """
+(content) => {
+    const cm = document.querySelector('.CodeMirror');
+    if (!cm || !cm.CodeMirror) {
+        return false;
+    }
+    cm.CodeMirror.setValue(content);
+    cm.CodeMirror.focus();
+    cm.CodeMirror.execCommand('goDocEnd');
+    return true;
+}
+"""
+
+# ClipboardEvent를 합성하여 에디터의 붙여넣기 핸들러에 전달
+PASTE_JS = """
+([selector, content]) => {
+    const el = document.querySelector(selector);
+    if (!el) {
+        return false;
+    }
+    el.focus();
+    const data = new DataTransfer();
+    data.setData('text/plain', content);
+    const event = new ClipboardEvent('paste', {
+        clipboardData: data,
+        bubbles: true,
+        cancelable: true
+    });
+    el.dispatchEvent(event);
+    return true;
+}
+"""
+
+# 기존 내용을 지우는 스크립트 (재시도 전 초기화용)
+CLEAR_EDITOR_JS = """
+(selector) => {
+    const cm = document.querySelector('.CodeMirror');
+    if (cm && cm.CodeMirror) {
+        cm.CodeMirror.setValue('');
+        return true;
+    }
+    const el = document.querySelector(selector);
+    if (!el) {
+        return false;
+    }
+    if (el.tagName === 'TEXTAREA' || el.tagName === 'INPUT') {
+        el.value = '';
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+    } else {
+        el.innerHTML = '';
+    }
+    return true;
+}
+"""
+
+
+# 다음 애니메이션 프레임까지 대기 (조각 입력 사이에 에디터가 렌더링할 시간을 줌)
+NEXT_FRAME_JS = """
+() => new Promise((resolve) => requestAnimationFrame(() => resolve(true)))
+"""
+
+
+def normalize_newlines(text):
+    """에디터마다 다른 줄바꿈 표현(\\r\\n)을 \\n으로 통일"""
+    if text is None:
+        return None
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def read_editor_content(page, selector):
+    """에디터의 현재 내용 읽기"""
+    try:
+        return normalize_newlines(page.evaluate(READ_EDITOR_JS, selector))
+    except Exception:
+        return None
+
+
+def content_matches(page, selector, content):
+    """에디터 내용이 원문과 정확히 일치하는지 확인"""
+    actual = read_editor_content(page, selector)
+    if actual is None:
+        return False
+    return actual.rstrip('\n') == normalize_newlines(content).rstrip('\n')
+
+
+def clear_editor(page, selector):
+    """에디터 내용 초기화"""
+    try:
+        return bool(page.evaluate(CLEAR_EDITOR_JS, selector))
+    except Exception:
+        return False
+
+
+def _insert_codemirror(page, editor, selector, chunks):
+    # setValue는 한 번만 렌더링하므로 조각으로 나누지 않음
+    return bool(page.evaluate(SET_CODEMIRROR_JS, ''.join(chunks)))
+
+
+def _insert_text(page, editor, selector, chunks):
+    editor.click()
+    for index, chunk in enumerate(chunks):
+        if index:
+            page.evaluate(NEXT_FRAME_JS)
+        page.keyboard.insert_text(chunk)
+    return True
+
+
+def _insert_paste(page, editor, selector, chunks):
+    for index, chunk in enumerate(chunks):
+        if index:
+            page.evaluate(NEXT_FRAME_JS)
+        if not page.evaluate(PASTE_JS, [selector, chunk]):
+            return False
+    return True
+
+
+# 빠른 순서대로 시도할 일괄 입력 전략
+BULK_STRATEGIES = [
+    ('codemirror', _insert_codemirror),
+    ('insert_text', _insert_text),
+    ('paste', _insert_paste),
+]
+
+
+def insert_body(page, editor, selector, content, type_delay=5, chunks=None):
+    """
+    본문을 일괄 입력하고 검증
+    chunks(''.join(chunks) == content)를 주면 조각 단위로 입력하고 검증은 마지막에 한 번만
+    모든 일괄 입력 전략이 검증에 실패한 경우에만 기존 방식(한 글자씩 입력)으로 대체
+    사용한 전략 이름을 반환, 한 글자씩 입력한 결과도 일치하지 않으면 EditorInputError
+    """
+    chunks = chunks or [content]
+    for name, strategy in BULK_STRATEGIES:
+        try:
+            if not strategy(page, editor, selector, chunks):
+                continue
+        except Exception as e:
+            print(f"⚠️  본문 일괄 입력 실패 ({name}): {e}")
+            clear_editor(page, selector)
+            continue
+
+        if content_matches(page, selector, content):
+            return name
+
+        print(f"⚠️  본문 검증 불일치 ({name}), 다른 방식으로 재시도...")
+        clear_editor(page, selector)
+
+    # 최후의 수단: 키 입력 방식 (자동 들여쓰기 등으로 바뀔 수 있으므로 똑같이 검증)
+    editor.click()
+    editor.type(content, delay=type_delay)
+    if not content_matches(page, selector, content):
+        raise EditorInputError("본문 입력 결과가 원문과 일치하지 않습니다 (type)")
+    return 'type'
+
+
+# ---- playwright.async_api 용 ----
+
+async def read_editor_content_async(page, selector):
+    """에디터의 현재 내용 읽기 (async)"""
+    try:
+        return normalize_newlines(await page.evaluate(READ_EDITOR_JS, selector))
+    except Exception:
+        return None
+
+
+async def content_matches_async(page, selector, content):
+    """에디터 내용이 원문과 정확히 일치하는지 확인 (async)"""
+    actual = await read_editor_content_async(page, selector)
+    if actual is None:
+        return False
+    return actual.rstrip('\n') == normalize_newlines(content).rstrip('\n')
+
+
+async def clear_editor_async(page, selector):
+    """에디터 내용 초기화 (async)"""
+    try:
+        return bool(await page.evaluate(CLEAR_EDITOR_JS, selector))
+    except Exception:
+        return False
+
+
+async def _insert_codemirror_async(page, editor, selector, chunks):
+    return bool(await page.evaluate(SET_CODEMIRROR_JS, ''.join(chunks)))
+
+
+async def _insert_text_async(page, editor, selector, chunks):
+    await editor.click()
+    for index, chunk in enumerate(chunks):
+        if index:
+            await page.evaluate(NEXT_FRAME_JS)
+        await page.keyboard.insert_text(chunk)
+    return True
+
+
+async def _insert_paste_async(page, editor, selector, chunks):
+    for index, chunk in enumerate(chunks):
+        if index:
+            await page.evaluate(NEXT_FRAME_JS)
+        if not await page.evaluate(PASTE_JS, [selector, chunk]):
+            return False
+    return True
+
+
+ASYNC_BULK_STRATEGIES = [
+    ('codemirror', _insert_codemirror_async),
+    ('insert_text', _insert_text_async),
+    ('paste', _insert_paste_async),
+]
+
+
+async def insert_body_async(page, editor, selector, content, type_delay=5, chunks=None):
+    """insert_body의 async 버전"""
+    chunks = chunks or [content]
+    for name, strategy in ASYNC_BULK_STRATEGIES:
+        try:
+            if not await strategy(page, editor, selector, chunks):
+                continue
+        except Exception as e:
+            print(f"⚠️  본문 일괄 입력 실패 ({name}): {e}")
+            await clear_editor_async(page, selector)
+            continue
+
+        if await content_matches_async(page, selector, content):
+            return name
+
+        print(f"⚠️  본문 검증 불일치 ({name}), 다른 방식으로 재시도...")
+        await clear_editor_async(page, selector)
+
+    await editor.click()
+    await editor.type(content, delay=type_delay)
+    if not await content_matches_async(page, selector, content):
+        raise EditorInputError("본문 입력 결과가 원문과 일치하지 않습니다 (type)")
+    return 'type'
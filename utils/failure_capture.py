@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+게시 실패 시 진단 자료 저장 (입력 대기 없이)
+실패한 단계 이름, 대기 시간, 스크린샷, DOM, 콘솔 로그, (선택) Playwright trace를 zip 하나로 묶어
+개수/용량 한도가 있는 링 디렉터리에 저장하고 오래된 것부터 지움
+성공한 게시에서는 아무것도 하지 않음 (콘솔 로그도 실패했을 때 페이지 버퍼에서 읽음)
+
+환경변수: VELOG_FAILURE_DIR, VELOG_FAILURE_MAX(개수), VELOG_FAILURE_MAX_MB, VELOG_TRACE=1
+"""
+
+import os
+import json
+import time
+
+DEFAULT_FAILURE_DIR = 'velog_failures'
+DEFAULT_MAX_ENTRIES = 20
+DEFAULT_MAX_MB = 50
+# 이 시간(초)보다 오래된 .tmp는 저장 도중 죽은 프로세스가 남긴 것으로 보고 정리
+STALE_TMP_SECONDS = 600
+
+
+async def _console_lines_async(page):
+    """페이지가 보관 중인 최근 콘솔 메시지와 페이지 오류 (Playwright 1.56+)"""
+    lines = []
+    try:
+        for message in await page.console_messages():
+            lines.append(f"[{message.type}] {message.text}")
+        for error in await page.page_errors():
+            lines.append(f"[pageerror] {error}")
+    except AttributeError:
+        lines.append("(이 Playwright 버전은 console_messages를 지원하지 않습니다)")
+    except Exception as e:
+        lines.append(f"(콘솔 로그를 읽지 못했습니다: {e})")
+    return lines
+
+
+class FailureCapture:
+    def __init__(self, root=DEFAULT_FAILURE_DIR, max_entries=DEFAULT_MAX_ENTRIES,
+                 max_bytes=DEFAULT_MAX_MB * 1024 * 1024, trace=False):
+        self.root = root
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        # True면 게시마다 trace 조각을 기록하고 실패했을 때만 저장 (성공 시 버림)
+        self.trace = trace
+        self.captured = 0
+
+    @classmethod
+    def from_env(cls, trace=None):
+        return cls(
+            root=os.getenv('VELOG_FAILURE_DIR') or DEFAULT_FAILURE_DIR,
+            max_entries=int(os.getenv('VELOG_FAILURE_MAX') or DEFAULT_MAX_ENTRIES),
+            max_bytes=float(os.getenv('VELOG_FAILURE_MAX_MB') or DEFAULT_MAX_MB) * 1024 * 1024,
+            trace=os.getenv('VELOG_TRACE', '') in ('1', 'true', 'yes') if trace is None else trace,
+        )
+
+    # -- trace ----------------------------------------------------------
+
+    async def begin_async(self, page):
+        """게시 한 건 시작 (trace를 켠 경우에만 trace 조각 시작)"""
+        if not self.trace:
+            return
+        tracing = page.context.tracing
+        try:
+            await tracing.start(screenshots=True, snapshots=True)
+        except Exception:
+            # 같은 컨텍스트에서 이미 시작됨 (BrowserPool): 새 조각만 시작
+            try:
+                await tracing.start_chunk()
+            except Exception:
+                pass
+
+    async def end_async(self, page):
+        """성공한 게시의 trace 조각 버림"""
+        if not self.trace:
+            return
+        try:
+            await page.context.tracing.stop_chunk()
+        except Exception:
+            pass
+
+    async def _trace_bytes_async(self, page):
+        if not self.trace:
+            return None
+        path = os.path.join(self.root, f".trace-{os.urandom(8).hex()}.zip")
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            await page.context.tracing.stop_chunk(path=path)
+            with open(path, 'rb') as f:
+                return f.read()
+        except Exception:
+            return None
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+    # -- 저장 --------------------------------------------------------------
+
+    @staticmethod
+    def _meta(page, stage, error, timings, extra):
+        try:
+            url = page.url
+        except Exception:
+            url = None
+        meta = {
+            'stage': stage,
+            'error': str(error) if error else None,
+            'url': url,
+            'captured_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'timings': timings or {},
+        }
+        meta.update(extra or {})
+        return meta
+
+    async def capture_async(self, page, stage, error=None, timings=None, extra=None):
+        """실패한 페이지의 진단 자료를 저장하고 zip 경로 반환 (저장 자체가 실패해도 예외를 내지 않음)"""
+        files = {}
+        try:
+            files['screenshot.jpg'] = await page.screenshot(type='jpeg', quality=60, timeout=5000)
+        except Exception as e:
+            files['screenshot_error.txt'] = str(e)
+        try:
+            files['dom.html'] = await page.content()
+        except Exception as e:
+            files['dom_error.txt'] = str(e)
+        files['console.log'] = '\n'.join(await _console_lines_async(page))
+        trace = await self._trace_bytes_async(page)
+        if trace:
+            files['trace.zip'] = trace
+        return self._write(self._meta(page, stage, error, timings, extra), files)
+
+    def _write(self, meta, files):
+        # zipfile은 압축 모듈까지 불러오므로 실패했을 때만 import (시작 속도)
+        import zipfile
+
+        stage = ''.join(c if c.isalnum() or c in '-_' else '_' for c in meta['stage'] or 'unknown')
+        now = time.time()
+        name = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}{int(now % 1 * 1000):03d}-{stage}-{os.urandom(3).hex()}.zip"
+        path = os.path.join(self.root, name)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr('meta.json', json.dumps(meta, indent=2, ensure_ascii=False))
+                for filename, data in files.items():
+                    # 이미 압축된 형식은 다시 압축하지 않음
+                    compress = zipfile.ZIP_STORED if filename.endswith(('.jpg', '.zip')) else zipfile.ZIP_DEFLATED
+                    archive.writestr(filename, data, compress_type=compress)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠️  실패 기록 저장 실패: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return None
+        self.captured += 1
+        self._prune()
+        print(f"🧾 실패 기록 저장: {path} (단계: {meta['stage']})")
+        return path
+
+    def entries(self):
+        """저장된 실패 기록 [(경로, 크기), ...] 오래된 것부터"""
+        try:
+            names = [n for n in os.listdir(self.root) if n.endswith('.zip') and not n.startswith('.')]
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            path = os.path.join(self.root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, path, stat.st_size))
+        entries.sort()
+        return [(path, size) for _, path, size in entries]
+
+    def _prune(self):
+        """개수/용량 한도를 넘으면 오래된 기록부터 삭제 (가장 최근 기록은 항상 남김)"""
+        entries = self.entries()
+        total = sum(size for _, size in entries)
+        while len(entries) > 1 and (len(entries) > self.max_entries or total > self.max_bytes):
+            path, size = entries.pop(0)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        self._remove_stale_tmp()
+
+    def _remove_stale_tmp(self):
+        """저장 도중 중단돼 남은 .tmp 정리 (다른 프로세스가 쓰는 중일 수 있는 최근 파일은 남김)"""
+        cutoff = time.time() - STALE_TMP_SECONDS
+        try:
+            names = [n for n in os.listdir(self.root) if n.endswith('.zip.tmp')]
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.root, name)
+            try:
+                if os.stat(path).st_mtime < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
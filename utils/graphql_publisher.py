@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+브라우저 없이 Velog GraphQL API로 포스트 게시
+install.py가 저장한 세션 쿠키를 keep-alive requests.Session에 실어 writePost 뮤테이션 호출
+"""
+
+import os
+import re
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_GRAPHQL_URL = 'https://v2.velog.io/graphql'
+
+CURRENT_USER_QUERY = """
+query CurrentUser {
+  auth {
+    id
+    username
+  }
+}
+"""
+
+SERIES_LIST_QUERY = """
+query SeriesList($username: String) {
+  seriesList(username: $username) {
+    id
+    name
+    url_slug
+  }
+}
+"""
+
+CREATE_SERIES_MUTATION = """
+mutation CreateSeries($name: String!, $url_slug: String!) {
+  createSeries(name: $name, url_slug: $url_slug) {
+    id
+    name
+    url_slug
+  }
+}
+"""
+
+READ_POST_QUERY = """
+query ReadPost($username: String, $url_slug: String) {
+  post(username: $username, url_slug: $url_slug) {
+    id
+    url_slug
+  }
+}
+"""
+
+# 목록 조회 (본문 제외, 커서 = 이전 페이지 마지막 글 id, 최신 글부터)
+POSTS_QUERY = """
+query Posts($username: String, $cursor: ID, $limit: Int) {
+  posts(username: $username, cursor: $cursor, limit: $limit) {
+    id
+    title
+    url_slug
+    released_at
+    updated_at
+    tags
+  }
+}
+"""
+
+READ_POST_DETAIL_QUERY = """
+query ReadPostDetail($id: ID, $username: String, $url_slug: String) {
+  post(id: $id, username: $username, url_slug: $url_slug) {
+    id
+    title
+    body
+    tags
+    url_slug
+    is_private
+    thumbnail
+    meta
+    released_at
+    updated_at
+    series {
+      id
+      name
+    }
+  }
+}
+"""
+
+WRITE_POST_MUTATION = """
+mutation WritePost($title: String, $body: String, $tags: [String], $is_markdown: Boolean,
+                   $is_temp: Boolean, $is_private: Boolean, $url_slug: String,
+                   $thumbnail: String, $meta: JSON, $series_id: ID) {
+  writePost(title: $title, body: $body, tags: $tags, is_markdown: $is_markdown,
+            is_temp: $is_temp, is_private: $is_private, url_slug: $url_slug,
+            thumbnail: $thumbnail, meta: $meta, series_id: $series_id) {
+    id
+    user {
+      id
+      username
+    }
+    url_slug
+  }
+}
+"""
+
+
+# editPost는 넘긴 인자로 글의 필드를 모두 덮어쓰므로(빠진 인자는 빈 값) 항상 전체 필드를 전송
+EDIT_POST_MUTATION = """
+mutation EditPost($id: ID!, $title: String, $body: String, $tags: [String], $is_markdown: Boolean,
+                  $is_temp: Boolean, $is_private: Boolean, $url_slug: String,
+                  $thumbnail: String, $meta: JSON, $series_id: ID) {
+  editPost(id: $id, title: $title, body: $body, tags: $tags, is_markdown: $is_markdown,
+           is_temp: $is_temp, is_private: $is_private, url_slug: $url_slug,
+           thumbnail: $thumbnail, meta: $meta, series_id: $series_id) {
+    id
+    user {
+      id
+      username
+    }
+    url_slug
+    updated_at
+  }
+}
+"""
+
+
+class GraphQLError(Exception):
+    """GraphQL 응답에 errors가 포함된 경우"""
+
+
+class SessionExpiredError(GraphQLError):
+    """인증 토큰이 만료되었거나 없는 경우"""
+
+
+class PublishUnconfirmedError(GraphQLError):
+    """writePost 요청은 보냈지만 응답으로 게시 여부를 확인하지 못한 경우 (서버에는 저장됐을 수 있음)"""
+
+
+def make_url_slug(title):
+    """제목으로 Velog 스타일 url_slug 생성 (공백 → -, 특수문자 제거)"""
+    slug = re.sub(r'[^\w\s-]', '', title, flags=re.UNICODE).strip().lower()
+    return re.sub(r'[\s_]+', '-', slug)
+
+
+class GraphQLPublisher:
+    def __init__(self, session_data, endpoint=None, base_url=None, timeout=10, pool_size=4):
+        self.endpoint = endpoint or os.getenv('VELOG_GRAPHQL_URL') or self._endpoint_for(base_url)
+        self.base_url = (base_url or 'https://velog.io').rstrip('/')
+        self.timeout = timeout
+        self._username = None
+        self._series_cache = None
+        # 여러 스레드가 같은 새 시리즈를 동시에 만들지 않도록 조회·생성을 한 번에 하나씩
+        self._series_lock = threading.Lock()
+
+        # keep-alive 연결을 재사용하는 세션
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'User-Agent': session_data.get('user_agent') or 'Mozilla/5.0',
+        })
+
+        # 세션 쿠키 복원
+        for cookie in session_data.get('cookies', []):
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+
+    @staticmethod
+    def _endpoint_for(base_url):
+        # 대역 서버 등 기본 주소가 아니면 같은 호스트의 /graphql 사용
+        if base_url and base_url.rstrip('/') != 'https://velog.io':
+            return f"{base_url.rstrip('/')}/graphql"
+        return DEFAULT_GRAPHQL_URL
+
+    def execute(self, query, variables=None):
+        """GraphQL 요청 실행 후 data 반환"""
+        response = self.session.post(
+            self.endpoint,
+            json={'query': query, 'variables': variables or {}},
+            timeout=self.timeout
+        )
+        if response.status_code in (401, 403):
+            raise SessionExpiredError(f"인증 실패 (HTTP {response.status_code})")
+        response.raise_for_status()
+
+        result = response.json()
+        errors = result.get('errors')
+        if errors:
+            codes = {(e.get('extensions') or {}).get('code') for e in errors}
+            message = '; '.join(e.get('message', '') for e in errors)
+            if 'UNAUTHENTICATED' in codes or 'not logged in' in message.lower():
+                raise SessionExpiredError(message)
+            raise GraphQLError(message)
+        return result.get('data') or {}
+
+    def current_username(self):
+        """로그인한 사용자 이름 (토큰 만료 시 SessionExpiredError)"""
+        if self._username is None:
+            auth = self.execute(CURRENT_USER_QUERY).get('auth')
+            if not auth:
+                raise SessionExpiredError("로그인 정보가 없습니다.")
+            self._username = auth['username']
+        return self._username
+
+    def find_or_create_series(self, name):
+        """시리즈 이름으로 id 조회, 없으면 생성 (스레드 안전)"""
+        with self._series_lock:
+            if self._series_cache is None:
+                data = self.execute(SERIES_LIST_QUERY, {'username': self.current_username()})
+                self._series_cache = {s['name']: s['id'] for s in data.get('seriesList') or []}
+
+            if name not in self._series_cache:
+                data = self.execute(CREATE_SERIES_MUTATION, {
+                    'name': name,
+                    'url_slug': make_url_slug(name)
+                })
+                self._series_cache[name] = data['createSeries']['id']
+            return self._series_cache[name]
+
+    def write_post(self, post_data, is_private=False):
+        """
+        포스트 게시 후 게시된 URL 반환
+        시리즈 처리에 실패해도 글은 시리즈 없이 게시
+        """
+        series_id = None
+        if post_data.get('series'):
+            try:
+                series_id = self.find_or_create_series(post_data['series'])
+            except SessionExpiredError:
+                raise
+            except Exception as e:
+                print(f"⚠️  시리즈 설정 실패: {e}")
+
+        variables = {
+            'title': post_data['title'],
+            'body': post_data['content'],
+            'tags': post_data.get('tags', []),
+            'is_markdown': True,
+            'is_temp': False,
+            'is_private': is_private,
+            'url_slug': make_url_slug(post_data['title']),
+            'thumbnail': None,
+            'meta': {},
+            'series_id': series_id,
+        }
+        try:
+            data = self.execute(WRITE_POST_MUTATION, variables)
+        except ValueError as e:
+            # 응답 본문이 JSON이 아님: 요청은 처리됐을 수 있음
+            raise PublishUnconfirmedError(f"writePost 응답을 해석하지 못했습니다: {e}") from e
+        post = data.get('writePost')
+        if not post:
+            raise PublishUnconfirmedError("writePost 응답에 게시된 글 정보가 없습니다.")
+        return f"{self.base_url}/@{post['user']['username']}/{post['url_slug']}"
+
+    def find_post(self, post_data):
+        """같은 url_slug의 글이 이미 게시돼 있으면 URL, 없으면 None"""
+        username = self.current_username()
+        data = self.execute(READ_POST_QUERY, {
+            'username': username,
+            'url_slug': make_url_slug(post_data['title'])
+        })
+        post = data.get('post')
+        if not post:
+            return None
+        return f"{self.base_url}/@{username}/{post['url_slug']}"
+
+    def list_posts(self, cursor=None, limit=50):
+        """내 글 목록 한 페이지 (본문 제외), 다음 페이지는 마지막 글 id를 cursor로"""
+        data = self.execute(POSTS_QUERY, {
+            'username': self.current_username(),
+            'cursor': cursor,
+            'limit': limit
+        })
+        return data.get('posts') or []
+
+    def read_post(self, url_slug=None, post_id=None):
+        """내 글 하나의 본문과 메타데이터 (url_slug 또는 id, 없으면 None)"""
+        variables = {'id': post_id} if post_id else {
+            'username': self.current_username(),
+            'url_slug': url_slug
+        }
+        data = self.execute(READ_POST_DETAIL_QUERY, variables)
+        return data.get('post')
+
+    def edit_post(self, published, changes):
+        """
+        이미 게시된 글 수정, 수정된 글의 URL 반환
+        published: read_post로 읽은 글, changes: {'title', 'body', 'tags', 'series'} 중 바뀐 필드만
+        (series=None이면 시리즈에서 제외)
+        editPost는 전체 필드를 덮어쓰므로 바뀌지 않은 필드는 published 값을 그대로 보냄
+        (url_slug, 썸네일, 공개 여부, meta, 시리즈 유지)
+        """
+        if 'series' in changes:
+            series_id = self.find_or_create_series(changes['series']) if changes['series'] else None
+        else:
+            series_id = (published.get('series') or {}).get('id')
+
+        post = self.execute(EDIT_POST_MUTATION, {
+            'id': published['id'],
+            'title': changes.get('title', published.get('title')),
+            'body': changes.get('body', published.get('body')),
+            'tags': changes.get('tags', published.get('tags') or []),
+            'is_markdown': True,
+            'is_temp': False,
+            'is_private': bool(published.get('is_private')),
+            'url_slug': published['url_slug'],
+            'thumbnail': published.get('thumbnail'),
+            'meta': published.get('meta') or {},
+            'series_id': series_id,
+        })['editPost']
+        return f"{self.base_url}/@{post['user']['username']}/{post['url_slug']}"
+
+    def post_url(self, url_slug):
+        return f"{self.base_url}/@{self.current_username()}/{url_slug}"
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+포스트 이미지 로컬 렌더링
+본문의 플레이스홀더 이미지(via.placeholder.com 등)를 찾아
+타이틀 카드 / 차트 / 다이어그램 PNG를 직접 그림 (이미지가 많고 클 때만 재사용하는 프로세스 풀 사용)
+
+Pillow가 설치되어 있으면 라벨 글자까지 그리고,
+없으면 표준 라이브러리(zlib)만으로 도형만 있는 PNG를 생성
+"""
+
+import os
+import re
+import zlib
+import atexit
+import struct
+import hashlib
+import threading
+from urllib.parse import urlparse, parse_qs
+
+# 로컬 렌더링으로 대체할 이미지 호스트
+PLACEHOLDER_HOSTS = ('via.placeholder.com', 'placeholder.com', 'placehold.co', 'example.com')
+# 주소 대신 적힌 자리표시 문자열 (AI가 프롬프트의 "![설명](이미지URL)"을 그대로 옮긴 경우 등, 소문자로 비교)
+PLACEHOLDER_TOKENS = ('', '#', 'url', '이미지url', '이미지_url', '이미지 url', '이미지주소', '이미지 주소',
+                      'image_url', 'image-url', 'imageurl', 'placeholder')
+
+DEFAULT_SIZE = (600, 300)
+MAX_SIDE = 2000
+
+# 이 픽셀 수 이하면 프로세스 풀을 쓰지 않고 현재 프로세스에서 렌더링
+# (표준 라이브러리 렌더러로 약 30ms, 풀 작업 전달과 결과 복사 비용보다 작음)
+IN_PROCESS_PIXELS = 2_000_000
+
+# 여러 글에 걸쳐 재사용하는 렌더링 프로세스 풀 (_get_pool)
+_pool = None
+_pool_lock = threading.Lock()
+
+IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)\s]*)\)')
+_SIZE_PATTERN = re.compile(r'/(\d+)x(\d+)')
+
+# 라벨/설명에 들어 있으면 해당 종류로 렌더링
+CHART_WORDS = ('chart', 'performance', 'result', '성능', '비교', '결과', '차트')
+DIAGRAM_WORDS = ('diagram', 'implementation', 'architecture', '구성', '구현', '구조', '다이어그램', '과정')
+
+PALETTE = (
+    ((30, 41, 59), (56, 189, 248)),
+    ((17, 24, 39), (52, 211, 153)),
+    ((49, 46, 129), (251, 191, 36)),
+    ((76, 29, 149), (244, 114, 182)),
+    ((15, 23, 42), (129, 140, 248)),
+)
+
+
+class ImageSpec:
+    """렌더링할 이미지 한 장의 설명 (같은 spec이면 항상 같은 PNG)"""
+
+    __slots__ = ('kind', 'width', 'height', 'label', 'alt')
+
+    def __init__(self, kind, width, height, label, alt=''):
+        self.kind = kind
+        self.width = width
+        self.height = height
+        self.label = label
+        self.alt = alt
+
+    def key(self):
+        return (self.kind, self.width, self.height, self.label, self.alt)
+
+    def seed(self):
+        return int.from_bytes(hashlib.sha256(repr(self.key()).encode('utf-8')).digest()[:4], 'big')
+
+    def __eq__(self, other):
+        return isinstance(other, ImageSpec) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return f"ImageSpec({self.kind!r}, {self.width}x{self.height}, {self.label!r})"
+
+
+def is_placeholder(url):
+    """
+    로컬 렌더링으로 대체할 이미지 주소인지
+    PLACEHOLDER_HOSTS의 주소이거나 PLACEHOLDER_TOKENS 문자열만 해당 (상대 경로, data: 주소는 그대로 둠)
+    """
+    if url.startswith(('http://', 'https://')):
+        return (urlparse(url).hostname or '') in PLACEHOLDER_HOSTS
+    return url.strip().lower() in PLACEHOLDER_TOKENS
+
+
+def spec_from_image(alt, url):
+    """마크다운 이미지의 설명과 주소로 ImageSpec 생성"""
+    width, height = DEFAULT_SIZE
+    label = alt
+    if url.startswith(('http://', 'https://')):
+        parsed = urlparse(url)
+        size = _SIZE_PATTERN.search(parsed.path)
+        if size:
+            width, height = int(size.group(1)), int(size.group(2))
+        text = parse_qs(parsed.query).get('text')
+        if text:
+            label = text[0].replace('+', ' ')
+    width = max(16, min(width, MAX_SIDE))
+    height = max(16, min(height, MAX_SIDE))
+
+    words = f"{alt} {label}".lower()
+    if any(word in words for word in CHART_WORDS):
+        kind = 'chart'
+    elif any(word in words for word in DIAGRAM_WORDS):
+        kind = 'diagram'
+    else:
+        kind = 'card'
+    return ImageSpec(kind, width, height, label.strip() or alt, alt)
+
+
+def find_placeholder_images(markdown):
+    """본문에서 대체할 이미지 목록 [(원래 주소, ImageSpec), ...] (등장 순서, 중복 포함)"""
+    found = []
+    for match in IMAGE_PATTERN.finditer(markdown):
+        alt, url = match.group(1), match.group(2)
+        if is_placeholder(url):
+            found.append((url, spec_from_image(alt, url)))
+    return found
+
+
+# ---------------------------------------------------------------------------
+# 도형 배치 (Pillow / 표준 라이브러리 렌더러가 함께 사용)
+
+def _layout(spec):
+    """배경색과 (x0, y0, x1, y1, color) 사각형 목록"""
+    seed = spec.seed()
+    background, accent = PALETTE[seed % len(PALETTE)]
+    w, h = spec.width, spec.height
+    muted = tuple((a + b) // 2 for a, b in zip(background, accent))
+    rects = []
+
+    if spec.kind == 'chart':
+        bars = 4 + seed % 4
+        gap = w // (bars * 3 + 1)
+        bar_width = gap * 2
+        base = h - h // 8
+        for i in range(bars):
+            x0 = gap + i * (bar_width + gap)
+            ratio = 0.25 + ((seed >> (i * 3)) % 8) / 10
+            y0 = base - int((base - h // 6) * min(ratio, 0.95))
+            rects.append((x0, y0, x0 + bar_width, base, accent if i % 2 == 0 else muted))
+        rects.append((gap // 2, base, w - gap // 2, base + max(2, h // 100), muted))
+    elif spec.kind == 'diagram':
+        boxes = 3
+        box_w = w // (boxes * 2)
+        box_h = h // 4
+        top = (h - box_h) // 2
+        for i in range(boxes):
+            x0 = box_w // 2 + i * box_w * 2
+            rects.append((x0, top, x0 + box_w, top + box_h, accent))
+            if i < boxes - 1:
+                # 상자 사이 연결선
+                line_y = top + box_h // 2
+                rects.append((x0 + box_w, line_y - 1, x0 + box_w * 2, line_y + 2, muted))
+    else:
+        band = h // 3
+        rects.append((0, band, w, band * 2, muted))
+        rects.append((w // 10, band + band // 3, w - w // 10, band + band // 3 + max(3, h // 60), accent))
+    return background, accent, rects
+
+
+# ---------------------------------------------------------------------------
+# 표준 라이브러리 PNG 인코더
+
+def _png_chunk(tag, data):
+    return (struct.pack('>I', len(data)) + tag + data
+            + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff))
+
+
+def _render_png_stdlib(spec):
+    background, _, rects = _layout(spec)
+    w, h = spec.width, spec.height
+    blank = bytes(background) * w
+    rows = []
+    for y in range(h):
+        row = None
+        for x0, y0, x1, y1, color in rects:
+            if y0 <= y < y1:
+                if row is None:
+                    row = bytearray(blank)
+                x0, x1 = max(0, x0), min(w, x1)
+                row[x0 * 3:x1 * 3] = bytes(color) * (x1 - x0)
+        rows.append(b'\x00' + (blank if row is None else bytes(row)))
+
+    header = struct.pack('>IIBBBBB', w, h, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n'
+            + _png_chunk(b'IHDR', header)
+            + _png_chunk(b'IDAT', zlib.compress(b''.join(rows), 6))
+            + _png_chunk(b'IEND', b''))
+
+
+def _render_png_pillow(spec, Image, ImageDraw, ImageFont):
+    import io
+
+    background, _, rects = _layout(spec)
+    image = Image.new('RGB', (spec.width, spec.height), background)
+    draw = ImageDraw.Draw(image)
+    for x0, y0, x1, y1, color in rects:
+        draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=color)
+
+    font_path = os.getenv('VELOG_IMAGE_FONT')
+    size = max(12, spec.height // 10)
+    try:
+        font = ImageFont.truetype(font_path, size) if font_path else ImageFont.load_default(size)
+    except (OSError, TypeError):
+        font = ImageFont.load_default()
+    draw.text((spec.width // 20, spec.height // 16), spec.label, fill=(255, 255, 255), font=font)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def render_image(spec):
+    """ImageSpec 하나를 PNG 바이트로 렌더링 (프로세스 풀 작업 함수)"""
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        return _render_png_stdlib(spec)
+    return _render_png_pillow(spec, Image, ImageDraw, ImageFont)
+
+
+def _get_pool(workers):
+    """프로세스 풀 (처음 필요할 때 한 번 만들고 이후 호출은 같은 풀 재사용, 종료 시 shutdown_pool로 정리)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from concurrent.futures import ProcessPoolExecutor
+
+                _pool = ProcessPoolExecutor(max_workers=workers)
+    return _pool
+
+
+def shutdown_pool():
+    """렌더링 프로세스 풀 종료 (다음 렌더링에서 필요하면 다시 만듦)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# 풀을 다시 만들 때마다 등록하면 종료 처리기가 쌓이므로 모듈에서 한 번만 등록
+atexit.register(shutdown_pool)
+
+
+def render_images(specs, workers=None):
+    """
+    여러 이미지를 렌더링, 입력 순서대로 PNG 바이트 목록 반환
+    같은 spec은 한 번만 렌더링하고, 전체 픽셀 수가 IN_PROCESS_PIXELS 이하이거나 workers=0이면
+    현재 프로세스에서 처리 (보통 글 한 편의 이미지 몇 장은 풀을 거치는 것보다 직접 그리는 편이 빠름)
+    """
+    unique = list(dict.fromkeys(specs))
+    if workers is None:
+        workers = min(len(unique), os.cpu_count() or 1)
+    pixels = sum(spec.width * spec.height for spec in unique)
+
+    if workers <= 1 or len(unique) <= 1 or pixels <= IN_PROCESS_PIXELS:
+        rendered = [render_image(spec) for spec in unique]
+    else:
+        rendered = list(_get_pool(workers).map(render_image, unique))
+
+    by_spec = dict(zip(unique, rendered))
+    return [by_spec[spec] for spec in specs]
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+로컬 렌더링 이미지를 Velog 이미지 업로드 엔드포인트로 올리고 본문 주소를 교체
+내용 해시(sha256) 인덱스에 업로드 결과를 저장해 같은 이미지는 두 번 올리지 않음
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.tracing import tracer
+from utils import metrics
+from utils.graphql_publisher import SessionExpiredError
+from utils.image_render import IMAGE_PATTERN, find_placeholder_images, is_placeholder, render_images
+
+DEFAULT_UPLOAD_URL = 'https://v2.velog.io/api/v2/files/upload'
+DEFAULT_INDEX_FILE = '.velog_images.sqlite3'
+
+
+class ImageUploadError(Exception):
+    """이미지 업로드 실패"""
+
+
+class ImageIndex:
+    """(업로드 엔드포인트, 내용 해시) → 업로드된 URL"""
+
+    def __init__(self, path=DEFAULT_INDEX_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS uploaded_images (
+                endpoint TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                url TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (endpoint, digest)
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, endpoint, digest):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url FROM uploaded_images WHERE endpoint = ? AND digest = ?",
+                (endpoint, digest)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, endpoint, digest, url, size):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO uploaded_images VALUES (?, ?, ?, ?, ?)",
+                (endpoint, digest, url, size, time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ImageUploader:
+    def __init__(self, session_data, endpoint=None, base_url=None, index=None,
+                 max_in_flight=4, timeout=30):
+        self.endpoint = endpoint or os.getenv('VELOG_UPLOAD_URL') or self._endpoint_for(base_url)
+        self.timeout = timeout
+        self.max_in_flight = max(1, max_in_flight)
+        self.index = index if index is not None else ImageIndex()
+        self.uploaded = 0
+        self.reused = 0
+        # 여러 스레드가 한 업로더를 같이 쓰므로 누적 횟수는 잠금 안에서 갱신
+        self._count_lock = threading.Lock()
+
+        # 동시에 올리는 수만큼 keep-alive 연결을 유지
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_in_flight)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = session_data.get('user_agent') or 'Mozilla/5.0'
+        for cookie in session_data.get('cookies', []):
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+
+    @staticmethod
+    def _endpoint_for(base_url):
+        # 대역 서버 등 기본 주소가 아니면 같은 호스트의 업로드 경로 사용
+        if base_url and base_url.rstrip('/') != 'https://velog.io':
+            return f"{base_url.rstrip('/')}/api/v2/files/upload"
+        return DEFAULT_UPLOAD_URL
+
+    def upload(self, data, filename='image.png'):
+        """PNG 한 장 업로드 후 URL 반환 (해시 인덱스 무시)"""
+        response = self.session.post(
+            self.endpoint,
+            files={'image': (filename, data, 'image/png')},
+            data={'type': 'post'},
+            timeout=self.timeout
+        )
+        if response.status_code in (401, 403):
+            raise SessionExpiredError(f"이미지 업로드 인증 실패 (HTTP {response.status_code})")
+        if response.status_code != 200:
+            raise ImageUploadError(f"이미지 업로드 실패 (HTTP {response.status_code})")
+
+        result = response.json()
+        url = result.get('path') or result.get('url')
+        if not url:
+            raise ImageUploadError(f"업로드 응답에 URL이 없습니다: {result}")
+        return url
+
+    def upload_many(self, blobs, counts=None):
+        """
+        여러 이미지를 최대 max_in_flight개씩 동시에 업로드, 입력 순서대로 URL 목록 반환
+        인덱스에 있거나 같은 배치 안에서 겹치는 이미지는 한 번만 업로드
+        counts(dict)를 넘기면 이번 호출의 'uploaded', 'reused' 수를 기록
+        """
+        digests = [hashlib.sha256(blob).hexdigest() for blob in blobs]
+        urls = {}
+        pending = {}
+        reused = 0
+        for digest, blob in zip(digests, blobs):
+            if digest in urls or digest in pending:
+                continue
+            known = self.index.get(self.endpoint, digest)
+            if known:
+                urls[digest] = known
+                reused += 1
+                metrics.IMAGE_CACHE_HIT.inc()
+            else:
+                pending[digest] = blob
+                metrics.IMAGE_CACHE_MISS.inc()
+
+        def upload_one(item):
+            digest, blob = item
+            url = self.upload(blob, filename=f"{digest[:16]}.png")
+            self.index.put(self.endpoint, digest, url, len(blob))
+            return digest, url
+
+        if pending:
+            with tracer.span('image_upload', count=len(pending)):
+                with ThreadPoolExecutor(max_workers=min(self.max_in_flight, len(pending))) as executor:
+                    for digest, url in executor.map(upload_one, pending.items()):
+                        urls[digest] = url
+
+        with self._count_lock:
+            self.uploaded += len(pending)
+            self.reused += reused
+        if counts is not None:
+            counts['uploaded'] = counts.get('uploaded', 0) + len(pending)
+            counts['reused'] = counts.get('reused', 0) + reused
+        return [urls[digest] for digest in digests]
+
+    def close(self):
+        self.session.close()
+        self.index.close()
+
+
+def localize_images(markdown, uploader, workers=None, counts=None):
+    """
+    본문의 플레이스홀더 이미지를 로컬에서 렌더링·업로드한 뒤 업로드 URL로 교체한 본문 반환
+    workers는 렌더링 프로세스 수 (None이면 CPU 수, 0이면 현재 프로세스)
+    counts는 upload_many에 그대로 전달 (이번 본문의 업로드/재사용 수)
+    """
+    found = find_placeholder_images(markdown)
+    if not found:
+        return markdown
+
+    with tracer.span('image_render', count=len(found)):
+        blobs = render_images([spec for _, spec in found], workers=workers)
+    urls = uploader.upload_many(blobs, counts=counts)
+
+    # find_placeholder_images와 같은 순서로 이미지마다 교체
+    remaining = iter(urls)
+
+    def replace(match):
+        if not is_placeholder(match.group(2)):
+            return match.group(0)
+        return f"![{match.group(1)}]({next(remaining)})"
+
+    return IMAGE_PATTERN.sub(replace, markdown)
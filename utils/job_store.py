@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+크래시에 안전한 포스트 작업 저장소 (SQLite WAL)
+생성된 포스트를 한 번만 저장하고 generated → publishing → published / failed 상태를 기록
+작업은 원자적으로 가져가며(claim), 같은 초안은 dedupe_key로 한 번만 게시
+
+게시 도중 프로세스가 죽거나 결과가 애매한 경우(출간 버튼은 눌렀지만 URL 확인 실패 등)는
+needs_check로 표시해, 다시 게시하기 전에 이미 올라갔는지 먼저 확인하게 함
+"""
+
+import json
+import time
+import uuid
+import sqlite3
+import hashlib
+import threading
+
+DEFAULT_JOB_DB = 'velog_jobs.sqlite3'
+
+JOB_STATES = ('generated', 'publishing', 'published', 'failed')
+
+
+def make_dedupe_key(post_data):
+    """제목과 본문으로 만든 초안 식별 키"""
+    payload = f"{post_data.get('title', '')}\0{post_data.get('content', '')}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class JobStore:
+    def __init__(self, path=DEFAULT_JOB_DB, lease_seconds=900, max_attempts=3, retry_delay=60):
+        self.path = path
+        # publishing 상태로 이 시간(초)이 지나면 작업자가 죽은 것으로 보고 다시 가져감
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        # 실패 후 재시도 대기 (시도할 때마다 두 배)
+        self.retry_delay = retry_delay
+        self.worker_id = f"{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                dedupe_key TEXT NOT NULL UNIQUE,
+                state TEXT NOT NULL,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                tags TEXT NOT NULL,
+                series TEXT,
+                topic TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                needs_check INTEGER NOT NULL DEFAULT 0,
+                post_url TEXT,
+                error TEXT,
+                claimed_by TEXT,
+                claimed_at REAL,
+                not_before REAL NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                published_at REAL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (state, not_before)")
+
+    @staticmethod
+    def _to_job(row):
+        if row is None:
+            return None
+        job = dict(row)
+        job['tags'] = json.loads(job['tags'])
+        job['needs_check'] = bool(job['needs_check'])
+        job['post'] = {
+            'title': job['title'],
+            'content': job['content'],
+            'tags': job['tags'],
+            'series': job['series'],
+        }
+        return job
+
+    def add(self, post_data, dedupe_key=None, topic=None, not_before=None):
+        """
+        생성된 포스트 저장, (job_id, 새로 추가됐는지) 반환
+        같은 dedupe_key가 이미 있으면 기존 작업 id를 돌려주고 내용은 덮어쓰지 않음
+        """
+        key = dedupe_key or make_dedupe_key(post_data)
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                """INSERT OR IGNORE INTO jobs
+                   (dedupe_key, state, title, content, tags, series, topic,
+                    not_before, created_at, updated_at)
+                   VALUES (?, 'generated', ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (key, post_data['title'], post_data['content'],
+                 json.dumps(post_data.get('tags', []), ensure_ascii=False),
+                 post_data.get('series'), topic, not_before or now, now, now)
+            )
+            if cursor.rowcount:
+                return cursor.lastrowid, True
+            row = self._conn.execute("SELECT id FROM jobs WHERE dedupe_key = ?", (key,)).fetchone()
+            return row['id'], False
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row)
+
+    def claim(self, job_id=None, now=None):
+        """
+        게시할 작업 하나를 원자적으로 가져와 publishing으로 변경 (없으면 None)
+        대상: generated, 재시도 시간이 된 failed, 임대 시간이 지난 publishing(작업자 비정상 종료)
+        마지막 시도 중에 작업자가 죽어 임대 시간이 지난 작업은 다시 가져가지 않고 failed(확인 필요)로 바꿈
+        """
+        now = now or time.time()
+        stale = now - self.lease_seconds
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    """UPDATE jobs SET state = 'failed', needs_check = 1, claimed_by = NULL, updated_at = ?,
+                       error = '게시 중 작업자가 종료됨 (재시도 횟수 소진)'
+                       WHERE state = 'publishing' AND claimed_at < ? AND attempts >= ?""",
+                    (now, stale, self.max_attempts)
+                )
+                query = """
+                    SELECT * FROM jobs
+                    WHERE ((state IN ('generated', 'failed') AND not_before <= ?)
+                           OR (state = 'publishing' AND claimed_at < ?))
+                      AND attempts < ?
+                """
+                params = [now, stale, self.max_attempts]
+                if job_id is not None:
+                    query += " AND id = ?"
+                    params.append(job_id)
+                row = self._conn.execute(query + " ORDER BY not_before, id LIMIT 1", params).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                # 게시 도중 멈춘 작업은 이미 올라갔을 수 있으므로 확인 필요로 표시
+                needs_check = row['needs_check'] or row['state'] == 'publishing'
+                self._conn.execute(
+                    """UPDATE jobs SET state = 'publishing', attempts = attempts + 1,
+                       needs_check = ?, claimed_by = ?, claimed_at = ?, updated_at = ?
+                       WHERE id = ?""",
+                    (int(needs_check), self.worker_id, now, now, row['id'])
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self.get(row['id'])
+
+    def mark_published(self, job_id, post_url):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """UPDATE jobs SET state = 'published', post_url = ?, error = NULL, needs_check = 0,
+                   claimed_by = NULL, published_at = ?, updated_at = ? WHERE id = ?""",
+                (post_url, now, now, job_id)
+            )
+
+    def mark_failed(self, job_id, error, ambiguous=False):
+        """
+        실패 기록 후 재시도 대기
+        ambiguous=True면 게시됐을 수도 있으므로 다음 시도 전에 확인하도록 표시
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            delay = self.retry_delay * (2 ** max(0, row['attempts'] - 1)) if row else self.retry_delay
+            self._conn.execute(
+                """UPDATE jobs SET state = 'failed', error = ?, needs_check = MAX(needs_check, ?),
+                   claimed_by = NULL, not_before = ?, updated_at = ? WHERE id = ?""",
+                (str(error), int(ambiguous), now + delay, now, job_id)
+            )
+
+    def requeue(self, job_id, now=None):
+        """
+        실패한 작업을 바로 다시 게시할 수 있게 되돌림 (재시도 대기와 시도 횟수 초기화)
+        애매했던 실패의 needs_check는 유지해 다시 게시하기 전에 먼저 확인
+        실패 상태가 아니면 아무것도 바꾸지 않고 False 반환
+        """
+        now = now or time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                """UPDATE jobs SET attempts = 0, not_before = ?, updated_at = ?
+                   WHERE id = ? AND state = 'failed'""",
+                (now, now, job_id)
+            )
+        return cursor.rowcount > 0
+
+    def counts(self):
+        """상태별 작업 수"""
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        counts = {state: 0 for state in JOB_STATES}
+        counts.update({state: count for state, count in rows})
+        return counts
+
+    def pending(self):
+        """지금 또는 나중에 게시할 작업 수 (재시도 횟수를 다 쓴 실패 작업 제외)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE state IN ('generated', 'failed', 'publishing') AND attempts < ?",
+                (self.max_attempts,)
+            ).fetchone()
+        return row[0]
+
+    def scheduled(self, after):
+        """예정 시각이 after 이후인 generated 작업의 예정 시각 목록 (오름차순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT not_before FROM jobs WHERE state = 'generated' AND not_before > ? ORDER BY not_before",
+                (after,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def next_due(self):
+        """가장 먼저 게시할 수 있게 되는 시각 (게시할 작업이 없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(not_before) FROM jobs WHERE state IN ('generated', 'failed') AND attempts < ?",
+                (self.max_attempts,)
+            ).fetchone()
+        return row[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
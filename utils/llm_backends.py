@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+AI 본문 생성 백엔드
+ContentGenerator는 어떤 서버를 쓰는지 모르고 backend.complete()/stream()만 호출
+
+- openai: OpenAI 호환 chat completions API (api.openai.com 등, API 키 필요)
+- local:  같은 API를 제공하는 로컬 서버 (llama.cpp server, vLLM 등), 키 없이 긴 읽기 제한 시간
+- fake:   네트워크 없이 프롬프트로부터 항상 같은 글을 만드는 대역 (테스트/오프라인 측정용)
+
+HTTP 백엔드는 백엔드마다 keep-alive requests.Session 하나를 연결 풀과 함께 재사용하므로
+연속 생성 시 TCP/TLS 연결을 다시 맺지 않음
+
+모델 이름으로 백엔드 선택: "local:qwen2.5-7b-instruct", "fake", "openai:gpt-4o-mini", "gpt-3.5-turbo"(openai)
+"""
+
+import os
+import json
+import time
+import threading
+
+DEFAULT_MODEL = 'gpt-3.5-turbo'
+DEFAULT_OPENAI_BASE_URL = 'https://api.openai.com/v1'
+# llama.cpp server 기본 포트 (vLLM은 8000)
+DEFAULT_LOCAL_BASE_URL = 'http://127.0.0.1:8080/v1'
+
+
+class AIGenerationError(Exception):
+    """AI 콘텐츠 생성 실패 (status_code는 HTTP 오류일 때만 설정)"""
+
+    def __init__(self, message, status_code=None, retry_after=None):
+        super().__init__(message)
+        self.status_code = status_code
+        # 서버가 Retry-After로 알려준 대기 시간(초)
+        self.retry_after = retry_after
+
+
+def _retry_after(response):
+    try:
+        return float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_sse_deltas(lines):
+    """
+    chat completions 스트림(SSE)의 바이트 줄에서 본문 조각을 차례로 반환
+    text/event-stream은 charset 없이 오는 경우가 많아(llama-server 등) requests가 ISO-8859-1로 해석하므로
+    바이트 줄을 직접 UTF-8로 디코딩 (0x85 등이 줄바꿈으로 잘리지 않게)
+    data: 줄만 읽고 [DONE]에서 멈추며, 형식이 맞지 않는 조각은 AIGenerationError
+    """
+    for raw in lines:
+        line = raw.decode('utf-8', errors='replace') if isinstance(raw, bytes) else raw
+        if not line or not line.startswith('data:'):
+            continue
+        payload = line[len('data:'):].strip()
+        if payload == '[DONE]':
+            break
+        try:
+            delta = (json.loads(payload)['choices'][0].get('delta') or {}).get('content')
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+            raise AIGenerationError(f"AI API 스트림 형식 오류: {e}: {payload[:200]}") from e
+        if delta:
+            yield delta
+
+
+class ChatBackend:
+    """백엔드 공통 인터페이스"""
+
+    name = None
+
+    def __init__(self, model):
+        self.model = model
+
+    @property
+    def cache_model(self):
+        """응답 캐시 키에 쓰는 모델 이름 (백엔드가 다르면 같은 모델 이름이어도 다른 키)"""
+        return f"{self.name}:{self.model}"
+
+    def complete(self, prompt, max_tokens=2000, temperature=0.7):
+        """프롬프트 하나에 대한 전체 응답 문자열 (실패 시 AIGenerationError)"""
+        raise NotImplementedError
+
+    def stream(self, prompt, max_tokens=2000, temperature=0.7):
+        """응답 텍스트 조각을 차례로 반환하는 제너레이터"""
+        yield self.complete(prompt, max_tokens, temperature)
+
+    def close(self):
+        pass
+
+    def describe(self):
+        return f"{self.name}:{self.model}"
+
+
+class OpenAICompatibleBackend(ChatBackend):
+    name = 'openai'
+
+    def __init__(self, model=DEFAULT_MODEL, base_url=None, api_key=None,
+                 connect_timeout=5, read_timeout=30, pool_size=4):
+        super().__init__(model)
+        base_url = base_url or os.getenv('OPENAI_BASE_URL') or DEFAULT_OPENAI_BASE_URL
+        self.url = f"{base_url.rstrip('/')}/chat/completions"
+        self.api_key = api_key
+        # (연결, 읽기) 제한 시간(초)
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_size = max(1, pool_size)
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache_model(self):
+        # 기존 캐시 키와 호환 (openai는 모델 이름만 사용)
+        return self.model
+
+    @property
+    def session(self):
+        """처음 요청할 때 만드는 keep-alive 세션 (동시 생성 수만큼 연결 유지)"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    session.headers['Content-Type'] = 'application/json'
+                    if self.api_key:
+                        session.headers['Authorization'] = f'Bearer {self.api_key}'
+                    self._session = session
+        return self._session
+
+    def _payload(self, prompt, max_tokens, temperature, stream=False):
+        data = {
+            'model': self.model,
+            'messages': [{'role': 'user', 'content': prompt}],
+            'max_tokens': max_tokens,
+            'temperature': temperature,
+        }
+        if stream:
+            data['stream'] = True
+        return data
+
+    def _post(self, data, **kwargs):
+        import requests
+
+        try:
+            return self.session.post(self.url, json=data, timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            raise AIGenerationError(f"AI API 요청 실패: {e}") from e
+
+    def complete(self, prompt, max_tokens=2000, temperature=0.7):
+        response = self._post(self._payload(prompt, max_tokens, temperature))
+        if response.status_code != 200:
+            raise AIGenerationError(f"AI API 오류: {response.status_code}", response.status_code,
+                                    _retry_after(response))
+        try:
+            return response.json()['choices'][0]['message']['content']
+        except (ValueError, KeyError, IndexError) as e:
+            raise AIGenerationError(f"AI API 응답 형식 오류: {e}") from e
+
+    def stream(self, prompt, max_tokens=2000, temperature=0.7):
+        import requests
+
+        response = self._post(self._payload(prompt, max_tokens, temperature, stream=True),
+                              stream=True, headers={'Accept': 'text/event-stream'})
+        with response:
+            if response.status_code != 200:
+                raise AIGenerationError(f"AI API 오류: {response.status_code}", response.status_code,
+                                        _retry_after(response))
+            try:
+                yield from iter_sse_deltas(response.iter_lines())
+            except requests.RequestException as e:
+                # 스트림 도중 연결이 끊긴 경우
+                raise AIGenerationError(f"AI API 스트림 수신 실패: {e}") from e
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def describe(self):
+        return f"{self.name}:{self.model} ({self.url})"
+
+
+class LocalBackend(OpenAICompatibleBackend):
+    """
+    로컬 OpenAI 호환 서버 (llama.cpp `llama-server`, vLLM `vllm serve` 등)
+    토큰당 비용이 없고 CPU 생성은 느리므로 읽기 제한 시간을 길게, 동시 요청은 서버 슬롯 수에 맞춤
+    """
+
+    name = 'local'
+
+    def __init__(self, model='local', base_url=None, api_key=None,
+                 connect_timeout=2, read_timeout=600, pool_size=2):
+        base_url = base_url or os.getenv('VELOG_LLM_BASE_URL') or DEFAULT_LOCAL_BASE_URL
+        super().__init__(model, base_url=base_url, api_key=api_key, connect_timeout=connect_timeout,
+                         read_timeout=read_timeout, pool_size=pool_size)
+
+    @property
+    def cache_model(self):
+        return f"{self.name}:{self.model}"
+
+
+class FakeBackend(ChatBackend):
+    """
+    프롬프트 해시로 시드를 정해 항상 같은 마크다운 글을 만드는 대역
+    latency(초)와 chars_per_second로 느린 모델을 흉내낼 수 있음
+    """
+
+    name = 'fake'
+
+    SECTIONS = ('소개', '문제 상황', '해결 과정', '결과 및 개선사항', '마무리')
+    LANGUAGES = ('python', 'javascript', 'bash', 'sql')
+
+    def __init__(self, model='fake', latency=0.0, chars_per_second=None):
+        super().__init__(model)
+        self.latency = latency
+        self.chars_per_second = chars_per_second
+        self.calls = 0
+
+    @staticmethod
+    def _topic(prompt):
+        for line in prompt.splitlines():
+            if line.strip().startswith('주제:'):
+                return line.split(':', 1)[1].strip()
+        return prompt.strip().splitlines()[0][:40] if prompt.strip() else '예시'
+
+    def render(self, prompt, max_tokens=2000):
+        import random
+        import hashlib
+
+        digest = hashlib.sha256(f"{self.model}\n{prompt}".encode('utf-8')).digest()
+        rng = random.Random(digest)
+        topic = self._topic(prompt)
+        parts = [f"# {topic}\n"]
+        for index, section in enumerate(self.SECTIONS):
+            parts.append(f"## {section}\n")
+            parts.append(f"{topic}에 대한 {section} 부분입니다. (항목 {rng.randint(1, 999)})\n")
+            if index == 1:
+                parts.append(f"![{topic} 구성도](https://via.placeholder.com/800x400?text=fake-{digest.hex()[:8]})\n")
+            if index == 2:
+                language = rng.choice(self.LANGUAGES)
+                parts.append(f"```{language}\n// {topic} 예제 {rng.randint(1, 99)}\n```\n")
+        # max_tokens를 대략 글자 수 상한으로 사용 (한국어 1토큰 ≈ 1~2자)
+        return '\n'.join(parts)[:max_tokens * 2]
+
+    def _wait(self, size):
+        delay = self.latency
+        if self.chars_per_second:
+            delay += size / self.chars_per_second
+        if delay > 0:
+            time.sleep(delay)
+
+    def complete(self, prompt, max_tokens=2000, temperature=0.7):
+        self.calls += 1
+        text = self.render(prompt, max_tokens)
+        self._wait(len(text))
+        return text
+
+    def stream(self, prompt, max_tokens=2000, temperature=0.7):
+        self.calls += 1
+        text = self.render(prompt, max_tokens)
+        self._wait(0)
+        for start in range(0, len(text), 64):
+            piece = text[start:start + 64]
+            if self.chars_per_second:
+                time.sleep(len(piece) / self.chars_per_second)
+            yield piece
+
+
+BACKENDS = {
+    'openai': OpenAICompatibleBackend,
+    'local': LocalBackend,
+    'fake': FakeBackend,
+}
+
+
+def parse_model(spec):
+    """'백엔드:모델' → (백엔드, 모델), 접두사가 없으면 백엔드 이름이거나 openai 모델"""
+    spec = (spec or DEFAULT_MODEL).strip()
+    name, sep, model = spec.partition(':')
+    if sep and name in BACKENDS:
+        return name, model or None
+    if spec in BACKENDS:
+        return spec, None
+    return 'openai', spec
+
+
+def create_backend(model=None, base_url=None, api_key=None, timeout=None, pool_size=None):
+    """
+    모델 이름으로 백엔드 생성
+    timeout: 읽기 제한 시간(초), pool_size: 유지할 연결 수 (None이면 백엔드 기본값)
+    """
+    name, model_name = parse_model(model)
+    if name == 'fake':
+        return FakeBackend(model=model_name or 'fake')
+
+    options = {}
+    if timeout is not None:
+        options['read_timeout'] = timeout
+    if pool_size is not None:
+        options['pool_size'] = pool_size
+    if name == 'local':
+        return LocalBackend(model=model_name or 'local', base_url=base_url, api_key=api_key, **options)
+    if not api_key:
+        raise ValueError("openai 백엔드에는 API 키(OPENAI_API_KEY)가 필요합니다. 로컬 서버는 local:<모델>을 사용하세요.")
+    return OpenAICompatibleBackend(model=model_name or DEFAULT_MODEL, base_url=base_url, api_key=api_key, **options)
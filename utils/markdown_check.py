@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+게시 전 마크다운 점검기
+본문을 한 줄씩 한 번만 훑으면서 코드 펜스 짝, 제목 형식, 이미지 링크를 검사하고
+공백을 정리한 본문, 통계, 에디터에 나눠 넣을 블록 단위 조각을 함께 만듦
+feed()로 조각을 여러 번 넣어도 되며 입력 크기에 대해 선형 시간
+"""
+
+import re
+
+# 에디터에 한 번에 넣을 최대 글자 수 (이보다 큰 본문은 블록 경계에서 나눠 입력)
+DEFAULT_CHUNK_CHARS = 8000
+
+_FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})(.*)$')
+_HEADING_PATTERN = re.compile(r'^ {0,3}(#+)([ \t]*)(.*?)[ \t]*$')
+_IMAGE_PATTERN = re.compile(r'!\[([^\]\n]*)\]\(([^)\n]*)\)')
+_LINK_PATTERN = re.compile(r'(?<!!)\[[^\]\n]*\]\([^)\n]*\)')
+_INLINE_CODE_PATTERN = re.compile(r'`[^`\n]*`')
+_URL_SCHEMES = ('http://', 'https://', 'data:image/', '/')
+
+
+class MarkdownIssue:
+    """문제 하나 (fixed=True면 정리한 본문에서 이미 고쳐짐)"""
+
+    __slots__ = ('line', 'level', 'message', 'fixed')
+
+    def __init__(self, line, level, message, fixed=False):
+        self.line = line
+        self.level = level
+        self.message = message
+        self.fixed = fixed
+
+    def __str__(self):
+        mark = '🔧' if self.fixed else ('❌' if self.level == 'error' else '⚠️ ')
+        return f"{mark} {self.line}번째 줄: {self.message}"
+
+
+class MarkdownReport:
+    def __init__(self, text, chunks, issues, stats):
+        # 공백을 정리하고 고칠 수 있는 문제를 고친 본문 (''.join(chunks) == text)
+        self.text = text
+        self.chunks = chunks
+        self.issues = issues
+        self.stats = stats
+
+    @property
+    def errors(self):
+        """고치지 못한 오류"""
+        return [issue for issue in self.issues if issue.level == 'error' and not issue.fixed]
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def summary(self):
+        s = self.stats
+        return (f"📏 본문 {s['chars']:,}자 ({s['bytes'] / 1024:.1f}KB), 줄 {s['lines']}개, "
+                f"제목 {s['headings']}개, 코드 블록 {s['code_blocks']}개, 이미지 {s['images']}개, "
+                f"입력 조각 {len(self.chunks)}개")
+
+
+class MarkdownAnalyzer:
+    """
+    스트리밍 마크다운 점검기
+    feed(text)로 조각을 넣고 finish()로 MarkdownReport를 받음
+    """
+
+    def __init__(self, chunk_chars=DEFAULT_CHUNK_CHARS, max_issues=50):
+        self.chunk_chars = max(1, chunk_chars)
+        self.max_issues = max_issues
+        self.issues = []
+        self.stats = {
+            'chars': 0, 'bytes': 0, 'lines': 0, 'words': 0, 'headings': 0,
+            'code_blocks': 0, 'code_lines': 0, 'images': 0, 'links': 0,
+            'longest_line': 0, 'languages': {},
+        }
+        self._partial = ''
+        self._line_no = 0
+        self._fence = None
+        self._fence_line = 0
+        self._blank_run = 0
+        self._started = False
+        self._last_heading_level = 0
+        self._chunks = []
+        self._chunk = []
+        self._chunk_size = 0
+        self._block = []
+        self._block_size = 0
+
+    def _issue(self, level, message, fixed=False):
+        if len(self.issues) < self.max_issues:
+            self.issues.append(MarkdownIssue(self._line_no, level, message, fixed))
+
+    # -- 조각 만들기 -------------------------------------------------------
+
+    def _flush_chunk(self):
+        if self._chunk:
+            self._chunks.append(''.join(self._chunk))
+            self._chunk = []
+            self._chunk_size = 0
+
+    def _end_block(self):
+        """블록(빈 줄 또는 코드 블록으로 구분) 하나를 현재 조각에 넣음"""
+        if not self._block:
+            return
+        if self._chunk_size and self._chunk_size + self._block_size > self.chunk_chars:
+            self._flush_chunk()
+        if self._block_size > self.chunk_chars:
+            # 블록 하나가 한도보다 크면 줄 경계에서 나눔
+            for piece in self._block:
+                if self._chunk_size and self._chunk_size + len(piece) > self.chunk_chars:
+                    self._flush_chunk()
+                self._chunk.append(piece)
+                self._chunk_size += len(piece)
+        else:
+            self._chunk.extend(self._block)
+            self._chunk_size += self._block_size
+        self._block = []
+        self._block_size = 0
+
+    def _emit(self, line):
+        piece = line + '\n'
+        self._block.append(piece)
+        self._block_size += len(piece)
+
+    # -- 줄 단위 검사 ------------------------------------------------------
+
+    def feed(self, text):
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._add_line(line)
+
+    def _add_line(self, line):
+        self._line_no += 1
+        if line.endswith('\r'):
+            line = line[:-1]
+        stats = self.stats
+        stats['longest_line'] = max(stats['longest_line'], len(line))
+
+        fence = _FENCE_PATTERN.match(line)
+        if self._fence is not None:
+            if fence and fence.group(1)[0] == self._fence[0] and len(fence.group(1)) >= len(self._fence) \
+                    and not fence.group(2).strip():
+                self._fence = None
+                self._emit(line.rstrip())
+                self._end_block()
+            else:
+                stats['code_lines'] += 1
+                # 코드 블록 안은 그대로 유지
+                self._emit(line)
+            return
+
+        if fence:
+            self._end_block()
+            self._blank_run = 0
+            self._started = True
+            self._fence = fence.group(1)
+            self._fence_line = self._line_no
+            stats['code_blocks'] += 1
+            language = fence.group(2).strip().split(' ')[0]
+            if language:
+                stats['languages'][language] = stats['languages'].get(language, 0) + 1
+            self._emit(line.rstrip())
+            return
+
+        stripped = line.rstrip()
+        if not stripped:
+            # 연속된 빈 줄은 하나로, 맨 앞 빈 줄은 제거
+            self._blank_run += 1
+            if self._blank_run == 1 and self._started:
+                self._emit('')
+                self._end_block()
+            return
+        self._blank_run = 0
+        self._started = True
+
+        # 줄 끝 공백 두 칸 이상은 마크다운 강제 줄바꿈이므로 두 칸으로 유지
+        if line.endswith('  ') and not line.endswith('\t'):
+            stripped += '  '
+
+        heading = _HEADING_PATTERN.match(stripped)
+        if heading:
+            stripped = self._check_heading(stripped, heading)
+
+        self._check_inline(stripped)
+        stats['words'] += len(stripped.split())
+        self._emit(stripped)
+
+    def _check_heading(self, line, match):
+        hashes, space, title = match.groups()
+        level = len(hashes)
+        if level > 6:
+            self._issue('warning', f"'#' {level}개는 제목으로 인식되지 않습니다.")
+            return line
+        if not space and title:
+            if level == 1:
+                # '#태그'는 해시태그일 수 있으므로 고치지 않음
+                return line
+            self._issue('warning', f"제목 기호 뒤에 공백이 없어 추가했습니다: {line[:40]}", fixed=True)
+            line = f"{hashes} {title}"
+        if not title:
+            self._issue('warning', "내용이 없는 제목입니다.")
+        self.stats['headings'] += 1
+        if self._last_heading_level and level > self._last_heading_level + 1:
+            self._issue('warning', f"제목 단계가 h{self._last_heading_level}에서 h{level}로 건너뜁니다.")
+        self._last_heading_level = level
+        return line
+
+    def _check_inline(self, line):
+        if '[' not in line:
+            return
+        if '`' in line:
+            line = _INLINE_CODE_PATTERN.sub('', line)
+        images = 0
+        for match in _IMAGE_PATTERN.finditer(line):
+            images += 1
+            url = match.group(2).strip().split(' ')[0]
+            if not url:
+                self._issue('error', f"이미지 주소가 비어 있습니다: {match.group(0)[:60]}")
+            elif not url.startswith(_URL_SCHEMES):
+                self._issue('warning', f"이미지 주소가 http(s)가 아닙니다: {url[:60]}")
+        self.stats['images'] += images
+        if line.count('![') > images:
+            self._issue('warning', "닫히지 않은 이미지 링크가 있습니다.")
+        self.stats['links'] += len(_LINK_PATTERN.findall(line))
+
+    def finish(self):
+        """남은 내용을 처리하고 MarkdownReport 반환 (닫히지 않은 코드 블록은 닫아줌)"""
+        if self._partial:
+            self._add_line(self._partial)
+            self._partial = ''
+        if self._fence is not None:
+            self._issue('error', f"{self._fence_line}번째 줄의 코드 블록({self._fence})이 닫히지 않아 끝에 닫았습니다.",
+                        fixed=True)
+            self._emit(self._fence)
+            self._fence = None
+        # 마지막 빈 줄 제거
+        if self._block and self._block[-1] == '\n':
+            self._block.pop()
+            self._block_size -= 1
+        elif not self._block and self._chunk and self._chunk[-1] == '\n':
+            self._chunk.pop()
+            self._chunk_size -= 1
+        self._end_block()
+        self._flush_chunk()
+
+        text = ''.join(self._chunks)
+        self.stats['chars'] = len(text)
+        self.stats['bytes'] = len(text.encode('utf-8'))
+        self.stats['lines'] = text.count('\n')
+        return MarkdownReport(text, self._chunks, self.issues, self.stats)
+
+
+def analyze_markdown(text, chunk_chars=DEFAULT_CHUNK_CHARS):
+    """본문 전체를 한 번에 점검"""
+    analyzer = MarkdownAnalyzer(chunk_chars=chunk_chars)
+    analyzer.feed(text)
+    return analyzer.finish()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+스트리밍 AI 응답을 마크다운 섹션 단위로 조립
+토큰이 도착하는 대로 줄을 모아 제목(#) 기준으로 섹션을 확정하고,
+백그라운드 스레드에서 스트림을 소비해 브라우저 준비와 생성을 겹쳐 실행
+"""
+
+import threading
+
+FENCE_MARKERS = ('```', '~~~')
+
+
+class SectionBuilder:
+    def __init__(self):
+        self.sections = []
+        self._current = []
+        self._partial = ''
+        self._fence = None
+        # finish()에서 닫아준 코드 펜스 (없으면 None)
+        self.closed_fence = None
+
+    @property
+    def in_code_block(self):
+        return self._fence is not None
+
+    def feed(self, text):
+        """텍스트 조각 추가, 이번에 확정된 섹션 목록 반환"""
+        completed = []
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            section = self._add_line(line)
+            if section is not None:
+                completed.append(section)
+        return completed
+
+    def _add_line(self, line):
+        stripped = line.lstrip()
+        marker = next((m for m in FENCE_MARKERS if stripped.startswith(m)), None)
+
+        if marker is not None:
+            if self._fence is None:
+                self._fence = marker
+            elif marker == self._fence and stripped.strip() == marker:
+                self._fence = None
+            self._current.append(line)
+            return None
+
+        # 코드 블록 밖의 제목 줄에서 이전 섹션 확정
+        if self._fence is None and stripped.startswith('#') and self._current:
+            section = '\n'.join(self._current).strip('\n')
+            self._current = [line]
+            if section:
+                self.sections.append(section)
+                return section
+            return None
+
+        self._current.append(line)
+        return None
+
+    def finish(self):
+        """남은 내용을 마지막 섹션으로 확정 (닫히지 않은 코드 블록은 닫아줌)"""
+        if self._partial:
+            self._add_line(self._partial)
+            self._partial = ''
+        if self._fence is not None:
+            self._current.append(self._fence)
+            self.closed_fence = self._fence
+            self._fence = None
+        section = '\n'.join(self._current).strip('\n')
+        self._current = []
+        if section:
+            self.sections.append(section)
+        return section or None
+
+    def text(self):
+        return '\n\n'.join(self.sections)
+
+
+class StreamingContent:
+    """
+    본문 스트림을 백그라운드에서 소비하는 자리표시자
+    post_data['content']에 넣어두면 게시 단계에서 본문이 필요할 때 result()로 기다림
+    """
+
+    def __init__(self, chunks, on_section=None):
+        self.builder = SectionBuilder()
+        self.error = None
+        self.chars = 0
+        self._chunks = []
+        self._on_section = on_section
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._consume, args=(chunks,), daemon=True)
+        self._thread.start()
+
+    def _consume(self, chunks):
+        try:
+            for chunk in chunks:
+                self.chars += len(chunk)
+                self._chunks.append(chunk)
+                for section in self.builder.feed(chunk):
+                    if self._on_section:
+                        self._on_section(section)
+            last = self.builder.finish()
+            if last and self._on_section:
+                self._on_section(last)
+        except Exception as e:
+            self.error = e
+        finally:
+            self._done.set()
+
+    def done(self):
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """생성 완료까지 기다린 뒤 전체 본문 반환"""
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"본문 생성이 {timeout}초 안에 끝나지 않았습니다.")
+        if self.error is not None:
+            raise self.error
+        # 원문 공백을 그대로 유지하고, 닫히지 않은 코드 블록만 보정
+        text = ''.join(self._chunks)
+        if self.builder.closed_fence:
+            text = text.rstrip('\n') + '\n' + self.builder.closed_fence + '\n'
+        return text
+
+    def __len__(self):
+        return self.chars
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+프로세스 내부 지표 레지스트리 (Prometheus 텍스트 형식)
+카운터/게이지/히스토그램을 모듈 전역 registry에 등록하고, 오래 도는 프로세스(--daemon 등)는
+로컬 HTTP 엔드포인트로, 한 번 실행하고 끝나는 경우는 종료 시 파일로 내보냄
+
+기록 비용: 레이블을 미리 고정한 자식(labels(...))에 값 하나를 더하는 것뿐
+(경쟁 없는 작은 락 하나, 히스토그램은 고정 구간 이진 탐색 + 리스트 칸 증가)
+
+사용법:
+    python post_writer.py --daemon --metrics-port 9464     # http://127.0.0.1:9464/metrics
+    python post_writer.py --metrics-file metrics.prom       # 종료 시 기록 (node_exporter textfile 수집기 호환)
+"""
+
+import os
+import atexit
+import bisect
+import threading
+
+# 초 단위 지연 시간 구간 (브라우저 단계는 수십 ms ~ 수십 초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _label_text(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class _Value:
+    """카운터/게이지 자식 하나"""
+
+    __slots__ = ('_lock', 'value')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value):
+        self.value = value
+
+
+class _Buckets:
+    """히스토그램 자식 하나 (구간별 개수는 내보낼 때 누적)"""
+
+    __slots__ = ('_lock', '_bounds', 'counts', 'sum')
+
+    def __init__(self, bounds):
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        # 마지막 칸은 +Inf
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class Metric:
+    """
+    레이블 이름이 같은 자식들의 묶음
+    레이블이 없으면 지표 자체에 inc/set/observe를 호출하고, 있으면 labels(...)로 자식을 받아 사용
+    """
+
+    kind = None
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children = {}
+        self._default = None if self.labelnames else self._new_child()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """레이블 값에 해당하는 자식 (자주 쓰는 조합은 모듈 상수로 미리 받아둘 것)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 레이블 {self.labelnames}가 필요합니다.")
+            with self._lock:
+                child = self._children.setdefault(tuple(str(v) for v in values), self._new_child())
+                self._children[values] = child
+        return child
+
+    def _samples(self):
+        """[(레이블 값 튜플, 자식), ...] (같은 자식이 여러 키로 등록된 경우 한 번만)"""
+        if self._default is not None:
+            return [((), self._default)]
+        with self._lock:
+            items = list(self._children.items())
+        seen = set()
+        samples = []
+        for values, child in sorted(items, key=lambda item: tuple(map(str, item[0]))):
+            if id(child) not in seen:
+                seen.add(id(child))
+                samples.append((tuple(map(str, values)), child))
+        return samples
+
+    def collect(self, lines):
+        lines.append(f"# HELP {self.name} {self.help}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        for values, child in self._samples():
+            lines.append(f"{self.name}{_label_text(self.labelnames, values)} {_format_value(child.value)}")
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+    def dec(self, amount=1):
+        self._default.dec(amount)
+
+    def set(self, value):
+        self._default.set(value)
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help_text, labelnames)
+
+    def _new_child(self):
+        return _Buckets(self.buckets)
+
+    def observe(self, value):
+        self._default.observe(value)
+
+    def collect(self, lines):
+        lines.append(f"# HELP {self.name} {self.help}")
+        lines.append(f"# TYPE {self.name} histogram")
+        for values, child in self._samples():
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(f"{self.name}_bucket{_label_text(self.labelnames, values, le)} {cumulative}")
+            labels = _label_text(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+
+
+class CallbackGauge(Metric):
+    """내보낼 때마다 func()로 값을 읽는 게이지 (None이면 생략, dict면 {레이블 값 튜플: 값})"""
+
+    kind = 'gauge'
+
+    def __init__(self, name, help_text, func, labelnames=()):
+        self.func = func
+        super().__init__(name, help_text, labelnames)
+
+    def _new_child(self):
+        return None
+
+    def collect(self, lines):
+        try:
+            value = self.func()
+        except Exception:
+            value = None
+        if value is None:
+            return
+        lines.append(f"# HELP {self.name} {self.help}")
+        lines.append(f"# TYPE {self.name} gauge")
+        samples = value.items() if isinstance(value, dict) else [((), value)]
+        for values, sample in samples:
+            lines.append(f"{self.name}{_label_text(self.labelnames, values)} {_format_value(sample)}")
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+        self._server = None
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                # 모듈을 다시 불러와도 같은 지표를 이어서 사용
+                return existing
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help_text, labelnames=()):
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name, help_text, labelnames=()):
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def callback_gauge(self, name, help_text, func, labelnames=()):
+        return self._register(CallbackGauge(name, help_text, func, labelnames))
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def render(self):
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            metric.collect(lines)
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        """현재 값을 파일에 원자적으로 기록"""
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  지표 파일 기록 실패: {e}")
+
+    def dump_at_exit(self, path):
+        """프로세스 종료 시 dump (한 번 실행하고 끝나는 경우)"""
+        atexit.register(self.dump, path)
+
+    def serve(self, port, host='127.0.0.1'):
+        """백그라운드 스레드에서 /metrics 엔드포인트 시작, 서버 객체 반환"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='velog-metrics', daemon=True).start()
+        self._server = server
+        return server
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def observe_stages(self, tracer, histogram):
+        """
+        tracer의 모든 단계(span) 소요 시간을 histogram{stage=이름}에 기록
+        추적 파일이 없어도 단계 시간만 측정됨
+        """
+        children = {}
+
+        def observe(name, seconds):
+            child = children.get(name)
+            if child is None:
+                child = children[name] = histogram.labels(name)
+            child.observe(seconds)
+
+        tracer.observer = observe
+
+
+# -- 프로세스/브라우저 메모리 (내보낼 때만 /proc에서 읽음, Linux 외에는 생략) --------------
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _rss_bytes(pid):
+    try:
+        with open(f'/proc/{pid}/statm', 'r') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def process_rss_bytes():
+    if not os.path.exists('/proc/self/statm'):
+        return None
+    return _rss_bytes('self')
+
+
+def child_processes_rss_bytes():
+    """이 프로세스의 모든 하위 프로세스(Playwright 드라이버 + 브라우저) 상주 메모리 합계"""
+    if not os.path.isdir('/proc'):
+        return None
+    parents = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+            # comm에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤에서 ppid를 읽음
+            ppid = int(stat[stat.rindex(')') + 2:].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        parents.setdefault(ppid, []).append(int(entry))
+    total = 0
+    stack = list(parents.get(os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        total += _rss_bytes(pid)
+        stack.extend(parents.get(pid, []))
+    return total
+
+
+# 모듈 전역 레지스트리 (post_writer / content_generator / selector_resolver 공용)
+registry = MetricsRegistry()
+
+registry.callback_gauge('velog_process_resident_memory_bytes', '이 프로세스의 상주 메모리', process_rss_bytes)
+registry.callback_gauge('velog_browser_resident_memory_bytes',
+                        '하위 프로세스(Playwright 드라이버와 브라우저)의 상주 메모리 합계',
+                        child_processes_rss_bytes)
+
+# -- 지표 목록 (자주 쓰는 레이블 조합은 자식을 미리 받아 둠) ---------------------------------
+
+# tracer의 단계 이름(goto_write, body_insert, ai_request, publish ...)별, observe_stages()로 켬
+STAGE_SECONDS = registry.histogram('velog_stage_seconds', '게시/생성 단계별 소요 시간(초)', ('stage',))
+
+AI_REQUESTS = registry.counter('velog_ai_requests_total', 'AI API 요청 수 (결과별)', ('result',))
+AI_REQUEST_OK = AI_REQUESTS.labels('ok')
+AI_REQUEST_HTTP_ERROR = AI_REQUESTS.labels('http_error')
+AI_REQUEST_NETWORK_ERROR = AI_REQUESTS.labels('network_error')
+AI_RETRIES = registry.counter('velog_ai_retries_total', '429/5xx/네트워크 오류 후 AI API 재시도 수')
+AI_FALLBACKS = registry.counter('velog_ai_fallbacks_total', 'AI 생성 실패로 기본 콘텐츠를 쓴 횟수', ('reason',))
+AI_FALLBACK_STREAM_ERROR = AI_FALLBACKS.labels('stream_error')
+AI_FALLBACK_API_ERROR = AI_FALLBACKS.labels('api_error')
+AI_FALLBACK_ERROR = AI_FALLBACKS.labels('error')
+
+GENERATIONS = registry.counter('velog_generations_total', '생성한 본문 수 (출처별)', ('source',))
+GENERATED_AI = GENERATIONS.labels('ai')
+GENERATED_BASIC = GENERATIONS.labels('basic')
+
+CACHE_REQUESTS = registry.counter('velog_cache_requests_total', '캐시 조회 수', ('cache', 'result'))
+AI_CACHE_HIT = CACHE_REQUESTS.labels('ai_response', 'hit')
+AI_CACHE_MISS = CACHE_REQUESTS.labels('ai_response', 'miss')
+IMAGE_CACHE_HIT = CACHE_REQUESTS.labels('image', 'hit')
+IMAGE_CACHE_MISS = CACHE_REQUESTS.labels('image', 'miss')
+
+PUBLISHES = registry.counter('velog_publish_total', '게시 시도 결과', ('path', 'outcome'))
+PUBLISH_OUTCOMES = ('ok', 'failed', 'ambiguous', 'session_expired')
+
+
+def publish_outcomes(path):
+    """게시 경로 하나의 결과별 자식 {outcome: 카운터} (모듈 상수나 생성자에서 한 번만 받아 둘 것)"""
+    return {outcome: PUBLISHES.labels(path, outcome) for outcome in PUBLISH_OUTCOMES}
+
+
+API_PUBLISHES = publish_outcomes('api')
+PUBLISH_RETRIES = registry.counter('velog_publish_retries_total', '작업 저장소에서 다시 시도한 게시 수')
+LOGIN_CHECK_FAILURES = registry.counter('velog_login_check_failures_total',
+                                        '로그인 확인 실패 수 (http: 세션 확인, browser: 메인 페이지)', ('check',))
+HTTP_LOGIN_CHECK_FAILED = LOGIN_CHECK_FAILURES.labels('http')
+BROWSER_LOGIN_CHECK_FAILED = LOGIN_CHECK_FAILURES.labels('browser')
+SELECTOR_LOOKUPS = registry.counter('velog_selector_lookups_total',
+                                    '셀렉터 탐색 결과 (cached: 기억한 셀렉터, found: 다른 후보, missing: 없음)',
+                                    ('group', 'result'))
+
+
+def selector_lookups(group):
+    """셀렉터 그룹 하나의 결과별 자식 {result: 카운터}"""
+    return {result: SELECTOR_LOOKUPS.labels(group, result) for result in ('cached', 'found', 'missing')}
+
+FAILURE_CAPTURES = registry.counter('velog_failure_captures_total', '저장한 실패 기록 수 (단계별)', ('stage',))
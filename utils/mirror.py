@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+게시한 글의 로컬 미러 (마크다운 파일 + SQLite 색인)
+GraphQL 목록 조회로 글마다 updated_at을 받아 로컬 색인과 비교하고, 새 글과 수정된 글의 본문만
+제한된 동시성으로 가져옴. 첫 동기화 이후에는 목록 페이지 몇 번이면 끝남
+
+미러 구조:
+    velog_mirror/posts/<url_slug>-<id>.md   front matter(JSON 값) + 본문
+    velog_mirror/index.sqlite3         제목/태그/시리즈 색인
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.graphql_publisher import SessionExpiredError
+
+DEFAULT_MIRROR_DIR = 'velog_mirror'
+
+_UNSAFE_FILENAME = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def _key(text):
+    """대소문자/공백 차이를 무시하는 검색 키"""
+    return ' '.join((text or '').lower().split())
+
+
+def _filename(post):
+    """
+    url_slug를 파일 이름으로 쓸 수 있게 정리하고 글 id를 붙임
+    (정리하거나 120자로 자른 slug가 같은 두 글이 서로의 파일을 덮어쓰지 않도록)
+    """
+    post_id = _UNSAFE_FILENAME.sub('-', str(post['id'])).strip('-.')
+    name = _UNSAFE_FILENAME.sub('-', post.get('url_slug') or '').strip('-.')[:120]
+    return f"{name}-{post_id}.md" if name else f"{post_id}.md"
+
+
+def render_markdown(post, url):
+    """front matter + 본문 (값은 JSON이라 YAML로도 읽힘)"""
+    series = post.get('series')
+    meta = {
+        'id': post['id'],
+        'title': post['title'],
+        'url': url,
+        'series': series['name'] if series else None,
+        'tags': post.get('tags') or [],
+        'released_at': post.get('released_at'),
+        'updated_at': post.get('updated_at'),
+    }
+    header = '\n'.join(f"{key}: {json.dumps(value, ensure_ascii=False)}" for key, value in meta.items())
+    return f"---\n{header}\n---\n\n{post.get('body') or ''}"
+
+
+class PostMirror:
+    def __init__(self, root=DEFAULT_MIRROR_DIR):
+        self.root = root
+        self.posts_dir = os.path.join(root, 'posts')
+        os.makedirs(self.posts_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(root, 'index.sqlite3'), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS posts (
+                id TEXT PRIMARY KEY,
+                url_slug TEXT NOT NULL,
+                title TEXT NOT NULL,
+                title_key TEXT NOT NULL,
+                series TEXT,
+                series_key TEXT,
+                tags TEXT NOT NULL,
+                url TEXT,
+                path TEXT NOT NULL,
+                body_size INTEGER NOT NULL,
+                released_at TEXT,
+                updated_at TEXT,
+                deleted INTEGER NOT NULL DEFAULT 0,
+                synced_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_posts_title ON posts (title_key);
+            CREATE INDEX IF NOT EXISTS idx_posts_series ON posts (series_key);
+            CREATE TABLE IF NOT EXISTS post_tags (
+                tag_key TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                PRIMARY KEY (tag_key, post_id)
+            ) WITHOUT ROWID;
+        """)
+        self._conn.commit()
+
+    def versions(self):
+        """{글 id: updated_at} (삭제 표시된 글 제외)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, updated_at FROM posts WHERE deleted = 0").fetchall()
+        return {row['id']: row['updated_at'] for row in rows}
+
+    def save(self, post, url):
+        """본문 파일을 원자적으로 쓰고 색인 갱신"""
+        path = os.path.join(self.posts_dir, _filename(post))
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(render_markdown(post, url))
+        os.replace(tmp_path, path)
+
+        series = (post.get('series') or {}).get('name')
+        tags = post.get('tags') or []
+        with self._lock:
+            old = self._conn.execute("SELECT path FROM posts WHERE id = ?", (post['id'],)).fetchone()
+            self._conn.execute(
+                """INSERT OR REPLACE INTO posts
+                   (id, url_slug, title, title_key, series, series_key, tags, url, path, body_size,
+                    released_at, updated_at, deleted, synced_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?)""",
+                (post['id'], post.get('url_slug') or '', post['title'], _key(post['title']),
+                 series, _key(series) if series else None, json.dumps(tags, ensure_ascii=False),
+                 url, path, len(post.get('body') or ''), post.get('released_at'), post.get('updated_at'),
+                 time.time())
+            )
+            self._conn.execute("DELETE FROM post_tags WHERE post_id = ?", (post['id'],))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO post_tags (tag_key, post_id) VALUES (?, ?)",
+                [(_key(tag), post['id']) for tag in tags]
+            )
+            self._conn.commit()
+        # 제목(url_slug)이 바뀌었으면 이전 파일 정리
+        if old and old['path'] != path and os.path.exists(old['path']):
+            os.remove(old['path'])
+
+    def mark_deleted(self, post_ids):
+        """블로그에서 사라진 글 표시 (백업용으로 파일은 남겨둠)"""
+        with self._lock:
+            self._conn.executemany("UPDATE posts SET deleted = 1 WHERE id = ?", [(i,) for i in post_ids])
+            self._conn.commit()
+
+    def find(self, title=None, tag=None, series=None, limit=50):
+        """
+        제목(부분 일치), 태그, 시리즈 이름으로 검색 (조건은 AND)
+        [{'id', 'title', 'url', 'series', 'tags', 'updated_at', 'path'}, ...] 최신 글부터
+        """
+        where = ["p.deleted = 0"]
+        params = []
+        if tag:
+            where.append("p.id IN (SELECT post_id FROM post_tags WHERE tag_key = ?)")
+            params.append(_key(tag))
+        if series:
+            where.append("p.series_key = ?")
+            params.append(_key(series))
+        if title:
+            where.append("p.title_key LIKE ? ESCAPE '\\'")
+            escaped = _key(title).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params.append(f"%{escaped}%")
+        with self._lock:
+            rows = self._conn.execute(
+                f"""SELECT id, title, url, series, tags, updated_at, path FROM posts p
+                    WHERE {' AND '.join(where)} ORDER BY released_at DESC LIMIT ?""",
+                params + [limit]
+            ).fetchall()
+        return [dict(row, tags=json.loads(row['tags'])) for row in rows]
+
+    def series_counts(self):
+        """{시리즈 이름: 글 수}"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT series, COUNT(*) FROM posts WHERE deleted = 0 AND series IS NOT NULL GROUP BY series"
+            ).fetchall()
+        return {series: count for series, count in rows}
+
+    def read_body(self, post_id):
+        """미러에 저장된 본문 (front matter 제외, 없으면 None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT path FROM posts WHERE id = ?", (post_id,)).fetchone()
+        if row is None:
+            return None
+        with open(row['path'], 'r', encoding='utf-8') as f:
+            text = f.read()
+        return text.split('\n---\n\n', 1)[1] if text.startswith('---\n') else text
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts WHERE deleted = 0").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class MirrorSync:
+    """
+    목록은 커서 페이지를 차례로, 본문은 바뀐 글만 concurrency개씩 동시에 가져옴
+    publisher는 GraphQLPublisher (연결 풀 크기는 concurrency 이상 권장)
+    """
+
+    def __init__(self, publisher, mirror, concurrency=8, page_size=50):
+        self.publisher = publisher
+        self.mirror = mirror
+        self.concurrency = max(1, concurrency)
+        self.page_size = page_size
+
+    def list_all(self):
+        """내 글 전체 목록 (본문 제외)"""
+        posts = []
+        cursor = None
+        while True:
+            page = self.publisher.list_posts(cursor=cursor, limit=self.page_size)
+            posts.extend(page)
+            if len(page) < self.page_size:
+                return posts
+            cursor = page[-1]['id']
+
+    def _fetch(self, summary):
+        try:
+            return summary, self.publisher.read_post(summary['url_slug']), None
+        except SessionExpiredError:
+            raise
+        except Exception as e:
+            return summary, None, e
+
+    def sync(self, full=False, on_post=None):
+        """
+        미러 갱신 후 결과 통계 반환
+        full=True면 updated_at과 관계없이 모든 본문을 다시 가져옴
+        on_post(post, url)는 새로 가져온 글마다 호출
+        """
+        started = time.perf_counter()
+        local = self.mirror.versions()
+        listed = self.list_all()
+        changed = [p for p in listed if full or local.get(p['id']) != p.get('updated_at')]
+        removed = set(local) - {p['id'] for p in listed}
+
+        fetched = failed = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for summary, post, error in executor.map(self._fetch, changed):
+                if post is None:
+                    failed += 1
+                    print(f"⚠️  글을 가져오지 못했습니다: {summary['title']} ({error or '없음'})")
+                    continue
+                url = self.publisher.post_url(post['url_slug'])
+                self.mirror.save(post, url)
+                fetched += 1
+                if on_post is not None:
+                    on_post(post, url)
+
+        if removed:
+            self.mirror.mark_deleted(removed)
+        return {
+            'listed': len(listed),
+            'fetched': fetched,
+            'unchanged': len(listed) - len(changed),
+            'deleted': len(removed),
+            'failed': failed,
+            'elapsed': time.perf_counter() - started,
+        }
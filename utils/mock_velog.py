@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+오프라인 테스트용 로컬 Velog 대역 서버
+post_writer가 사용하는 셀렉터(제목 textarea, 에디터, 태그 입력, 2단계 출간 모달)를 그대로 제공
+
+사용법:
+    python -m utils.mock_velog --port 8765
+"""
+
+import json
+import time
+import hashlib
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, unquote
+from email.parser import BytesParser
+from email.policy import HTTP
+
+MOCK_USERNAME = 'tester'
+MOCK_TOKEN = 'mock-access-token'
+# refresh_token만 있으면 새 access_token을 Set-Cookie로 내려줌
+MOCK_REFRESH_TOKEN = 'mock-refresh-token'
+
+# editPost가 덮어쓰는 필드 (하나라도 빠지면 대역 서버는 요청을 거부)
+EDIT_POST_FIELDS = ('title', 'body', 'tags', 'is_markdown', 'is_temp', 'is_private', 'url_slug',
+                    'thumbnail', 'meta', 'series_id')
+
+# /v1/chat/completions 대역이 돌려주는 본문
+MOCK_COMPLETION = """# 로컬 대역 서버 테스트
+
+스트리밍 응답을 검증하기 위한 예시 글입니다.
+
+![구성도](https://example.com/diagram.png)
+
+## 문제 상황
+
+```python
+def main():
+    # 주석은 제목이 아님
+    return 'hello'
+```
+
+## 결과
+
+- 첫 번째 항목
+- 두 번째 항목
+
+## 마무리
+
+읽어주셔서 감사합니다.
+"""
+
+HOME_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>velog (mock)</title></head>
+<body>
+  {nav}
+  <main><h1>velog mock</h1></main>
+</body></html>
+"""
+
+WRITE_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>write (mock)</title>
+<style>
+  .CodeMirror-code { min-height: 200px; white-space: pre-wrap; border: 1px solid #ccc; }
+  .modal { display: none; }
+  .modal.open { display: block; }
+  .tag { margin-right: 4px; }
+</style>
+</head>
+<body>
+  <textarea placeholder="제목을 입력하세요"></textarea>
+  <div class="tags"><span id="tag-list"></span><input placeholder="태그를 입력하세요"></div>
+  <div class="CodeMirror"><div class="CodeMirror-code" contenteditable="true"></div></div>
+  <button id="open-publish">출간하기</button>
+  <div class="modal">
+    <button data-testid="publish">출간하기</button>
+  </div>
+  <div id="error"></div>
+<script>
+  const code = document.querySelector('.CodeMirror-code');
+  // CodeMirror 5 인스턴스를 흉내내는 최소 API
+  document.querySelector('.CodeMirror').CodeMirror = {
+    getValue: () => code.innerText,
+    setValue: (value) => { code.innerText = value; },
+    focus: () => code.focus(),
+    execCommand: () => {}
+  };
+  code.addEventListener('paste', (event) => {
+    event.preventDefault();
+    document.execCommand('insertText', false, event.clipboardData.getData('text/plain'));
+  });
+
+  const tags = [];
+  const tagInput = document.querySelector('input[placeholder*="태그"]');
+  tagInput.addEventListener('keydown', (event) => {
+    if (event.key !== 'Enter' || !tagInput.value) return;
+    tags.push(tagInput.value);
+    const chip = document.createElement('span');
+    chip.className = 'tag';
+    chip.textContent = tagInput.value;
+    document.getElementById('tag-list').appendChild(chip);
+    tagInput.value = '';
+  });
+
+  document.getElementById('open-publish').addEventListener('click', () => {
+    setTimeout(() => document.querySelector('.modal').classList.add('open'), {modal_delay});
+  });
+
+  document.querySelector('button[data-testid="publish"]').addEventListener('click', async () => {
+    const title = document.querySelector('textarea[placeholder*="제목"]').value;
+    const body = code.innerText;
+    if (!title.trim() || !body.trim()) {
+      document.getElementById('error').innerHTML = '<div>제목 또는 내용이 비어있습니다</div>';
+      return;
+    }
+    const res = await fetch('/api/posts', {
+      method: 'POST',
+      headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify({title, body, tags})
+    });
+    const post = await res.json();
+    location.href = '/@{username}/' + encodeURIComponent(post.url_slug);
+  });
+</script>
+</body></html>
+"""
+
+
+def _iso(timestamp):
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(timestamp)) + f".{int(timestamp * 1000) % 1000:03d}Z"
+
+
+class MockVelogState:
+    def __init__(self, delay_ms=0, modal_delay_ms=50, chunk_delay_ms=5, chunk_size=8):
+        self.delay_ms = delay_ms
+        self.modal_delay_ms = modal_delay_ms
+        # 스트리밍 응답 조각 크기(글자 수)와 조각 사이 지연
+        self.chunk_delay_ms = chunk_delay_ms
+        self.chunk_size = chunk_size
+        self.posts = []
+        self.series = []
+        # editPost 요청마다 실제로 값이 바뀐 필드 이름 목록
+        self.edits = []
+        # 업로드된 이미지 {파일 이름: PNG 바이트}와 업로드 요청 수
+        self.images = {}
+        self.uploads = 0
+        self._lock = threading.Lock()
+
+    def add_series(self, name, url_slug):
+        with self._lock:
+            series = {'id': str(len(self.series) + 1), 'name': name, 'url_slug': url_slug}
+            self.series.append(series)
+            return series
+
+    def add_post(self, data):
+        with self._lock:
+            post_id = len(self.posts) + 1
+            post = {
+                'id': str(post_id),
+                'title': data.get('title', ''),
+                'body': data.get('body', ''),
+                'tags': data.get('tags', []),
+                'series_id': data.get('series_id'),
+                'url_slug': data.get('url_slug') or f"post-{post_id}",
+                'is_private': bool(data.get('is_private')),
+                'thumbnail': data.get('thumbnail'),
+                'meta': data.get('meta') or {},
+                'released_at': time.time(),
+                'updated_at': time.time(),
+            }
+            self.posts.append(post)
+            return post
+
+    def update_post(self, post_id, **fields):
+        """글 수정 (updated_at 갱신), (수정된 글, 값이 바뀐 필드 이름 목록) 반환"""
+        with self._lock:
+            post = self.posts[int(post_id) - 1]
+            changed = sorted(k for k, v in fields.items() if post.get(k) != v)
+            post.update(fields)
+            post['updated_at'] = time.time()
+            return post, changed
+
+    def post_view(self, post, with_body=False):
+        """GraphQL 응답 형태 (시각은 ISO 8601 문자열)"""
+        view = {
+            'id': post['id'],
+            'title': post['title'],
+            'url_slug': post['url_slug'],
+            'tags': post['tags'],
+            'is_private': post['is_private'],
+            'released_at': _iso(post['released_at']),
+            'updated_at': _iso(post['updated_at']),
+        }
+        if with_body:
+            series = next((s for s in self.series if s['id'] == post['series_id']), None)
+            view['body'] = post['body']
+            view['thumbnail'] = post['thumbnail']
+            view['meta'] = post['meta']
+            view['series'] = {'id': series['id'], 'name': series['name']} if series else None
+        return view
+
+    def add_image(self, data):
+        with self._lock:
+            self.uploads += 1
+            name = f"{hashlib.sha256(data).hexdigest()[:16]}-{self.uploads}.png"
+            self.images[name] = data
+            return name
+
+
+class MockVelogHandler(BaseHTTPRequestHandler):
+    state = None  # make_server에서 주입
+
+    def log_message(self, format, *args):
+        pass
+
+    def _logged_in(self):
+        cookie = self.headers.get('Cookie') or ''
+        if MOCK_TOKEN in cookie:
+            return True
+        if MOCK_REFRESH_TOKEN in cookie:
+            self._issue_token = True
+            return True
+        return False
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8'):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if getattr(self, '_issue_token', False):
+            self.send_header('Set-Cookie', f'access_token={MOCK_TOKEN}; Path=/; Max-Age=3600; HttpOnly')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, data):
+        self._send(status, json.dumps(data, ensure_ascii=False), 'application/json; charset=utf-8')
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode('utf-8'))
+
+    def _delay(self):
+        if self.state.delay_ms:
+            time.sleep(self.state.delay_ms / 1000)
+
+    def do_GET(self):
+        self._delay()
+        path = unquote(urlparse(self.path).path)
+
+        if path == '/':
+            if self._logged_in():
+                nav = f'<a href="/@{MOCK_USERNAME}">{MOCK_USERNAME}</a>'
+            else:
+                nav = '<button>로그인</button>'
+            self._send(200, HOME_HTML.format(nav=nav))
+        elif path == '/write':
+            self._send(200, WRITE_HTML
+                       .replace('{modal_delay}', str(self.state.modal_delay_ms))
+                       .replace('{username}', MOCK_USERNAME))
+        elif path == '/api/posts':
+            self._send_json(200, self.state.posts)
+        elif path.startswith(f'/@{MOCK_USERNAME}'):
+            self._send(200, f'<html><body><h1>{path}</h1></body></html>')
+        elif path.startswith('/images/') and path[len('/images/'):] in self.state.images:
+            self._send(200, self.state.images[path[len('/images/'):]], 'image/png')
+        else:
+            self._send(404, 'not found', 'text/plain')
+
+    def do_POST(self):
+        self._delay()
+        path = urlparse(self.path).path
+
+        if path == '/api/posts':
+            if not self._logged_in():
+                self._send_json(401, {'error': 'unauthorized'})
+                return
+            self._send_json(200, self.state.add_post(self._read_json()))
+        elif path == '/graphql':
+            self._handle_graphql(self._read_json())
+        elif path == '/v1/chat/completions':
+            self._handle_chat(self._read_json())
+        elif path == '/api/v2/files/upload':
+            self._handle_upload()
+        else:
+            self._send(404, 'not found', 'text/plain')
+
+    def _handle_chat(self, payload):
+        """OpenAI chat completions 대역 (stream=True면 SSE로 조각 전송)"""
+        if not payload.get('stream'):
+            self._send_json(200, {
+                'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': MOCK_COMPLETION}}]
+            })
+            return
+
+        self.send_response(200)
+        # llama.cpp llama-server/OpenAI처럼 charset 없이 전송 (본문은 UTF-8)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        size = self.state.chunk_size
+        for start in range(0, len(MOCK_COMPLETION), size):
+            event = {'choices': [{'index': 0, 'delta': {'content': MOCK_COMPLETION[start:start + size]}}]}
+            self.wfile.write(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+            if self.state.chunk_delay_ms:
+                time.sleep(self.state.chunk_delay_ms / 1000)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+    def _handle_upload(self):
+        """이미지 업로드 대역 (multipart의 image 필드를 저장하고 /images/... 주소 반환)"""
+        if not self._logged_in():
+            self._send_json(401, {'error': 'unauthorized'})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        head = f"Content-Type: {self.headers.get('Content-Type', '')}\r\n\r\n".encode('latin-1')
+        message = BytesParser(policy=HTTP).parsebytes(head + self.rfile.read(length))
+        image = None
+        for part in message.iter_parts():
+            if part.get_param('name', header='content-disposition') == 'image':
+                image = part.get_payload(decode=True)
+        if not image:
+            self._send_json(400, {'error': 'image field is required'})
+            return
+
+        host, port = self.server.server_address[:2]
+        name = self.state.add_image(image)
+        self._send_json(200, {'path': f"http://{host}:{port}/images/{name}"})
+
+    def _handle_graphql(self, payload):
+        """GraphQL 대역: 쿼리 이름만 보고 응답 (스키마 검증은 하지 않음)"""
+        query = payload.get('query', '')
+        variables = payload.get('variables') or {}
+
+        if not self._logged_in():
+            self._send_json(200, {
+                'data': None,
+                'errors': [{'message': 'not logged in', 'extensions': {'code': 'UNAUTHENTICATED'}}]
+            })
+            return
+
+        user = {'id': '1', 'username': MOCK_USERNAME}
+        if 'writePost' in query:
+            post = self.state.add_post(variables)
+            data = {'writePost': {'id': post['id'], 'user': user, 'url_slug': post['url_slug']}}
+        elif 'editPost' in query:
+            # 실제 editPost처럼 인자로 모든 필드를 덮어쓰므로, 빠진 인자가 있으면 글이 지워지는 대신 거부
+            missing = [k for k in EDIT_POST_FIELDS if k not in variables]
+            if missing:
+                self._send_json(200, {'data': None, 'errors': [
+                    {'message': f"editPost에 빠진 인자가 있습니다: {', '.join(missing)}"}
+                ]})
+                return
+            fields = {k: variables[k] for k in EDIT_POST_FIELDS if k not in ('is_markdown', 'is_temp')}
+            post, changed = self.state.update_post(variables['id'], **fields)
+            self.state.edits.append(changed)
+            data = {'editPost': {'id': post['id'], 'user': user, 'url_slug': post['url_slug'],
+                                 'updated_at': _iso(post['updated_at'])}}
+        elif 'createSeries' in query:
+            data = {'createSeries': self.state.add_series(variables['name'], variables['url_slug'])}
+        elif 'seriesList' in query:
+            data = {'seriesList': self.state.series}
+        elif 'posts(' in query:
+            # 최신 글부터, cursor보다 id가 작은 글 limit개
+            cursor = int(variables.get('cursor') or 0)
+            posts = [p for p in reversed(self.state.posts) if not cursor or int(p['id']) < cursor]
+            data = {'posts': [self.state.post_view(p) for p in posts[:variables.get('limit') or 20]]}
+        elif 'post(' in query:
+            if variables.get('id'):
+                post = next((p for p in self.state.posts if p['id'] == str(variables['id'])), None)
+            else:
+                post = next((p for p in self.state.posts if p['url_slug'] == variables.get('url_slug')), None)
+            data = {'post': self.state.post_view(post, with_body=True) if post else None}
+        elif 'auth' in query:
+            data = {'auth': user}
+        else:
+            self._send_json(200, {'data': None, 'errors': [{'message': 'unknown query'}]})
+            return
+        self._send_json(200, {'data': data})
+
+
+def make_server(host='127.0.0.1', port=0, delay_ms=0, modal_delay_ms=50):
+    """대역 서버 생성 (port=0이면 빈 포트 자동 할당)"""
+    state = MockVelogState(delay_ms=delay_ms, modal_delay_ms=modal_delay_ms)
+    handler = type('BoundMockVelogHandler', (MockVelogHandler,), {'state': state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.state = state
+    return server
+
+
+def start_in_thread(**kwargs):
+    """백그라운드 스레드에서 서버를 띄우고 (server, base_url) 반환"""
+    server = make_server(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def mock_session_data(base_url):
+    """대역 서버용 세션 데이터 (velog_session.json과 같은 형식)"""
+    host = urlparse(base_url).hostname
+    return {
+        'cookies': [{
+            'name': 'access_token',
+            'value': MOCK_TOKEN,
+            'domain': host,
+            'path': '/',
+        }, {
+            'name': 'refresh_token',
+            'value': MOCK_REFRESH_TOKEN,
+            'domain': host,
+            'path': '/',
+        }],
+        'localStorage': {},
+        'sessionStorage': {},
+        'user_agent': 'Mozilla/5.0 (X11; Linux x86_64) velog-mock',
+        'url': base_url,
+        'timestamp': time.time(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 Velog 대역 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay-ms', type=int, default=0, help='모든 응답에 추가할 지연 (ms)')
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, delay_ms=args.delay_ms)
+    print(f"🧪 Velog 대역 서버 실행 중: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
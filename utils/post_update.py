@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+이미 게시된 글을 새로 만들지 않고 바뀐 부분만 수정
+게시된 글을 한 번 읽어 제목/본문/태그/시리즈를 비교하고, 달라진 필드가 있을 때만 editPost로 수정
+(editPost는 전체 필드를 덮어쓰므로 바뀌지 않은 필드는 읽어온 값 그대로 전송)
+본문은 같은 규칙으로 정리(markdown_check)한 뒤 비교하므로 공백 차이만 있으면 수정하지 않음
+
+수정 목록 파일(JSONL) 한 줄 예:
+    {"url": "https://velog.io/@me/my-post", "content": "# 고친 본문 ..."}
+    {"id": "0f6c...", "title": "새 제목", "tags": ["Python", "성능"], "series": null}
+"""
+
+import re
+from urllib.parse import urlparse, unquote
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.markdown_check import analyze_markdown
+
+# post_data 키 → GraphQL 필드
+UPDATE_FIELDS = {'title': 'title', 'content': 'body', 'tags': 'tags', 'series': 'series'}
+
+_URL_PATH_PATTERN = re.compile(r'^/@[^/]+/(.+?)/?$')
+
+
+def parse_post_ref(ref):
+    """글 주소 또는 id → ('slug', url_slug) / ('id', post_id)"""
+    ref = str(ref).strip()
+    if '/' in ref:
+        match = _URL_PATH_PATTERN.match(unquote(urlparse(ref).path))
+        if not match:
+            raise ValueError(f"Velog 글 주소가 아닙니다: {ref}")
+        return 'slug', match.group(1)
+    return 'id', ref
+
+
+def diff_post(published, post_data):
+    """
+    게시된 글(GraphQL post)과 새 post_data를 비교해 바뀐 필드만 {'title', 'body', 'tags', 'series'}로 반환
+    post_data에 없는 키는 그대로 둠
+    """
+    changes = {}
+    if 'title' in post_data and post_data['title'] != published.get('title'):
+        changes['title'] = post_data['title']
+    if 'content' in post_data:
+        body = analyze_markdown(post_data['content']).text
+        if body != analyze_markdown(published.get('body') or '').text:
+            changes['body'] = body
+    if 'tags' in post_data:
+        tags = list(post_data['tags'] or [])
+        # 순서만 다른 태그는 같은 것으로 봄
+        if sorted(tags) != sorted(published.get('tags') or []):
+            changes['tags'] = tags
+    if 'series' in post_data:
+        current = (published.get('series') or {}).get('name')
+        if (post_data['series'] or None) != current:
+            changes['series'] = post_data['series'] or None
+    return changes
+
+
+class PostUpdater:
+    """
+    publisher(GraphQLPublisher)로 게시된 글을 읽고 바뀐 필드만 수정
+    결과: {'ref', 'id', 'url', 'status': 'unchanged'|'updated'|'failed', 'changed': [필드],
+           'unapplied': [대체 경로가 적용하지 못한 필드], 'error'}
+    """
+
+    def __init__(self, publisher, prepare=None, fallback=None):
+        self.publisher = publisher
+        # 비교 전에 post_data를 손보는 함수 (이미지 업로드 등), 인자는 post_data
+        self.prepare = prepare
+        # API 수정이 실패했을 때 쓸 대체 경로 (post, changes) → (URL 또는 None, 적용하지 못한 필드 목록)
+        self.fallback = fallback
+
+    def fetch(self, ref):
+        kind, value = parse_post_ref(ref)
+        if kind == 'slug':
+            return self.publisher.read_post(url_slug=value)
+        return self.publisher.read_post(post_id=value)
+
+    @staticmethod
+    def _result(ref, error=None):
+        return {'ref': ref, 'id': None, 'url': None, 'status': 'failed', 'changed': [], 'unapplied': [],
+                'error': error}
+
+    def update(self, ref, post_data):
+        from utils.graphql_publisher import SessionExpiredError
+
+        result = self._result(ref)
+        try:
+            published = self.fetch(ref)
+            if not published:
+                result['error'] = '글을 찾을 수 없습니다.'
+                return result
+            result['id'] = published['id']
+            result['url'] = self.publisher.post_url(published['url_slug'])
+
+            post_data = dict(post_data)
+            if self.prepare is not None and 'content' in post_data:
+                # 이미지는 내용 해시 색인 덕분에 바뀐 것만 새로 올라가고 나머지는 같은 주소가 됨
+                self.prepare(post_data)
+            changes = diff_post(published, post_data)
+            result['changed'] = sorted(changes)
+            if not changes:
+                result['status'] = 'unchanged'
+                return result
+
+            try:
+                result['url'] = self.publisher.edit_post(published, changes)
+            except SessionExpiredError:
+                raise
+            except Exception as e:
+                if self.fallback is None:
+                    raise
+                print(f"⚠️  API 수정 실패, 수정 페이지로 재시도합니다: {e}")
+                url, unapplied = self.fallback(published, changes)
+                result['unapplied'] = sorted(unapplied)
+                if not url:
+                    raise
+                result['url'] = url
+            result['status'] = 'updated'
+        except Exception as e:
+            result['error'] = str(e)
+        return result
+
+    def update_many(self, items, concurrency=4):
+        """[(ref, post_data), ...]를 동시에 수정, 입력 순서대로 결과 반환"""
+        # 사용자 이름 조회는 스레드 시작 전에 한 번만 (실패하면 모든 항목을 실패로 반환)
+        try:
+            self.publisher.current_username()
+        except Exception as e:
+            return [self._result(ref, str(e)) for ref, _ in items]
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            return list(executor.map(lambda item: self.update(*item), items))
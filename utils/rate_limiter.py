@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+AI API 호출용 속도 제한기와 재시도 백오프
+분당 요청 수 / 분당 토큰 수를 토큰 버킷으로 제한
+"""
+
+import time
+import random
+import threading
+
+
+class TokenBucket:
+    def __init__(self, rate_per_minute, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        # 테스트에서 가짜 시계로 바꿀 수 있도록 시계와 대기 함수를 주입받음
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, amount=1):
+        """amount만큼 토큰이 찰 때까지 대기 후 차감, 대기한 시간(초) 반환"""
+        # 한 번에 용량보다 많이 요청하면 영원히 못 채우므로 용량으로 제한
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._refill(now)
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self.rate
+            self.sleep(delay)
+            waited += delay
+
+
+class RateLimiter:
+    """분당 요청 수와 분당 토큰 수를 함께 제한"""
+
+    def __init__(self, requests_per_minute=60, tokens_per_minute=90000, clock=time.monotonic, sleep=time.sleep):
+        self.requests = TokenBucket(requests_per_minute, clock=clock, sleep=sleep) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute, clock=clock, sleep=sleep) if tokens_per_minute else None
+
+    def acquire(self, tokens=0):
+        waited = 0.0
+        if self.requests is not None:
+            waited += self.requests.acquire(1)
+        if self.tokens is not None and tokens:
+            waited += self.tokens.acquire(tokens)
+        return waited
+
+
+def backoff_delay(attempt, base=1.0, cap=30.0):
+    """지수 백오프 + full jitter (attempt는 0부터)"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def is_retryable_status(status_code):
+    """429(속도 제한)와 5xx만 재시도"""
+    return status_code == 429 or 500 <= status_code < 600
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+비대화형 게시 스케줄러 데몬
+cron 표현식 또는 "간격 + 지터" 일정으로 게시 시각(슬롯)을 만들고,
+다음 슬롯 몇 개 분량의 포스트를 작업 저장소(JobStore)에 미리 생성해 두었다가
+슬롯이 되면 바로 게시. SIGTERM/SIGINT를 받으면 진행 중인 게시를 마치고 종료
+
+일정 예:
+    "0 9,18 * * *"            매일 09:00, 18:00 (분 시 일 월 요일)
+    "*/30 9-18 * * 1-5"       평일 9~18시 30분마다
+    "every 6h jitter 30m"     6시간마다, 각 슬롯을 0~30분 사이 무작위로 늦춤
+"""
+
+import re
+import time
+import signal
+import random
+import itertools
+import threading
+from datetime import datetime, timedelta
+
+from utils.rate_limiter import backoff_delay
+
+_DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)([smhd]?)')
+_DURATION_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_duration(text):
+    """'90', '30m', '1h30m', '2d' → 초"""
+    text = text.strip().lower()
+    matches = list(_DURATION_PATTERN.finditer(text))
+    if not matches or ''.join(m.group(0) for m in matches) != text:
+        raise ValueError(f"시간 형식이 올바르지 않습니다: {text}")
+    return sum(float(m.group(1)) * _DURATION_UNITS[m.group(2)] for m in matches)
+
+
+def _parse_cron_field(text, low, high):
+    values = set()
+    for part in text.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"cron 간격이 올바르지 않습니다: {text}")
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start, end = (int(v) for v in part.split('-', 1))
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end:
+            raise ValueError(f"cron 값이 범위({low}-{high})를 벗어났습니다: {text}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """5필드 cron 표현식 (분 시 일 월 요일, 로컬 시간 기준, 요일 0/7=일요일)"""
+
+    def __init__(self, expression):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드여야 합니다: {expression}")
+        self.expression = expression
+        self.minutes = _parse_cron_field(fields[0], 0, 59)
+        self.hours = _parse_cron_field(fields[1], 0, 23)
+        self.days = _parse_cron_field(fields[2], 1, 31)
+        self.months = _parse_cron_field(fields[3], 1, 12)
+        self.weekdays = frozenset(d % 7 for d in _parse_cron_field(fields[4], 0, 7))
+        self._any_day = fields[2] == '*'
+        self._any_weekday = fields[4] == '*'
+
+    def _day_matches(self, dt):
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+        # cron 규칙: 일/요일이 둘 다 지정되면 둘 중 하나만 맞아도 됨
+        if not self._any_day and not self._any_weekday:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, timestamp):
+        """timestamp 이후 첫 슬롯 (epoch 초)"""
+        dt = datetime.fromtimestamp(timestamp).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * 5)
+        while dt < limit:
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+            elif not self._day_matches(dt):
+                dt = (dt + timedelta(days=1)).replace(hour=0, minute=0)
+            elif dt.hour not in self.hours:
+                dt = (dt + timedelta(hours=1)).replace(minute=0)
+            elif dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+            else:
+                return dt.timestamp()
+        raise ValueError(f"cron 표현식에 해당하는 시각이 없습니다: {self.expression}")
+
+    def __str__(self):
+        return f"cron '{self.expression}'"
+
+
+class IntervalSchedule:
+    """
+    anchor 기준 interval초마다의 슬롯, 각 슬롯을 0~jitter초 사이 무작위로 늦춤
+    같은 슬롯의 지터는 항상 같은 값 (다시 계산해도 슬롯이 흔들리지 않음)
+    """
+
+    def __init__(self, interval, jitter=0, anchor=0, seed=None):
+        if interval <= 0:
+            raise ValueError("간격은 0보다 커야 합니다.")
+        self.interval = interval
+        self.jitter = min(jitter, interval)
+        self.anchor = anchor
+        self.seed = random.random() if seed is None else seed
+
+    def _slot(self, index):
+        offset = random.Random(f"{self.seed}:{index}").uniform(0, self.jitter) if self.jitter else 0
+        return self.anchor + index * self.interval + offset
+
+    def next_after(self, timestamp):
+        index = int((timestamp - self.anchor) // self.interval)
+        while self._slot(index) <= timestamp:
+            index += 1
+        return self._slot(index)
+
+    def __str__(self):
+        return f"{self.interval:g}초마다 (지터 {self.jitter:g}초)"
+
+
+def parse_schedule(spec):
+    """'every 6h jitter 30m' 형식이면 IntervalSchedule, 아니면 cron 표현식"""
+    text = spec.strip()
+    match = re.fullmatch(r'every\s+(\S+)(?:\s+jitter\s+(\S+))?', text, flags=re.IGNORECASE)
+    if match:
+        jitter = parse_duration(match.group(2)) if match.group(2) else 0
+        return IntervalSchedule(parse_duration(match.group(1)), jitter)
+    return CronSchedule(text)
+
+
+def format_time(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+
+
+class PublishDaemon:
+    """
+    생성 스레드: 다음 lookahead개 슬롯의 포스트를 미리 생성해 작업 저장소에 not_before=슬롯으로 저장
+    메인 스레드: 게시 시각이 된 작업을 바로 게시 (browser 모드는 슬롯 warmup초 전에 브라우저를 띄워둠)
+    상태는 모두 작업 저장소에 있으므로 재시작해도 버퍼와 미완료 작업이 이어짐
+    """
+
+    def __init__(self, poster, store, schedule, lookahead=3, warmup=120,
+                 topics=None, max_generation_delay=600):
+        self.poster = poster
+        self.store = store
+        self.schedule = schedule
+        self.lookahead = max(1, lookahead)
+        self.warmup = warmup
+        self.max_generation_delay = max_generation_delay
+        self._topics = itertools.cycle(topics) if topics else None
+        self._stop = threading.Event()
+        # 작업이 추가되면 메인 루프를, 게시로 버퍼에 자리가 나면 생성 스레드를 깨움
+        self._job_added = threading.Event()
+        self._slot_freed = threading.Event()
+        self._pool = None
+        self.published = 0
+        self.failed = 0
+
+    def stop(self, *args):
+        if not self._stop.is_set():
+            print("\n🛑 종료 신호를 받았습니다. 진행 중인 작업을 마치고 종료합니다...")
+        self._stop.set()
+        self._job_added.set()
+        self._slot_freed.set()
+
+    def install_signal_handlers(self):
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+    # -- 생성 ------------------------------------------------------------
+
+    def _next_open_slot(self, now):
+        """아직 포스트가 준비되지 않은 다음 슬롯 (버퍼가 차 있으면 None)"""
+        buffered = self.store.scheduled(now)
+        if len(buffered) >= self.lookahead:
+            return None
+        return self.schedule.next_after(buffered[-1] if buffered else now)
+
+    def _generate_for(self, slot):
+        """슬롯용 포스트 생성, 실패하면 백오프 후 재시도하고 슬롯이 임박하면 기본 콘텐츠로 대체"""
+        generator = self.poster.generator
+        topic = next(self._topics) if self._topics else None
+        attempt = 0
+        while not self._stop.is_set():
+            result = generator.generate_posts([topic], concurrency=1)[0]
+            if result['post'] is not None:
+                return result['post'], topic
+
+            remaining = slot - time.time()
+            if remaining <= self.warmup:
+                print(f"⚠️  슬롯 {format_time(slot)}까지 생성에 실패해 기본 콘텐츠로 대체합니다: {result['error']}")
+                return generator.generate_basic_post(topic), topic
+
+            delay = min(backoff_delay(attempt, base=5.0, cap=self.max_generation_delay),
+                        remaining - self.warmup)
+            attempt += 1
+            print(f"⚠️  포스트 생성 실패, {delay:.0f}초 후 재시도: {result['error']}")
+            self._stop.wait(delay)
+        return None, topic
+
+    def _generation_loop(self):
+        while not self._stop.is_set():
+            try:
+                slot = self._next_open_slot(time.time())
+                if slot is None:
+                    # 버퍼가 가득 참: 게시가 일어나 자리가 날 때까지 대기
+                    self._slot_freed.wait(30)
+                    self._slot_freed.clear()
+                    continue
+
+                post_data, topic = self._generate_for(slot)
+                if post_data is None:
+                    break
+                job_id, _ = self.store.add(post_data, topic=topic, not_before=slot)
+                self._job_added.set()
+                print(f"📝 [작업 {job_id}] {format_time(slot)} 게시 예정: {post_data['title']}")
+            except Exception as e:
+                print(f"❌ 생성 스레드 오류: {e}")
+                self._stop.wait(60)
+
+    # -- 게시 ------------------------------------------------------------
+
+    def _open_pool(self):
+        if self.poster.mode != 'browser' or self._pool is not None:
+            return
+        session_data = self.poster.load_session()
+        if not session_data:
+            return
+        from utils.browser_pool import BrowserPool
+
+        print("🌐 게시 슬롯 전에 브라우저를 미리 띄웁니다...")
+        self._pool = BrowserPool(session_data, profile=self.poster.profile)
+        self._pool.start()
+
+    def _close_pool(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _publish_due(self):
+        while not self._stop.is_set():
+            job = self.store.claim()
+            if job is None:
+                return
+            if self.poster.publish_job(self.store, job, pool=self._pool):
+                self.published += 1
+            else:
+                self.failed += 1
+            self._slot_freed.set()
+
+    def run(self):
+        """SIGTERM/SIGINT 또는 stop() 호출 전까지 실행"""
+        print(f"⏰ 스케줄러 시작: {self.schedule}, 미리 생성 {self.lookahead}개, 작업 저장소 {self.store.path}")
+        generator_thread = threading.Thread(target=self._generation_loop, name='generator', daemon=True)
+        generator_thread.start()
+
+        announced = None
+        try:
+            while not self._stop.is_set():
+                now = time.time()
+                due = self.store.next_due()
+
+                if due is not None and due <= now:
+                    self._publish_due()
+                    print(f"📊 누적 게시: 성공 {self.published}개, 실패 {self.failed}개")
+                    continue
+
+                if due is not None and due - now <= self.warmup:
+                    # 세션 확인과 브라우저 준비를 슬롯 전에 끝내둠
+                    self.poster.check_session()
+                    self._open_pool()
+                elif due is None or due - now > self.warmup * 2:
+                    # 다음 슬롯까지 오래 남았으면 브라우저 메모리 반환
+                    self._close_pool()
+
+                if due is not None and due != announced:
+                    print(f"⏳ 다음 게시: {format_time(due)}")
+                    announced = due
+
+                wait = 30 if due is None else min(max(due - now, 0.05), 30)
+                if due is not None and due - now > self.warmup:
+                    wait = min(wait, due - now - self.warmup)
+                self._job_added.wait(wait)
+                self._job_added.clear()
+        finally:
+            self._stop.set()
+            generator_thread.join(timeout=30)
+            self._close_pool()
+            print(f"👋 스케줄러 종료 (성공 {self.published}개, 실패 {self.failed}개)")
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+여러 후보 셀렉터를 동시에 기다리는 셀렉터 해석기
+후보를 하나의 결합 locator(or_)로 한 번에 기다리고, 실제로 쓰인 셀렉터를 페이지 지문(호스트+경로)별로
+디스크에 기억해 다음 실행에서 가장 먼저 확인. 다른 후보가 맞으면 기억한 셀렉터를 그것으로 바꿈
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from urllib.parse import urlparse
+
+from utils import metrics
+
+DEFAULT_SELECTOR_CACHE = '.velog_selectors.json'
+
+# 본문 에디터 후보 (제목 textarea는 본문 후보에서 제외)
+EDITOR_SELECTORS = [
+    '.ProseMirror',
+    'div[contenteditable="true"]',
+    '.CodeMirror-code',
+    'textarea:not([placeholder*="제목"])'
+]
+
+
+def page_fingerprint(page):
+    """페이지 지문: 호스트 + 경로 (사용자별 /@username/... 은 /@*/... 로 정규화)"""
+    parsed = urlparse(page.url)
+    path = re.sub(r'^/@[^/]+', '/@*', parsed.path or '/')
+    return f"{parsed.netloc}{path}"
+
+
+class SelectorCache:
+    """{그룹: {페이지 지문: {'selector', 'hits', 'updated_at'}}} 형태의 작은 JSON 파일"""
+
+    def __init__(self, path=DEFAULT_SELECTOR_CACHE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = None
+
+    def _load(self):
+        if self._data is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  셀렉터 캐시 저장 실패: {e}")
+
+    def get(self, group, fingerprint):
+        with self._lock:
+            entry = self._load().get(group, {}).get(fingerprint)
+        return entry['selector'] if entry else None
+
+    def put(self, group, fingerprint, selector):
+        with self._lock:
+            entries = self._load().setdefault(group, {})
+            entry = entries.get(fingerprint)
+            if entry and entry['selector'] == selector:
+                # 같은 셀렉터가 다시 맞으면 파일은 쓰지 않음
+                entry['hits'] += 1
+                return
+            entries[fingerprint] = {'selector': selector, 'hits': 1, 'updated_at': time.time()}
+            self._save()
+
+    def invalidate(self, group, fingerprint):
+        with self._lock:
+            entries = self._load().get(group, {})
+            if entries.pop(fingerprint, None) is not None:
+                self._save()
+
+
+class SelectorResolver:
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else SelectorCache()
+        self.hits = 0
+        self.misses = 0
+        # 그룹별 결과 카운터 {group: {result: 자식}} (그룹마다 처음 한 번만 labels 조회)
+        self._lookups = {}
+
+    def _count(self, group, result):
+        lookups = self._lookups.get(group)
+        if lookups is None:
+            lookups = self._lookups[group] = metrics.selector_lookups(group)
+        lookups[result].inc()
+
+    def _ordered(self, page, group, candidates):
+        """기억한 셀렉터를 맨 앞에 둔 후보 목록"""
+        fingerprint = page_fingerprint(page)
+        cached = self.cache.get(group, fingerprint)
+        ordered = list(candidates)
+        if cached:
+            ordered = [cached] + [c for c in ordered if c != cached]
+        return fingerprint, cached, ordered
+
+    @staticmethod
+    def _target(selector, state):
+        """
+        실제로 찾을 셀렉터: state='visible'이면 보이는 요소만
+        (CodeMirror의 숨은 입력 textarea처럼 DOM에서 앞서는 숨은 후보가 보이는 후보를 가리지 않게)
+        """
+        return f"{selector} >> visible=true" if state == 'visible' else selector
+
+    @classmethod
+    def _combined(cls, page, selectors, state):
+        """모든 후보 중 하나라도 맞으면 되는 결합 locator"""
+        locator = page.locator(cls._target(selectors[0], state))
+        try:
+            for selector in selectors[1:]:
+                locator = locator.or_(page.locator(cls._target(selector, state)))
+        except AttributeError:
+            # Locator.or_가 없는 구버전 Playwright: CSS 목록으로 결합
+            locator = page.locator(cls._target(', '.join(selectors), state))
+        return locator.first
+
+    def _record(self, group, fingerprint, cached, selector):
+        result = 'cached' if cached and selector == cached else ('found' if selector else 'missing')
+        self._count(group, result)
+        if cached and selector == cached:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if cached:
+                # 기억한 셀렉터가 더 이상 맞지 않음
+                self.cache.invalidate(group, fingerprint)
+        if selector:
+            self.cache.put(group, fingerprint, selector)
+
+    def resolve(self, page, group, candidates, timeout=3000, state='visible'):
+        """
+        후보 중 하나가 나타날 때까지 한 번만 기다린 뒤 (셀렉터, ElementHandle) 반환
+        여러 개가 맞으면 기억한 셀렉터 → 후보 순서로 선택, 제한 시간 안에 없으면 (None, None)
+        """
+        fingerprint, cached, ordered = self._ordered(page, group, candidates)
+        try:
+            self._combined(page, ordered, state).wait_for(state=state, timeout=timeout)
+        except Exception:
+            # 어느 후보도 나타나지 않음: 페이지가 준비되지 않은 것이므로 기억한 셀렉터는 지우지 않음
+            self.misses += 1
+            self._count(group, 'missing')
+            return None, None
+
+        for selector in ordered:
+            try:
+                element = page.query_selector(self._target(selector, state))
+                if element:
+                    self._record(group, fingerprint, cached, selector)
+                    return selector, element
+            except Exception:
+                continue
+        self._record(group, fingerprint, cached, None)
+        return None, None
+
+    async def resolve_async(self, page, group, candidates, timeout=3000, state='visible'):
+        """resolve의 async API 버전"""
+        fingerprint, cached, ordered = self._ordered(page, group, candidates)
+        try:
+            await self._combined(page, ordered, state).wait_for(state=state, timeout=timeout)
+        except Exception:
+            # 어느 후보도 나타나지 않음: 페이지가 준비되지 않은 것이므로 기억한 셀렉터는 지우지 않음
+            self.misses += 1
+            self._count(group, 'missing')
+            return None, None
+
+        for selector in ordered:
+            try:
+                element = await page.query_selector(self._target(selector, state))
+                if element:
+                    self._record(group, fingerprint, cached, selector)
+                    return selector, element
+            except Exception:
+                continue
+        self._record(group, fingerprint, cached, None)
+        return None, None
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+브라우저 없이 저장된 Velog 세션 확인
+velog_session.json을 한 번만 읽고 access_token/refresh_token의 실제 만료 시각(JWT exp 또는 쿠키 expires)을 확인한 뒤,
+GraphQL auth 요청 한 번으로 유효성을 검증하고 결과를 짧게 캐시
+access_token이 만료됐어도 refresh_token이 살아 있으면 서버가 내려준 새 토큰을 세션 파일에 저장
+"""
+
+import os
+import json
+import time
+import base64
+
+ACCESS_COOKIE = 'access_token'
+REFRESH_COOKIE = 'refresh_token'
+
+# 토큰 만료 정보가 없을 때 사용하는 세션 파일 수명 (install.py 기존 기준)
+FALLBACK_MAX_AGE = 7 * 24 * 3600
+
+# 만료 직전 토큰은 만료된 것으로 취급 (요청 도중 만료 방지)
+EXPIRY_MARGIN = 60
+
+
+def decode_jwt_payload(token):
+    """JWT payload(dict) 반환, JWT가 아니면 None (서명은 검증하지 않음)"""
+    parts = token.split('.') if token else []
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + '=' * (-len(parts[1]) % 4)
+    try:
+        return json.loads(base64.urlsafe_b64decode(payload.encode('ascii')))
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def find_cookie(session_data, name):
+    for cookie in session_data.get('cookies', []):
+        if cookie.get('name') == name:
+            return cookie
+    return None
+
+
+def token_expiry(cookie):
+    """쿠키의 만료 시각(epoch 초), JWT exp를 우선 사용하고 알 수 없으면 None"""
+    if cookie is None:
+        return None
+    payload = decode_jwt_payload(cookie.get('value', ''))
+    if payload and isinstance(payload.get('exp'), (int, float)):
+        return float(payload['exp'])
+    expires = cookie.get('expires')
+    # Playwright는 세션 쿠키의 expires를 -1로 저장
+    if isinstance(expires, (int, float)) and expires > 0:
+        return float(expires)
+    return None
+
+
+class SessionStatus:
+    """
+    세션 확인 결과
+    valid: True(유효) / False(무효) / None(네트워크 문제 등으로 확인 못 함)
+    """
+
+    def __init__(self, valid, reason, username=None, access_expires=None,
+                 refresh_expires=None, refreshed=False, checked_at=None):
+        self.valid = valid
+        self.reason = reason
+        self.username = username
+        self.access_expires = access_expires
+        self.refresh_expires = refresh_expires
+        self.refreshed = refreshed
+        self.checked_at = checked_at or time.time()
+
+    @property
+    def ok(self):
+        """게시를 진행해도 되는지 (확인하지 못한 경우는 진행)"""
+        return self.valid is not False
+
+    def describe(self):
+        if self.valid:
+            text = f"✅ 세션 유효 (@{self.username})" if self.username else "✅ 세션 유효"
+        elif self.valid is None:
+            text = f"⚠️  세션 상태를 확인하지 못했습니다: {self.reason}"
+        else:
+            text = f"❌ 세션이 유효하지 않습니다: {self.reason}"
+        if self.refreshed:
+            text += " - 토큰을 갱신했습니다"
+        expires = self.refresh_expires or self.access_expires
+        if self.valid and expires:
+            text += f" (만료까지 약 {(expires - time.time()) / 3600:.1f}시간)"
+        return text
+
+    def __repr__(self):
+        return f"SessionStatus(valid={self.valid!r}, reason={self.reason!r})"
+
+
+class SessionManager:
+    def __init__(self, session_file='velog_session.json', base_url=None, ttl=60, timeout=5):
+        self.session_file = session_file
+        self.base_url = base_url
+        # 마지막 확인 결과를 재사용하는 시간(초)
+        self.ttl = ttl
+        self.timeout = timeout
+        self._data = None
+        self._mtime = None
+        self._status = None
+
+    def load(self):
+        """세션 파일 로드 (파일이 바뀌지 않았으면 이전에 읽은 내용 재사용), 없으면 None"""
+        try:
+            mtime = os.path.getmtime(self.session_file)
+        except OSError:
+            self._data = self._mtime = None
+            return None
+
+        if self._data is None or mtime != self._mtime:
+            with open(self.session_file, 'r', encoding='utf-8') as f:
+                self._data = json.load(f)
+            self._mtime = mtime
+            self._status = None
+        return self._data
+
+    def _save(self, session_data):
+        """세션 파일을 원자적으로 교체"""
+        tmp_path = f"{self.session_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(session_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.session_file)
+        self._data = session_data
+        self._mtime = os.path.getmtime(self.session_file)
+
+    def local_status(self, session_data, now=None):
+        """
+        네트워크 없이 판단할 수 있는 상태
+        확실히 무효면 SessionStatus(False), 갱신이 필요하면 'refresh', 확인이 필요하면 None
+        """
+        now = now or time.time()
+        access = find_cookie(session_data, ACCESS_COOKIE)
+        refresh = find_cookie(session_data, REFRESH_COOKIE)
+        access_expires = token_expiry(access)
+        refresh_expires = token_expiry(refresh)
+
+        if access is None and refresh is None:
+            return SessionStatus(False, '인증 쿠키가 없습니다')
+        if access_expires and access_expires - EXPIRY_MARGIN > now:
+            return None
+        if refresh is not None and (refresh_expires is None or refresh_expires - EXPIRY_MARGIN > now):
+            return 'refresh' if access_expires else None
+        if access_expires or refresh_expires:
+            return SessionStatus(False, '토큰이 만료되었습니다',
+                                 access_expires=access_expires, refresh_expires=refresh_expires)
+        # 만료 정보가 전혀 없으면 저장 시각 기준
+        if now - session_data.get('timestamp', 0) > FALLBACK_MAX_AGE:
+            return SessionStatus(False, '세션 저장 후 7일이 지났습니다')
+        return None
+
+    def check(self, force=False):
+        """
+        세션 유효성 확인 (ttl 안에서는 이전 결과 반환)
+        만료가 확실하면 네트워크 요청 없이, 그렇지 않으면 auth 요청 한 번으로 판단
+        """
+        try:
+            session_data = self.load()
+        except (OSError, ValueError) as e:
+            return SessionStatus(False, f"세션 파일을 읽을 수 없습니다: {e}")
+        if session_data is None:
+            return SessionStatus(False, '세션 파일이 없습니다')
+
+        if not force and self._status is not None and time.time() - self._status.checked_at < self.ttl:
+            return self._status
+
+        local = self.local_status(session_data)
+        if isinstance(local, SessionStatus):
+            self._status = local
+            return local
+
+        status = self._verify_remote(session_data, refresh=(local == 'refresh'))
+        self._status = status
+        return status
+
+    def _verify_remote(self, session_data, refresh=False):
+        import requests
+        from utils.graphql_publisher import GraphQLPublisher, GraphQLError, SessionExpiredError
+
+        request_data = dict(session_data)
+        if refresh:
+            # 만료된 access_token은 빼고 보내 서버가 refresh_token으로 새 토큰을 내려주게 함
+            request_data['cookies'] = [c for c in session_data.get('cookies', [])
+                                       if c.get('name') != ACCESS_COOKIE]
+
+        publisher = GraphQLPublisher(request_data, base_url=self.base_url,
+                                     timeout=self.timeout, pool_size=1)
+        try:
+            username = publisher.current_username()
+        except SessionExpiredError as e:
+            return SessionStatus(False, str(e) or '로그인 정보가 없습니다')
+        except (requests.RequestException, GraphQLError, ValueError) as e:
+            return SessionStatus(None, str(e))
+        finally:
+            refreshed = self._store_new_tokens(session_data, publisher.session.cookies)
+            publisher.close()
+
+        data = self._data or session_data
+        return SessionStatus(
+            True, 'ok', username=username,
+            access_expires=token_expiry(find_cookie(data, ACCESS_COOKIE)),
+            refresh_expires=token_expiry(find_cookie(data, REFRESH_COOKIE)),
+            refreshed=refreshed
+        )
+
+    def _store_new_tokens(self, session_data, jar):
+        """응답으로 받은 새 토큰 쿠키를 세션 파일에 반영, 바뀐 것이 있으면 True"""
+        changed = False
+        cookies = [dict(c) for c in session_data.get('cookies', [])]
+        for name in (ACCESS_COOKIE, REFRESH_COOKIE):
+            new = next((c for c in jar if c.name == name), None)
+            if new is None:
+                continue
+            current = next((c for c in cookies if c.get('name') == name), None)
+            if current is not None and current.get('value') == new.value:
+                continue
+            if current is None:
+                current = {'name': name, 'domain': new.domain, 'path': new.path or '/',
+                           'httpOnly': True, 'secure': bool(new.secure), 'sameSite': 'Lax'}
+                cookies.append(current)
+            current['value'] = new.value
+            current['expires'] = float(new.expires) if new.expires else -1
+            changed = True
+
+        if changed:
+            updated = dict(session_data, cookies=cookies, timestamp=time.time())
+            self._save(updated)
+        return changed
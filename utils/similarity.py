@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+생성/게시한 포스트의 유사 중복 탐지 인덱스 (MinHash + LSH, SQLite)
+제목과 본문을 글자 5-gram 집합으로 바꾸고, 한 번의 해시로 만드는 MinHash 서명(one permutation hashing)을
+밴드로 나눠 저장. 새 초안은 같은 밴드를 공유하는 글만 후보로 가져와 서명끼리 비교하므로
+글이 수만 개여도 확인은 인덱스 조회 몇 번이면 끝남
+"""
+
+import re
+import time
+import zlib
+import operator
+import sqlite3
+import threading
+from array import array
+
+from utils.job_store import make_dedupe_key
+
+DEFAULT_SIMILARITY_DB = '.velog_similarity.sqlite3'
+
+SHINGLE_SIZE = 5
+# 밴드 16개 × 8행: 유사도 0.7 근처부터 후보가 되고(0.8이면 95%, 0.5면 6%)
+NUM_PERM = 128
+BANDS = 16
+
+_URL_PATTERN = re.compile(r'https?://\S+')
+_NON_WORD_PATTERN = re.compile(r'[\W_]+')
+
+
+def normalize_text(text):
+    """소문자 + 주소/기호 제거 + 공백 정리 (마크다운 문법 차이는 무시)"""
+    text = _URL_PATTERN.sub(' ', text.lower())
+    return _NON_WORD_PATTERN.sub(' ', text).strip()
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """정규화한 글의 글자 size-gram 집합 (한국어는 단어보다 글자 단위가 잘 맞음)"""
+    text = normalize_text(text)
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash_signature(items, num_perm=NUM_PERM):
+    """
+    one permutation hashing: 항목마다 crc32 한 번으로 구간(bin)과 값을 정하고 구간별 최솟값을 서명으로 사용
+    빈 구간은 다음 구간 값으로 채움 (densification)
+    """
+    empty = 0xFFFFFFFF
+    bins = [empty] * num_perm
+    for item in items:
+        h = zlib.crc32(item.encode('utf-8'))
+        index = h % num_perm
+        value = h // num_perm
+        if value < bins[index]:
+            bins[index] = value
+    if empty in bins and any(v != empty for v in bins):
+        for index in range(num_perm):
+            step = 1
+            while bins[index] == empty:
+                source = bins[(index + step) % num_perm]
+                if source != empty:
+                    bins[index] = source
+                step += 1
+    return array('I', bins)
+
+
+def estimate_similarity(a, b):
+    """두 서명의 자카드 유사도 추정치"""
+    return sum(map(operator.eq, a, b)) / len(a)
+
+
+def _title_key(title):
+    return normalize_text(title)
+
+
+class SimilarityIndex:
+    def __init__(self, path=DEFAULT_SIMILARITY_DB, threshold=0.8, num_perm=NUM_PERM, bands=BANDS,
+                 max_candidates=16, band_limit=8):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands로 나누어떨어져야 합니다.")
+        self.path = path
+        # 이 값 이상이면 중복에 가까운 글로 판단
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        # 비슷한 글이 아주 많을 때 비교할 후보 수 상한 (겹치는 밴드가 많은 글부터)
+        self.max_candidates = max_candidates
+        # 밴드 하나(와 같은 제목)에서 가져올 후보 수 상한 (최근 글부터): 템플릿처럼 비슷한 글이 많아
+        # 밴드가 커져도 읽는 행 수가 bands × band_limit을 넘지 않음
+        self.band_limit = band_limit
+        per_band = " UNION ALL ".join(
+            ["SELECT * FROM (SELECT post_id FROM bands WHERE key = ? ORDER BY post_id DESC LIMIT ?)"] * bands
+        )
+        self._candidate_sql = f"""
+            SELECT id, dedupe_key, title, title_key, signature, state, url FROM posts
+            WHERE id IN (SELECT post_id FROM ({per_band})
+                         GROUP BY post_id ORDER BY COUNT(*) DESC, post_id DESC LIMIT ?)
+               UNION
+            SELECT * FROM (SELECT id, dedupe_key, title, title_key, signature, state, url FROM posts
+                           WHERE title_key = ? ORDER BY id DESC LIMIT ?)"""
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                dedupe_key TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL,
+                title_key TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                state TEXT NOT NULL,
+                url TEXT,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_title ON posts (title_key)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS bands (
+                key INTEGER NOT NULL,
+                post_id INTEGER NOT NULL,
+                PRIMARY KEY (key, post_id)
+            ) WITHOUT ROWID
+        """)
+        self._conn.commit()
+
+    def signature(self, post_data):
+        text = f"{post_data.get('title', '')}\n{post_data.get('content', '')}"
+        return minhash_signature(shingles(text), self.num_perm)
+
+    def _band_keys(self, signature):
+        raw = signature.tobytes()
+        width = self.rows * signature.itemsize
+        # 밴드 번호를 상위 비트에 넣어 밴드끼리 키가 겹치지 않게 함
+        return [(band << 32) | zlib.crc32(raw[band * width:(band + 1) * width])
+                for band in range(self.bands)]
+
+    def find_similar(self, post_data, limit=3, signature=None):
+        """
+        비슷한 글 목록 [{'id', 'title', 'url', 'state', 'similarity', 'reason'}, ...] (유사도 내림차순)
+        reason: 'title'(정규화한 제목이 같음) 또는 'content'(서명 유사도가 threshold 이상)
+        """
+        signature = signature if signature is not None else self.signature(post_data)
+        keys = self._band_keys(signature)
+        own_key = make_dedupe_key(post_data)
+        title_key = _title_key(post_data.get('title', ''))
+
+        params = []
+        for key in keys:
+            params += (key, self.band_limit)
+        with self._lock:
+            rows = self._conn.execute(self._candidate_sql,
+                                      params + [self.max_candidates, title_key, self.band_limit]).fetchall()
+
+        matches = []
+        for post_id, dedupe_key, title, other_title_key, blob, state, url in rows:
+            if dedupe_key == own_key:
+                continue
+            other = array('I')
+            other.frombytes(blob)
+            similarity = estimate_similarity(signature, other)
+            if other_title_key == title_key and title_key:
+                reason = 'title'
+            elif similarity >= self.threshold:
+                reason = 'content'
+            else:
+                continue
+            matches.append({'id': post_id, 'title': title, 'url': url, 'state': state,
+                            'similarity': similarity, 'reason': reason})
+        matches.sort(key=lambda m: m['similarity'], reverse=True)
+        return matches[:limit]
+
+    def check(self, post_data):
+        """가장 비슷한 기존 글 하나 (없으면 None)"""
+        matches = self.find_similar(post_data, limit=1)
+        return matches[0] if matches else None
+
+    def add(self, post_data, state='draft', url=None):
+        """
+        글 추가 (같은 초안이 이미 있으면 상태/주소만 갱신), 글 id 반환
+        state: 'draft'(생성됨) 또는 'published'(게시됨)
+        """
+        signature = self.signature(post_data)
+        with self._lock:
+            post_id = self._add(post_data, state, url, signature)
+            self._conn.commit()
+        return post_id
+
+    def add_many(self, posts, state='published'):
+        """
+        여러 글을 한 트랜잭션으로 추가, 글 id 목록 반환 (미러 가져오기 등 대량 기록용)
+        posts: post_data 또는 (post_data, url) 목록
+        """
+        entries = [post if isinstance(post, tuple) else (post, None) for post in posts]
+        signatures = [self.signature(post_data) for post_data, _ in entries]
+        with self._lock:
+            try:
+                ids = [self._add(post_data, state, url, signature)
+                       for (post_data, url), signature in zip(entries, signatures)]
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+        return ids
+
+    def _add(self, post_data, state, url, signature):
+        """잠금을 잡은 상태에서 글 하나 기록 (커밋은 호출한 쪽에서)"""
+        key = make_dedupe_key(post_data)
+        title_key = _title_key(post_data.get('title', ''))
+        row = self._conn.execute("SELECT id FROM posts WHERE dedupe_key = ?", (key,)).fetchone()
+        if row is None and state == 'published':
+            # 게시 직전에 본문이 정리(공백, 이미지 주소)됐어도 같은 제목의 초안이면 그 초안을 게시됨으로 표시
+            row = self._conn.execute(
+                "SELECT id FROM posts WHERE title_key = ? AND state = 'draft' ORDER BY id DESC LIMIT 1",
+                (title_key,)
+            ).fetchone()
+        if row is not None:
+            if state == 'published':
+                self._conn.execute(
+                    "UPDATE posts SET state = ?, url = COALESCE(?, url) WHERE id = ?",
+                    (state, url, row[0])
+                )
+            return row[0]
+
+        cursor = self._conn.execute(
+            """INSERT OR IGNORE INTO posts (dedupe_key, title, title_key, signature, state, url, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (key, post_data.get('title', ''), title_key, signature.tobytes(), state, url, time.time())
+        )
+        if not cursor.rowcount:
+            # 다른 프로세스가 먼저 추가함
+            return self._conn.execute("SELECT id FROM posts WHERE dedupe_key = ?", (key,)).fetchone()[0]
+        post_id = cursor.lastrowid
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO bands (key, post_id) VALUES (?, ?)",
+            [(band_key, post_id) for band_key in self._band_keys(signature)]
+        )
+        return post_id
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+기본 콘텐츠용 템플릿 엔진
+템플릿 팩(JSON)을 한 번만 파싱해 문자열 조각/슬롯 목록으로 컴파일하고,
+선택된 템플릿의 슬롯만 채워서 제목·본문·태그·시리즈를 생성
+
+템플릿 문법:
+    {tech}, {topic} ...        팩의 lists에 정의된 목록에서 무작위 선택
+    {choice:성능|보안}          템플릿 안에 적은 후보 중 무작위 선택
+    {word}                     Faker 단어 (처음 필요할 때 생성)
+    {{ / }}                    중괄호 문자 그대로
+"""
+
+import os
+import re
+import json
+import random
+import functools
+
+PACK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'template_packs')
+
+# 팩에서 템플릿 목록으로 취급하는 섹션
+TEMPLATE_SECTIONS = ('title', 'intro', 'image', 'body', 'outro')
+
+_SLOT_PATTERN = re.compile(r'\{\{|\}\}|\{([^{}]+)\}')
+
+# {word} 슬롯 표시
+WORD = object()
+
+_fake = None
+
+
+def get_fake():
+    """한글 콘텐츠 생성을 위한 Faker 인스턴스 (처음 필요할 때 생성)"""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker('ko_KR')
+    return _fake
+
+
+def compile_template(template, lists):
+    """
+    템플릿 문자열을 조각 목록으로 변환
+    슬롯이 없으면 문자열 그대로, 있으면 (str | tuple | WORD) 튜플 반환
+    """
+    parts = []
+    literal = []
+    position = 0
+    for match in _SLOT_PATTERN.finditer(template):
+        literal.append(template[position:match.start()])
+        position = match.end()
+
+        token = match.group(0)
+        if token == '{{':
+            literal.append('{')
+            continue
+        if token == '}}':
+            literal.append('}')
+            continue
+
+        slot = match.group(1)
+        if slot == 'word':
+            value = WORD
+        elif slot.startswith('choice:'):
+            value = tuple(slot[len('choice:'):].split('|'))
+        elif slot in lists:
+            value = lists[slot]
+        else:
+            raise ValueError(f"알 수 없는 템플릿 슬롯입니다: {{{slot}}} ({template[:30]}...)")
+
+        if literal:
+            parts.append(''.join(literal))
+            literal = []
+        parts.append(value)
+
+    literal.append(template[position:])
+    if any(literal):
+        parts.append(''.join(literal))
+
+    if all(isinstance(part, str) for part in parts):
+        return ''.join(parts)
+    return tuple(parts)
+
+
+class TemplatePack:
+    def __init__(self, data):
+        self.name = data.get('name', 'custom')
+        self.lists = {key: tuple(values) for key, values in data.get('lists', {}).items()}
+        for required in ('tech', 'topic', 'tags', 'series'):
+            if not self.lists.get(required):
+                raise ValueError(f"템플릿 팩에 '{required}' 목록이 없습니다.")
+
+        self.sections = {}
+        for section in TEMPLATE_SECTIONS:
+            templates = data.get(section)
+            if not templates:
+                raise ValueError(f"템플릿 팩에 '{section}' 템플릿이 없습니다.")
+            self.sections[section] = tuple(compile_template(t, self.lists) for t in templates)
+
+        low, high = data.get('body_count', [2, 3])
+        self.body_count = (int(low), int(high))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pack_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return TemplatePack(json.load(f))
+
+
+def load_template_pack(name_or_path='default'):
+    """
+    템플릿 팩 로드 (같은 파일은 한 번만 파싱)
+    파일 경로이거나 utils/template_packs/<이름>.json의 이름
+    """
+    if os.path.isfile(name_or_path):
+        path = name_or_path
+    else:
+        path = os.path.join(PACK_DIR, f"{name_or_path}.json")
+    return _load_pack_file(os.path.abspath(path))
+
+
+class TemplateEngine:
+    def __init__(self, pack=None, seed=None, rng=None):
+        self.pack = pack or load_template_pack()
+        self.seed = seed
+        self.rng = rng or random.Random(seed)
+        self._faker = None
+
+    def _word(self):
+        if self._faker is None:
+            if self.seed is None:
+                self._faker = get_fake()
+            else:
+                # 시드가 있으면 Faker도 같은 시드로 재현 가능하게
+                from faker import Faker
+                self._faker = Faker('ko_KR')
+                self._faker.seed_instance(self.seed)
+        return self._faker.word()
+
+    def fill(self, compiled, topic=None):
+        """컴파일된 템플릿 하나의 슬롯 채우기 (topic을 주면 {topic} 슬롯은 그 값으로)"""
+        if compiled.__class__ is str:
+            return compiled
+        rng = self.rng
+        topics = self.pack.lists['topic'] if topic else None
+        out = []
+        for part in compiled:
+            if part.__class__ is str:
+                out.append(part)
+            elif part is WORD:
+                out.append(self._word())
+            elif part is topics:
+                out.append(topic)
+            else:
+                out.append(part[int(rng.random() * len(part))])
+        return ''.join(out)
+
+    def render(self, section, topic=None):
+        """섹션에서 템플릿 하나를 고른 뒤 그 템플릿만 채움"""
+        templates = self.pack.sections[section]
+        return self.fill(templates[int(self.rng.random() * len(templates))], topic)
+
+    def pick(self, name):
+        """목록에서 하나 선택"""
+        return self.rng.choice(self.pack.lists[name])
+
+    def title(self):
+        return self.render('title')
+
+    def content(self, topic=None):
+        """본문 생성 (topic을 주면 첫 제목을 주제로 바꾸고 {topic} 슬롯도 주제로 채움)"""
+        intro = self.render('intro', topic)
+        if topic and intro.startswith('# '):
+            _, newline, rest = intro.partition('\n')
+            intro = f"# {topic}{newline}{rest}"
+        paragraphs = [intro, self.render('image', topic)]
+        low, high = self.pack.body_count
+        for _ in range(self.rng.randint(low, high)):
+            paragraphs.append(self.render('body', topic))
+        paragraphs.append(self.render('outro', topic))
+        return '\n\n'.join(paragraphs)
+
+    def tags(self, count=3):
+        tags = self.pack.lists['tags']
+        return self.rng.sample(tags, min(count, len(tags)))
+
+    def series(self):
+        return self.pick('series')
+
+    def post(self):
+        return {
+            'title': self.title(),
+            'content': self.content(),
+            'tags': self.tags(),
+            'series': self.series()
+        }
+
+    def batch(self, count):
+        """부하 테스트용 대량 생성"""
+        return [self.post() for _ in range(count)]
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+포스팅 파이프라인 단계별 시간 측정
+실행(run) 단위로 단계(span)별 소요 시간과 속성을 모아 JSONL 한 줄로 기록
+
+사용법:
+    VELOG_TRACE_FILE=trace.jsonl python post_writer.py
+    python -m utils.tracing trace.jsonl     # 단계별 p50/p95 요약
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import threading
+import functools
+from contextvars import ContextVar
+
+# 현재 진행 중인 실행 (스레드/asyncio 태스크마다 독립)
+_current_run = ContextVar('velog_trace_run', default=None)
+
+
+class _NullSpan:
+    """비활성화 상태에서 재사용되는 아무 일도 하지 않는 span/run"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NULL = _NullSpan()
+
+
+class _TimedSpan(_NullSpan):
+    """추적 파일 없이 소요 시간만 observer에 넘기는 span (지표 수집용)"""
+
+    __slots__ = ('observer', 'name', '_started')
+
+    def __init__(self, observer, name):
+        self.observer = observer
+        self.name = name
+        self._started = 0.0
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.observer(self.name, time.perf_counter() - self._started)
+        return False
+
+
+class Span:
+    def __init__(self, run, name, attrs, observer=None):
+        self.run = run
+        self.name = name
+        self.attrs = attrs
+        self.observer = observer
+        self._started = 0.0
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self._started
+        if self.observer is not None:
+            self.observer(self.name, duration)
+        stage = {
+            'name': self.name,
+            'duration': round(duration, 6),
+        }
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        if self.attrs:
+            stage['attrs'] = self.attrs
+        self.run.stages.append(stage)
+        return False
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+
+class Run:
+    def __init__(self, tracer, kind, attrs):
+        self.tracer = tracer
+        self.kind = kind
+        self.attrs = attrs
+        self.stages = []
+        self._token = None
+        self._started = 0.0
+        self._started_at = 0.0
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        self._started_at = time.time()
+        self._token = _current_run.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_run.reset(self._token)
+        if exc_type is not None:
+            self.attrs.setdefault('outcome', 'error')
+            self.attrs.setdefault('error', f"{exc_type.__name__}: {exc}")
+        self.attrs.setdefault('outcome', 'ok')
+        duration = time.perf_counter() - self._started
+        if self.tracer.observer is not None:
+            self.tracer.observer(self.kind, duration)
+        self.tracer.write({
+            'run_id': os.urandom(6).hex(),
+            'kind': self.kind,
+            'started_at': round(self._started_at, 3),
+            'duration': round(duration, 6),
+            'attrs': self.attrs,
+            'stages': self.stages,
+        })
+        return False
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = bool(path)
+        # 단계가 끝날 때마다 (이름, 초)로 호출되는 함수 (지표 수집, 추적 파일과 무관하게 동작)
+        self.observer = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """VELOG_TRACE_FILE 환경변수가 있으면 해당 파일에 기록"""
+        return cls(os.getenv('VELOG_TRACE_FILE'))
+
+    def configure(self, path):
+        """기록 파일 변경 (None이면 비활성화)"""
+        self.path = path
+        self.enabled = bool(path)
+
+    def run(self, kind, **attrs):
+        """
+        실행 단위 기록 시작
+        이미 진행 중인 실행이 있으면 그 안의 단계(span)로 기록
+        """
+        if not self.enabled:
+            return _NULL if self.observer is None else _TimedSpan(self.observer, kind)
+        if _current_run.get() is not None:
+            return self.span(kind, **attrs)
+        return Run(self, kind, attrs)
+
+    def span(self, name, **attrs):
+        """현재 실행 안에서 단계 하나의 소요 시간 측정"""
+        run = _current_run.get() if self.enabled else None
+        if run is not None:
+            return Span(run, name, attrs, self.observer)
+        if self.observer is not None:
+            return _TimedSpan(self.observer, name)
+        return _NULL
+
+    def annotate(self, **attrs):
+        """현재 실행에 속성 추가 (셀렉터, 재시도 횟수, 결과 등)"""
+        if not self.enabled:
+            return
+        run = _current_run.get()
+        if run is not None:
+            run.set(**attrs)
+
+    def traced(self, name):
+        """함수 전체를 하나의 단계로 측정하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled and self.observer is None:
+                    return func(*args, **kwargs)
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+
+# 모듈 전역 트레이서 (post_writer / content_generator 공용)
+tracer = Tracer.from_env()
+
+
+def percentile(values, pct):
+    """정렬된 값 목록의 백분위수 (최근접 순위 방식)"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, math.ceil(pct / 100 * len(values)) - 1))
+    return values[index]
+
+
+def summarize(path):
+    """
+    JSONL 기록을 읽어 실행 종류/단계별 소요 시간 분포 계산
+    같은 실행 안에서 반복된 단계(예: 태그별 대기)는 합산
+    """
+    stats = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            kind = record.get('kind', '?')
+            per_run = {'(total)': record.get('duration', 0.0)}
+            for stage in record.get('stages', []):
+                per_run[stage['name']] = per_run.get(stage['name'], 0.0) + stage['duration']
+            for name, duration in per_run.items():
+                stats.setdefault((kind, name), []).append(duration)
+
+    summary = []
+    for (kind, name), values in sorted(stats.items()):
+        values.sort()
+        summary.append({
+            'kind': kind,
+            'stage': name,
+            'count': len(values),
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'max': values[-1],
+        })
+    return summary
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("사용법: python -m utils.tracing <trace.jsonl>")
+        return 1
+
+    summary = summarize(argv[0])
+    if not summary:
+        print("기록이 없습니다.")
+        return 0
+
+    print(f"{'kind':<10} {'stage':<22} {'n':>5} {'p50(ms)':>10} {'p95(ms)':>10} {'max(ms)':>10}")
+    print("-" * 71)
+    for row in summary:
+        print(f"{row['kind']:<10} {row['stage']:<22} {row['count']:>5} "
+              f"{row['p50'] * 1000:>10.1f} {row['p95'] * 1000:>10.1f} {row['max'] * 1000:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+포스팅 단계별 대기 시간 예산
+고정 sleep 대신 준비 조건을 기다리고, 조건마다 제한 시간과 실제 사용 시간을 기록
+"""
+
+import time
+from contextlib import contextmanager
+
+# 대기 조건별 기본 제한 시간 (ms)
+DEFAULT_BUDGETS = {
+    'editor_mounted': 10000,   # /write 진입 후 제목/에디터가 나타날 때까지
+    'editor_probe': 3000,      # 에디터 셀렉터 하나를 기다리는 시간
+    'tag_chip': 2000,          # Enter 후 태그가 등록될 때까지
+    'publish_modal': 5000,     # 1차 출간하기 클릭 후 출간 모달이 열릴 때까지
+    'overlay_gone': 10000,     # 출간 모달 오버레이가 사라질 때까지
+    'published_url': 10000,    # 최종 출간 후 /@user/... 로 이동할 때까지
+    'error_message': 500,      # 게시 실패 시 에러 메시지 확인
+    'stream_body': 120000,     # 스트리밍 생성 중인 본문이 완성될 때까지
+}
+
+
+class WaitBudget:
+    def __init__(self, budgets=None):
+        self.budgets = dict(DEFAULT_BUDGETS)
+        if budgets:
+            self.budgets.update(budgets)
+        self.used = {}
+        # 마지막으로 시작한 대기 조건 (실패 기록에서 어느 단계에서 멈췄는지 표시)
+        self.last = None
+
+    def timeout(self, name):
+        """조건별 제한 시간 (ms)"""
+        return self.budgets[name]
+
+    @contextmanager
+    def measure(self, name):
+        """
+        대기 구간을 측정하고 제한 시간을 넘겨줌
+        with budget.measure('tag_chip') as timeout:
+            page.wait_for_function(..., timeout=timeout)
+        """
+        self.last = name
+        started = time.perf_counter()
+        try:
+            yield self.budgets[name]
+        finally:
+            elapsed = time.perf_counter() - started
+            self.used[name] = self.used.get(name, 0.0) + elapsed
+
+    def total(self):
+        """실제로 기다린 시간 합계 (초)"""
+        return sum(self.used.values())
+
+    def report(self):
+        """조건별 사용 시간 / 제한 시간 요약 문자열"""
+        parts = [
+            f"{name} {used:.2f}s/{self.budgets[name] / 1000:.1f}s"
+            for name, used in self.used.items()
+        ]
+        return f"⏱️  대기 시간 {self.total():.2f}s ({', '.join(parts)})"